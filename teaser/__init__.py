@@ -5,7 +5,6 @@ teaser
 Tool for Energy Analysis and Simulation for Efficient Retrofit
 '''
 import sys
-import os
 
 v = sys.version_info
 if v >= (3, 3):
@@ -17,10 +16,6 @@ elif v >= (2, 7) and v < (3,):
 else:
     raise Exception('This software runs on python versions 2.7 or >=3.3 only!')
 
-new_path = os.path.join(os.path.expanduser('~'), ("TEASEROutput"))
-if not os.path.exists(new_path):
-    os.makedirs(new_path)
-
 if sys.platform.startswith('win'):
     def read_file(path, mode='r'):
         fp = open(path, mode)
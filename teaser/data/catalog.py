@@ -0,0 +1,400 @@
+# Created October 2026
+# TEASER Development Team
+
+"""catalog.py
+
+This module holds plain Python records of the XML catalogs
+(TypeBuildingElements, MaterialTemplates and UseConditions) and stores them
+in on-disk snapshots. Records offer the same attribute names as the PyXB
+bindings, so the input modules read both alike, but they are much cheaper to
+load than parsing and validating the XML again. Records are either converted
+from a PyXB binding or, for catalogs of version 0.6, read directly with
+ElementTree along the XSD schema of the catalog.
+"""
+
+import decimal
+import hashlib
+import os
+import pickle
+import xml.etree.ElementTree as et
+
+import teaser.logic.utilities as utils
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+SNAPSHOT_FORMAT = 1
+"""Version of the snapshot layout, snapshots of other versions are ignored"""
+
+SCHEMAS = {
+    "http://teaser/0.6/elements": "TypeBuildingElements.xsd",
+    "http://teaser/0.6/material": "MaterialTemplates.xsd",
+    "http://teaser/0.6/boundary": "BoundaryConditions.xsd"}
+"""XSD schemas of the catalogs read without PyXB, by target namespace"""
+
+_XS = "{http://www.w3.org/2001/XMLSchema}"
+_schemas = {}
+
+
+class Record(object):
+    """Read-only representation of one element of an XML catalog
+
+    All child elements and attributes of the XML element are stored as
+    attributes with the Python identifier PyXB uses for them. Plural
+    elements are lists of Records, elements with simple content store
+    their content as attribute value.
+
+    Records are shared by all DataClass instances loading the same file and
+    cannot be modified.
+    """
+
+    def __init__(self, **kwargs):
+        """Constructor of Record
+        """
+        self.__dict__.update(kwargs)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "Catalog records are read-only, use DataClass.own_binding() "
+            "to modify the catalog")
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "Catalog records are read-only, use DataClass.own_binding() "
+            "to modify the catalog")
+
+    def __repr__(self):
+        return "Record(" + ", ".join(sorted(self.__dict__)) + ")"
+
+
+def record_from_binding(bind):
+    """Converts a PyXB binding into a tree of Records
+
+    Parameters
+    ----------
+    bind : instance of PyXB binding
+        Binding (or part of a binding) of an XML catalog
+
+    Returns
+    ----------
+    record : Record
+        Record holding plain Python values only
+    """
+
+    values = {}
+    for element in type(bind)._ElementMap.values():
+        value = element.value(bind)
+        if element.isPlural():
+            values[element.id()] = [_plain_value(item) for item in value]
+        else:
+            values[element.id()] = _plain_value(value)
+    for attribute in type(bind)._AttributeMap.values():
+        values[attribute.id()] = _plain_value(attribute.value(bind))
+    if bind._ContentTypeTag == bind._CT_SIMPLE:
+        values["value"] = _plain_value(bind.value())
+    return Record(**values)
+
+
+def _plain_value(value):
+    """Converts PyXB values into plain Python values
+    """
+
+    import pyxb.binding.datatypes
+    from pyxb.utils import six
+
+    if value is None:
+        return None
+    elif isinstance(value, pyxb.binding.basis.complexTypeDefinition):
+        return record_from_binding(value)
+    elif isinstance(value, pyxb.binding.datatypes.boolean):
+        return bool(value)
+    elif isinstance(value, list):
+        return [_plain_value(item) for item in value]
+    elif isinstance(value, float):
+        return float(value)
+    elif isinstance(value, six.integer_types):
+        return int(value)
+    elif isinstance(value, decimal.Decimal):
+        return decimal.Decimal(value)
+    elif isinstance(value, six.string_types):
+        return six.text_type(value)
+    return value
+
+
+def record_from_xml(path):
+    """Reads an XML catalog of version 0.6 into a tree of Records
+
+    The file is parsed with ElementTree and converted along the XSD schema
+    of its namespace (see SCHEMAS), without creating and validating PyXB
+    bindings. The Records equal the ones record_from_binding() creates from
+    the PyXB binding of the same file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the XML file
+
+    Returns
+    ----------
+    record : Record or None
+        Records of the catalog, None if the file is no catalog of version
+        0.6 or does not match its schema. These files need to be parsed
+        with PyXB.
+    """
+
+    try:
+        root = et.parse(path).getroot()
+    except (et.ParseError, IOError, OSError):
+        return None
+
+    if not root.tag.startswith("{"):
+        return None
+    namespace, name = root.tag[1:].split("}")
+    if namespace not in SCHEMAS or root.get("version") != "0.6":
+        return None
+
+    roots = _load_schema(namespace)
+    if name not in roots:
+        return None
+    try:
+        return _record_from_element(
+            element=root,
+            model=roots[name],
+            prefix="{" + namespace + "}")
+    except ValueError:
+        return None
+
+
+class _TypeModel(object):
+    """Child elements and attributes of one complex type of a XSD schema
+    """
+
+    def __init__(self):
+        """Constructor of _TypeModel
+        """
+        self.elements = {}
+        self.attributes = {}
+        self.simple = None
+
+
+def _load_schema(namespace):
+    """Returns the type models of the root elements of a XSD schema
+
+    Only the XSD constructs used by the catalog schemas are supported:
+    named and anonymous complex types with sequence, choice, attribute and
+    simpleContent, and list simple types.
+
+    Parameters
+    ----------
+    namespace : str
+        Target namespace of the schema, key of SCHEMAS
+    """
+
+    if namespace in _schemas:
+        return _schemas[namespace]
+
+    schema = et.parse(utils.get_full_path(
+        os.path.join("data", "bindings", "schemas", SCHEMAS[namespace]))).\
+        getroot()
+
+    simple_types = {}
+    for simple_type in schema.findall(_XS + "simpleType"):
+        simple_types[simple_type.get("name")] = \
+            ("list", simple_type.find(_XS + "list").get("itemType"))
+
+    complex_types = {}
+    for complex_type in schema.findall(_XS + "complexType"):
+        complex_types[complex_type.get("name")] = _TypeModel()
+
+    def resolve(type_name):
+        if type_name in complex_types:
+            return complex_types[type_name]
+        return simple_types.get(type_name, type_name)
+
+    def fill(model, node, plural):
+        for child in node:
+            if child.tag in (_XS + "sequence", _XS + "choice"):
+                fill(model, child,
+                     plural or child.get("maxOccurs", "1") != "1")
+            elif child.tag == _XS + "element":
+                inline = child.find(_XS + "complexType")
+                if inline is not None:
+                    child_type = _TypeModel()
+                    fill(child_type, inline, False)
+                else:
+                    child_type = resolve(child.get("type"))
+                model.elements[child.get("name")] = (
+                    child_type,
+                    plural or child.get("maxOccurs", "1") != "1")
+            elif child.tag == _XS + "attribute":
+                model.attributes[child.get("name")] = \
+                    resolve(child.get("type"))
+            elif child.tag == _XS + "simpleContent":
+                extension = child.find(_XS + "extension")
+                model.simple = resolve(extension.get("base"))
+                fill(model, extension, plural)
+
+    for complex_type in schema.findall(_XS + "complexType"):
+        fill(complex_types[complex_type.get("name")], complex_type, False)
+
+    roots = {}
+    for element in schema.findall(_XS + "element"):
+        roots[element.get("name")] = resolve(element.get("type"))
+    _schemas[namespace] = roots
+    return roots
+
+
+def _record_from_element(element, model, prefix):
+    """Converts an ElementTree element into a Record along its type model
+    """
+
+    values = {}
+    for name, (child_type, plural) in model.elements.items():
+        values[name] = [] if plural else None
+    for name in model.attributes:
+        values[name] = None
+
+    for name, text in element.attrib.items():
+        if name not in model.attributes:
+            raise ValueError("Unknown attribute " + name)
+        values[name] = _simple_value(text, model.attributes[name])
+
+    for child in element:
+        if not child.tag.startswith(prefix):
+            raise ValueError("Unknown element " + child.tag)
+        name = child.tag[len(prefix):]
+        if name not in model.elements:
+            raise ValueError("Unknown element " + child.tag)
+        child_type, plural = model.elements[name]
+        if isinstance(child_type, _TypeModel):
+            value = _record_from_element(child, child_type, prefix)
+        else:
+            value = _simple_value(child.text, child_type)
+        if plural:
+            values[name].append(value)
+        else:
+            values[name] = value
+
+    if model.simple is not None:
+        values["value"] = _simple_value(element.text, model.simple)
+    return Record(**values)
+
+
+def _simple_value(text, type_name):
+    """Converts the text of an element or attribute into a Python value
+    """
+
+    if text is None:
+        text = ""
+    if isinstance(type_name, tuple):
+        return [_simple_value(item, type_name[1]) for item in text.split()]
+    elif type_name in ("xs:float", "xs:double"):
+        return float(text)
+    elif type_name in ("xs:int", "xs:integer", "xs:long"):
+        return int(text)
+    elif type_name == "xs:decimal":
+        return decimal.Decimal(text.strip())
+    elif type_name == "xs:boolean":
+        return text.strip() in ("true", "1")
+    elif type_name == "xs:string":
+        return text_type(text)
+    raise ValueError("Unsupported type " + str(type_name))
+
+
+def file_digest(path):
+    """Returns the SHA-1 hex digest of a file
+
+    Parameters
+    ----------
+    path : str
+        Path to the file
+    """
+
+    with open(path, "rb") as source:
+        return hashlib.sha1(source.read()).hexdigest()
+
+
+def snapshot_path(snapshot_dir, path):
+    """Returns the path of the snapshot of an XML catalog
+
+    There is one snapshot per catalog file, named after the absolute path
+    of the file.
+
+    Parameters
+    ----------
+    snapshot_dir : str
+        Directory holding the snapshots
+    path : str
+        Path to the XML file
+    """
+
+    name = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return os.path.join(snapshot_dir, name + ".pickle")
+
+
+def load_snapshot(path, digest):
+    """Loads the records of a snapshot
+
+    Parameters
+    ----------
+    path : str
+        Path to the snapshot
+    digest : str
+        SHA-1 hex digest of the XML file the snapshot needs to be created
+        from
+
+    Returns
+    ----------
+    record : Record or None
+        Records of the catalog, None if there is no valid snapshot for the
+        given digest
+    """
+
+    try:
+        with open(path, "rb") as snapshot:
+            content = pickle.load(snapshot)
+    except Exception:
+        return None
+
+    if not isinstance(content, dict) or \
+            content.get("format") != SNAPSHOT_FORMAT or \
+            content.get("digest") != digest:
+        return None
+    return content.get("records")
+
+
+def save_snapshot(path, digest, record):
+    """Saves the records of a catalog into a snapshot
+
+    The snapshot is written to a temporary file first and moved afterwards,
+    so that concurrent processes never read a partly written snapshot.
+    Snapshots that cannot be written (e.g. read-only directories) are
+    skipped silently.
+
+    Parameters
+    ----------
+    path : str
+        Path to the snapshot
+    digest : str
+        SHA-1 hex digest of the XML file the records are created from
+    record : Record
+        Records of the catalog
+    """
+
+    content = {"format": SNAPSHOT_FORMAT, "digest": digest, "records": record}
+    temp_path = path + "." + str(os.getpid()) + ".tmp"
+    try:
+        if not os.path.exists(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(temp_path, "wb") as snapshot:
+            pickle.dump(content, snapshot, pickle.HIGHEST_PROTOCOL)
+        if os.path.exists(path) and os.name == "nt":
+            os.remove(path)
+        os.rename(temp_path, path)
+    except (IOError, OSError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
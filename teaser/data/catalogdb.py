@@ -0,0 +1,590 @@
+# Created October 2026
+# TEASER Development Team
+
+"""catalogdb.py
+
+This module holds an SQLite store for the catalogs of TEASER
+(TypeBuildingElements, MaterialTemplates and UseConditions). Each entry of a
+catalog is one row of an indexed table holding the keys used for lookups
+(element type, construction type and building age group bounds, material_id
+and name, usage) and the pickled Record (see teaser.data.catalog) of the
+entry. A DataClass using a CatalogDatabase queries single entries instead of
+loading the whole catalog, and the save functions of teaser.data.output
+insert single rows instead of rewriting the XML file. Several processes can
+share one database file.
+"""
+
+import contextlib
+import pickle
+import sqlite3
+
+import teaser.data.catalog as catalog
+import teaser.data.input.boundcond_input as boundcond_input
+
+CATALOGS = ("elements", "materials", "conditions")
+"""Names of the catalogs stored in a CatalogDatabase"""
+
+ELEMENT_TYPES = (
+    "OuterWall",
+    "Door",
+    "InnerWall",
+    "Floor",
+    "Ceiling",
+    "GroundFloor",
+    "Rooftop",
+    "Window")
+"""Names of the element types stored in a CatalogDatabase"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalogs (
+    catalog TEXT NOT NULL,
+    statistic TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (catalog, statistic));
+CREATE TABLE IF NOT EXISTS type_elements (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    statistic TEXT NOT NULL,
+    element_type TEXT NOT NULL,
+    construction_type TEXT NOT NULL,
+    age_min INTEGER NOT NULL,
+    age_max INTEGER NOT NULL,
+    record BLOB NOT NULL);
+CREATE INDEX IF NOT EXISTS type_elements_lookup ON type_elements (
+    statistic, element_type, construction_type, age_min, age_max);
+CREATE TABLE IF NOT EXISTS materials (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    material_id TEXT,
+    name TEXT,
+    record BLOB NOT NULL);
+CREATE INDEX IF NOT EXISTS materials_id ON materials (material_id);
+CREATE INDEX IF NOT EXISTS materials_name ON materials (name);
+CREATE TABLE IF NOT EXISTS use_conditions (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    usage TEXT,
+    record BLOB NOT NULL);
+CREATE INDEX IF NOT EXISTS use_conditions_usage ON use_conditions (usage);
+"""
+
+
+class CatalogDatabase(object):
+    """SQLite store of TEASER catalogs
+
+    The database holds any number of type element catalogs (one per
+    statistic, e.g. 'iwu' and 'tabula_de'), one material catalog and one
+    use conditions catalog. Entries keep the order they were added in, so
+    lookups return the same entries as the lookup tables of the XML
+    catalogs (see dataclass.TypeElementIndex).
+
+    Parameters
+    ----------
+
+    path : str
+        Path to the SQLite file, it is created if it does not exist
+    timeout : float [s]
+        Time to wait for locks held by other processes. Default is 30.0
+
+    Attributes
+    ----------
+
+    path : str
+        Path to the SQLite file
+    """
+
+    def __init__(self, path, timeout=30.0):
+        """Constructor of CatalogDatabase
+        """
+
+        self.path = path
+        self._in_batch = False
+        self._connection = sqlite3.connect(path, timeout=timeout)
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.DatabaseError:
+            pass
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Closes the connection to the database
+        """
+        self._connection.close()
+
+    def begin(self):
+        """Starts a transaction holding all following changes
+
+        Until commit() or rollback() is called, changes are neither
+        committed one by one nor visible to other processes.
+        """
+        self._in_batch = True
+
+    def commit(self):
+        """Commits all changes since begin()
+        """
+        self._in_batch = False
+        self._connection.commit()
+
+    def rollback(self):
+        """Discards all changes since begin()
+        """
+        self._in_batch = False
+        self._connection.rollback()
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Commits the changes of the block unless begin() was called
+        """
+        if self._in_batch:
+            yield
+        else:
+            with self._connection:
+                yield
+
+    def import_catalog(self, catalog_name, bind, statistic=None):
+        """Replaces a catalog of the database by the entries of a binding
+
+        Parameters
+        ----------
+        catalog_name : str
+            One of CATALOGS
+        bind : instance of PyXB binding or Record
+            Catalog to import, e.g. DataClass.element_bind
+        statistic : str
+            Statistic of a type element catalog, e.g. 'iwu'. Default is None
+        """
+
+        if catalog_name not in CATALOGS:
+            raise ValueError("Unknown catalog " + str(catalog_name))
+        if not isinstance(bind, catalog.Record):
+            bind = catalog.record_from_binding(bind)
+
+        with self._transaction():
+            if catalog_name == "elements":
+                self._connection.execute(
+                    "DELETE FROM type_elements WHERE statistic = ?",
+                    (statistic or "",))
+                for element_type in ELEMENT_TYPES:
+                    for entry in getattr(bind, element_type, []):
+                        self._insert_type_element(
+                            statistic, element_type, entry)
+            elif catalog_name == "materials":
+                self._connection.execute("DELETE FROM materials")
+                for entry in bind.Material:
+                    self._insert_material(entry)
+            else:
+                self._connection.execute("DELETE FROM use_conditions")
+                for entry in bind.BoundaryConditions:
+                    self._insert_use_conditions(entry)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO catalogs VALUES (?, ?, ?)",
+                (catalog_name, statistic or "", str(bind.version)))
+
+    def import_data_class(self, data_class):
+        """Imports all catalogs of a DataClass
+
+        Imports element_bind (as catalog of data_class.used_statistic),
+        material_bind and conditions_bind.
+
+        Parameters
+        ----------
+        data_class : DataClass()
+            DataClass holding the bindings to import
+        """
+
+        if data_class.element_bind is not None:
+            self.import_catalog(
+                "elements", data_class.element_bind,
+                data_class.used_statistic)
+        if data_class.material_bind is not None:
+            self.import_catalog("materials", data_class.material_bind)
+        if data_class.conditions_bind is not None:
+            self.import_catalog("conditions", data_class.conditions_bind)
+
+    def catalog(self, catalog_name, statistic=None):
+        """Returns the header of a catalog
+
+        Parameters
+        ----------
+        catalog_name : str
+            One of CATALOGS
+        statistic : str
+            Statistic of a type element catalog. Default is None
+
+        Returns
+        ----------
+        header : Record
+            Record holding the version of the catalog, as the bindings do.
+            Catalogs not imported yet have the version the save functions
+            write ('0.6').
+        """
+
+        row = self._connection.execute(
+            "SELECT version FROM catalogs WHERE catalog = ? AND "
+            "statistic = ?", (catalog_name, statistic or "")).fetchone()
+        return catalog.Record(version=row[0] if row else "0.6")
+
+    def find_type_elements(self, statistic, element_type, construction,
+                           year):
+        """Returns all type elements matching the given keys
+
+        Parameters
+        ----------
+        statistic : str
+            Statistic of the type element catalog, e.g. 'iwu'
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        construction : str
+            Construction type, code list ('heavy', 'light')
+        year : int
+            Year of construction
+
+        Returns
+        ----------
+        entries : list
+            Records of all matching type elements in the order they were
+            added
+        """
+
+        rows = self._connection.execute(
+            "SELECT record FROM type_elements WHERE statistic = ? AND "
+            "element_type = ? AND construction_type = ? AND age_min <= ? "
+            "AND age_max >= ? ORDER BY position",
+            (statistic or "", element_type, construction, year, year))
+        return [_load_record(row[0]) for row in rows]
+
+    def has_type_element(self, statistic, element_type, construction,
+                         building_age_group):
+        """Returns True if a type element with the given keys exists
+
+        Parameters
+        ----------
+        statistic : str
+            Statistic of the type element catalog, e.g. 'iwu'
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        construction : str
+            Construction type, code list ('heavy', 'light')
+        building_age_group : list
+            First and last year of the building age group
+        """
+
+        return self._connection.execute(
+            "SELECT 1 FROM type_elements WHERE statistic = ? AND "
+            "element_type = ? AND construction_type = ? AND age_min = ? "
+            "AND age_max = ? LIMIT 1",
+            (statistic or "", element_type, construction,
+             building_age_group[0],
+             building_age_group[1])).fetchone() is not None
+
+    def add_type_element(self, statistic, element_type, entry):
+        """Adds a type element
+
+        Parameters
+        ----------
+        statistic : str
+            Statistic of the type element catalog, e.g. 'iwu'
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        entry : instance of PyXB type element or Record
+            Type element to add
+        """
+
+        if not isinstance(entry, catalog.Record):
+            entry = catalog.record_from_binding(entry)
+        with self._transaction():
+            self._insert_type_element(statistic, element_type, entry)
+
+    def delete_type_element(self, statistic, element_type, construction,
+                            building_age_group):
+        """Deletes the first type element with the given keys
+
+        Parameters
+        ----------
+        statistic : str
+            Statistic of the type element catalog, e.g. 'iwu'
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        construction : str
+            Construction type, code list ('heavy', 'light')
+        building_age_group : list
+            First and last year of the building age group
+        """
+
+        with self._transaction():
+            self._connection.execute(
+                "DELETE FROM type_elements WHERE position = (SELECT "
+                "MIN(position) FROM type_elements WHERE statistic = ? AND "
+                "element_type = ? AND construction_type = ? AND age_min = ? "
+                "AND age_max = ?)",
+                (statistic or "", element_type, construction,
+                 building_age_group[0], building_age_group[1]))
+
+    def find_material_id(self, material_id):
+        """Returns the material with given material_id
+
+        Parameters
+        ----------
+        material_id : str
+            UUID of the material
+
+        Returns
+        ----------
+        entry : Record or None
+            Last material added with this id, None if the id is unknown
+        """
+
+        row = self._connection.execute(
+            "SELECT record FROM materials WHERE material_id = ? ORDER BY "
+            "position DESC LIMIT 1", (material_id,)).fetchone()
+        return _load_record(row[0]) if row else None
+
+    def find_material_name(self, name):
+        """Returns the material with given name
+
+        Parameters
+        ----------
+        name : str
+            Name of the material
+
+        Returns
+        ----------
+        entry : Record or None
+            Last material added with this name, None if the name is unknown
+        """
+
+        row = self._connection.execute(
+            "SELECT record FROM materials WHERE name = ? ORDER BY "
+            "position DESC LIMIT 1", (name,)).fetchone()
+        return _load_record(row[0]) if row else None
+
+    def find_materials_by_name(self, name):
+        """Returns all materials with given name
+
+        Parameters
+        ----------
+        name : str
+            Name of the material
+
+        Returns
+        ----------
+        entries : list
+            Records of all materials with this name
+        """
+
+        rows = self._connection.execute(
+            "SELECT record FROM materials WHERE name = ? ORDER BY position",
+            (name,))
+        return [_load_record(row[0]) for row in rows]
+
+    def add_material(self, entry):
+        """Adds a material
+
+        Parameters
+        ----------
+        entry : instance of PyXB material or Record
+            Material to add
+        """
+
+        if not isinstance(entry, catalog.Record):
+            entry = catalog.record_from_binding(entry)
+        with self._transaction():
+            self._insert_material(entry)
+
+    def update_material(self, material_id, **values):
+        """Changes values of all materials with given material_id
+
+        Parameters
+        ----------
+        material_id : str
+            UUID of the material
+        values : dict
+            New values by attribute name, e.g. density=1200.0
+        """
+
+        with self._transaction():
+            rows = self._connection.execute(
+                "SELECT position, record FROM materials WHERE "
+                "material_id = ?", (material_id,)).fetchall()
+            for position, record in rows:
+                content = dict(vars(_load_record(record)))
+                content.update(values)
+                entry = catalog.Record(**content)
+                self._connection.execute(
+                    "UPDATE materials SET material_id = ?, name = ?, "
+                    "record = ? WHERE position = ?",
+                    (entry.material_id, entry.name, _dump_record(entry),
+                     position))
+
+    def find_use_conditions(self, usage):
+        """Returns the use conditions with given usage
+
+        Parameters
+        ----------
+        usage : str
+            Usage of the zone, e.g. 'Living'
+
+        Returns
+        ----------
+        entry : Record or None
+            Last use conditions added with this usage, None if the usage is
+            unknown
+        """
+
+        row = self._connection.execute(
+            "SELECT record FROM use_conditions WHERE usage = ? ORDER BY "
+            "position DESC LIMIT 1", (usage,)).fetchone()
+        return _load_record(row[0]) if row else None
+
+    def add_use_conditions(self, entry):
+        """Adds use conditions
+
+        Parameters
+        ----------
+        entry : instance of PyXB use conditions or Record
+            Use conditions to add
+        """
+
+        if not isinstance(entry, catalog.Record):
+            entry = catalog.record_from_binding(entry)
+        with self._transaction():
+            self._insert_use_conditions(entry)
+
+    def _insert_type_element(self, statistic, element_type, entry):
+        """Inserts a type element Record without committing
+        """
+        self._connection.execute(
+            "INSERT INTO type_elements (statistic, element_type, "
+            "construction_type, age_min, age_max, record) VALUES "
+            "(?, ?, ?, ?, ?, ?)",
+            (statistic or "", element_type, entry.construction_type,
+             entry.building_age_group[0], entry.building_age_group[1],
+             _dump_record(entry)))
+
+    def _insert_material(self, entry):
+        """Inserts a material Record without committing
+        """
+        self._connection.execute(
+            "INSERT INTO materials (material_id, name, record) VALUES "
+            "(?, ?, ?)",
+            (entry.material_id, entry.name, _dump_record(entry)))
+
+    def _insert_use_conditions(self, entry):
+        """Inserts a use conditions Record without committing
+        """
+        self._connection.execute(
+            "INSERT INTO use_conditions (usage, record) VALUES (?, ?)",
+            (entry.usage, _dump_record(entry)))
+
+
+class TypeElementQuery(object):
+    """Lookup of type elements in a CatalogDatabase
+
+    Offers the interface of dataclass.TypeElementIndex for the type element
+    catalog of one statistic.
+
+    Parameters
+    ----------
+
+    catalog_db : CatalogDatabase
+        Database holding the catalog
+    statistic : str
+        Statistic of the type element catalog, e.g. 'iwu'
+    """
+
+    def __init__(self, catalog_db, statistic):
+        """Constructor of TypeElementQuery
+        """
+        self.catalog_db = catalog_db
+        self.statistic = statistic
+
+    def find(self, element_type, construction, year):
+        """Returns all type elements matching the given keys
+
+        See CatalogDatabase.find_type_elements()
+        """
+        return self.catalog_db.find_type_elements(
+            statistic=self.statistic,
+            element_type=element_type,
+            construction=construction,
+            year=year)
+
+
+class MaterialQuery(object):
+    """Lookup of materials in a CatalogDatabase
+
+    Offers the interface of dataclass.MaterialIndex.
+
+    Parameters
+    ----------
+
+    catalog_db : CatalogDatabase
+        Database holding the catalog
+    """
+
+    def __init__(self, catalog_db):
+        """Constructor of MaterialQuery
+        """
+        self.catalog_db = catalog_db
+
+    def find_id(self, material_id):
+        """Returns the material with given material_id
+
+        See CatalogDatabase.find_material_id()
+        """
+        return self.catalog_db.find_material_id(material_id)
+
+    def find_name(self, name):
+        """Returns the material with given name
+
+        See CatalogDatabase.find_material_name()
+        """
+        return self.catalog_db.find_material_name(name)
+
+
+class UseConditionsQuery(object):
+    """Lookup of use conditions in a CatalogDatabase
+
+    Offers the interface of dataclass.UseConditionsIndex, resolved records
+    are kept for all further requests.
+
+    Parameters
+    ----------
+
+    catalog_db : CatalogDatabase
+        Database holding the catalog
+    """
+
+    def __init__(self, catalog_db):
+        """Constructor of UseConditionsQuery
+        """
+        self.catalog_db = catalog_db
+        self._version = catalog_db.catalog("conditions").version
+        self._records = {}
+
+    def find(self, usage):
+        """Returns the resolved use condition record for given usage
+
+        See dataclass.UseConditionsIndex.find()
+        """
+        try:
+            return self._records[usage]
+        except KeyError:
+            entry = self.catalog_db.find_use_conditions(usage)
+            if entry is None:
+                return None
+            record = boundcond_input.resolve_boundary_conditions(
+                usage=entry,
+                version=float(self._version))
+            self._records[usage] = record
+            return record
+
+
+def _dump_record(record):
+    """Serialises a Record for a BLOB column
+    """
+    return sqlite3.Binary(pickle.dumps(record, 2))
+
+
+def _load_record(data):
+    """Restores a Record of a BLOB column
+    """
+    return pickle.loads(bytes(data))
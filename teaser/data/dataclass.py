@@ -4,11 +4,18 @@
 """This module holds file paths and bindings for XML data
 """
 
+import bisect
 import warnings
 import xml.etree.ElementTree as et
 import os
 import sys
 import teaser.logic.utilities as utils
+import teaser.data.catalog as catalog
+import teaser.data.catalogdb as catalogdb
+import teaser.data.input.boundcond_input as boundcond_input
+import teaser.data.input.buildingelement_input as buildingelement_input
+from teaser.logic.buildingobjects.buildingphysics.material import \
+    SharedMaterial
 
 v = sys.version_info
 if v >= (2, 7):
@@ -18,6 +25,14 @@ if v >= (2, 7):
         FileNotFoundError = IOError
 
 
+#: Type element XML files of the statistics shipped with TEASER
+STATISTIC_PATHS = {
+    "iwu": os.path.join(
+        "data", "input", "inputdata", "TypeBuildingElements.xml"),
+    "tabula_de": os.path.join(
+        "data", "input", "inputdata", "TypeElements_TABULA_DE.xml")}
+
+
 class DataClass(object):
     """Class for XML data bindings
 
@@ -31,54 +46,91 @@ class DataClass(object):
     used_statistics : str
         This parameter indicates which statistical data about building
         elements should be used. Use 'iwu' or 'tabula_de'.
+    catalog_db : CatalogDatabase or str
+        SQLite catalog store (see teaser.data.catalogdb) or path to its file
+        to read the catalogs from instead of the XML files. Default is None
 
     Attributes
     ----------
 
+    used_statistic : str
+        Statistic of the type elements currently in element_bind, 'iwu',
+        'tabula_de' or None. The save functions write to this catalog and
+        elements of buildings without a statistic of their own are loaded
+        from it. Changing the statistic keeps the type element catalog
+        (path_tb, element_bind and element_index) of the former statistic,
+        so switching back never loads a catalog again. Archetype buildings
+        select their catalog by Building.used_statistic instead, see
+        type_element_prototype().
+
     element_bind : instance of PyXB TypeBuilding elements
-        PyXB instance of the TypeBuildingElements binding
+        PyXB instance of the TypeBuildingElements binding, or read-only
+        records of it if shared through catalog_registry
     path_tb : str
         Full path to TypeBuildingElements XML file (XML needs to be compliant
         with XSD schema). Default is
         teaser/data/input/inputdata/TypeBuildingElements.xml
     material_bind : instance of PyXB Material
-        PyXB instance of the Material binding
+        PyXB instance of the Material binding, or read-only records of it
+        if shared through catalog_registry
     path_mat : str
         Full path to MaterialTemplates XML file (XML needs to be compliant
         with XSD schema). Default is
         teaser/data/input/inputdata/MaterialTemplates.xml
     conditions_bind : instance of PyXB UseConditions
-        PyXB instance of the UseConditions binding
+        PyXB instance of the UseConditions binding, or read-only records of
+        it if shared through catalog_registry
     path_uc : str
         Full path to UseConditions XML file (XML needs to be compliant
         with XSD schema). Default is
         teaser/data/input/inputdata/UseConditions.xml
+    element_index : instance of TypeElementIndex
+        Lookup table for the entries of element_bind, built on first access
+        and discarded whenever element_bind is replaced
+    material_index : instance of MaterialIndex
+        Lookup table for the entries of material_bind by material_id and
+        name, built on first access and discarded whenever material_bind is
+        replaced
+    conditions_index : instance of UseConditionsIndex
+        Resolved use condition records of conditions_bind by usage, built on
+        first access and discarded whenever conditions_bind is replaced
+    catalog_db : CatalogDatabase
+        SQLite catalog store all catalogs are read from and saved to, or
+        None to use the XML files. With a database the bindings only hold
+        the version of their catalog and the indices query the database.
+    shared_materials : bool
+        If True, layers of type elements reference one immutable
+        SharedMaterial per material of material_bind instead of owning a
+        Material each (see shared_material()). This saves a lot of objects
+        and memory for large projects. Changing the material of such a layer
+        replaces the shared material by a private copy first. Default is
+        False
     """
 
     def __init__(
             self,
-            used_statistic='iwu'):
+            used_statistic='iwu',
+            catalog_db=None):
         """Constructor of DataClass
         """
-        self.used_statistic = used_statistic
+        if catalog_db is not None and \
+                not isinstance(catalog_db, catalogdb.CatalogDatabase):
+            catalog_db = catalogdb.CatalogDatabase(catalog_db)
+        self.catalog_db = catalog_db
+        self._used_statistic = None
+        self._element_catalogs = {}
+        self._element_index = None
+        self._prototypes = {}
+        self._shared_materials = {}
+        self._batch = None
+        self.shared_materials = False
         self.element_bind = None
-        if self.used_statistic == 'iwu':
-            self.path_tb = utils.get_full_path(
-                "data/input/inputdata/TypeBuildingElements.xml")
-            self.load_tb_binding()
-        elif self.used_statistic == 'tabula_de':
-            self.path_tb = utils.get_full_path(
-                os.path.join(
-                    'data',
-                    'input',
-                    'inputdata',
-                    'TypeElements_TABULA_DE.xml'))
-            self.load_tb_binding()
-        elif self.used_statistic is None:
-            pass
+        self.used_statistic = used_statistic
+        self._material_index = None
         self.material_bind = None
         self.path_mat = utils.get_full_path(
             "data/input/inputdata/MaterialTemplates.xml")
+        self._conditions_index = None
         self.conditions_bind = None
         self.path_uc = utils.get_full_path(
             "data/input/inputdata/UseConditions.xml")
@@ -86,53 +138,481 @@ class DataClass(object):
         self.load_uc_binding()
         self.load_mat_binding()
 
-    def load_tb_binding(self):
+    @property
+    def used_statistic(self):
+        return self._used_statistic
+
+    @used_statistic.setter
+    def used_statistic(self, value):
+
+        if value == self._used_statistic:
+            return
+
+        if self._used_statistic is not None:
+            self._element_catalogs[self._used_statistic] = [
+                getattr(self, "path_tb", None),
+                self._element_bind,
+                self._element_index,
+                self._prototypes]
+        self._used_statistic = value
+
+        if value in self._element_catalogs:
+            self.path_tb, self._element_bind, self._element_index, \
+                self._prototypes = self._element_catalogs.pop(value)
+        elif value in STATISTIC_PATHS:
+            self.path_tb = utils.get_full_path(STATISTIC_PATHS[value])
+            self.load_tb_binding()
+        else:
+            self.element_bind = None
+
+    def _element_catalog(self, statistic):
+        """Returns index and prototypes of the catalog of a statistic
+
+        The catalog of used_statistic is the one in element_bind, catalogs
+        of other statistics are kept beside it and loaded on first use,
+        without changing used_statistic.
+
+        Parameters
+        ----------
+        statistic : str
+            Statistic of the type elements, e.g. 'iwu' or 'tabula_de'
+
+        Returns
+        ----------
+        element_index : TypeElementIndex or TypeElementQuery
+            Lookup table for the type elements of the statistic
+        prototypes : dict
+            Cache of the type element prototypes of the statistic
+        """
+
+        if statistic == self.used_statistic:
+            return self.element_index, self._prototypes
+
+        catalog_entry = self._element_catalogs.get(statistic)
+        if catalog_entry is None:
+            path = None
+            bind = None
+            if statistic in STATISTIC_PATHS:
+                path = utils.get_full_path(STATISTIC_PATHS[statistic])
+                if self.catalog_db is not None:
+                    bind = self.catalog_db.catalog("elements", statistic)
+                else:
+                    bind = catalog_registry.get(
+                        path=path,
+                        statistic=statistic,
+                        parse=lambda: self._parse_tb_binding(path))
+            catalog_entry = [path, bind, None, {}]
+            self._element_catalogs[statistic] = catalog_entry
+        if catalog_entry[2] is None:
+            if self.catalog_db is not None:
+                catalog_entry[2] = catalogdb.TypeElementQuery(
+                    self.catalog_db, statistic)
+            else:
+                catalog_entry[2] = TypeElementIndex(catalog_entry[1])
+        return catalog_entry[2], catalog_entry[3]
+
+    @property
+    def element_bind(self):
+        return self._element_bind
+
+    @element_bind.setter
+    def element_bind(self, value):
+
+        self._element_bind = value
+        self._element_index = None
+        self._prototypes = {}
+
+    @property
+    def element_index(self):
+
+        if self._element_index is None:
+            if self.catalog_db is not None:
+                self._element_index = catalogdb.TypeElementQuery(
+                    self.catalog_db, self.used_statistic)
+            else:
+                self._element_index = TypeElementIndex(self.element_bind)
+        return self._element_index
+
+    def type_element_prototype(
+            self,
+            element_type,
+            construction,
+            year,
+            statistic=None):
+        """Returns the resolved type element for given parameters
+
+        The prototype holds the data of all XML entries of the type element
+        catalog matching the parameters (see TypeElementIndex.find()), with
+        resolved materials of material_bind. Prototypes are cached by
+        element type, construction type and building age groups of the
+        matching entries and discarded whenever the catalog or material_bind
+        is replaced.
+
+        Parameters
+        ----------
+        element_type : str
+            Class name of the element, e.g. 'OuterWall'
+        construction : str
+            Construction type, e.g. 'heavy' or 'tabula_standard_1_SFH'
+        year : int
+            Year of construction
+        statistic : str
+            Statistic of the type element catalog, e.g. 'iwu' or
+            'tabula_de'. Default is None, which uses the catalog of
+            used_statistic (element_bind)
+
+        Returns
+        ----------
+        prototype : TypeElementPrototype or None
+            Resolved type element, None if no entry matches
+        """
+
+        if statistic is None:
+            statistic = self.used_statistic
+        element_index, prototypes = self._element_catalog(statistic)
+
+        type_elements = element_index.find(
+            element_type=element_type,
+            construction=construction,
+            year=year)
+        if not type_elements:
+            return None
+
+        key = (element_type, construction, tuple(
+            tuple(entry.building_age_group) for entry in type_elements))
+        try:
+            return prototypes[key]
+        except KeyError:
+            prototype = buildingelement_input.resolve_type_element(
+                element_type=element_type,
+                type_elements=type_elements,
+                data_class=self)
+            prototypes[key] = prototype
+            return prototype
+
+    @property
+    def material_bind(self):
+        return self._material_bind
+
+    @material_bind.setter
+    def material_bind(self, value):
+
+        self._material_bind = value
+        self._material_index = None
+        self._prototypes = {}
+        self._shared_materials = {}
+        for catalog_parked in self._element_catalogs.values():
+            catalog_parked[3].clear()
+
+    def shared_material(self, material_data):
+        """Returns the interned SharedMaterial for resolved material data
+
+        Shared materials are interned by material_id and discarded whenever
+        material_bind is replaced.
+
+        Parameters
+        ----------
+        material_data : list
+            List of (attribute name, value) tuples as returned by
+            material_input.resolve_material()
+
+        Returns
+        ----------
+        material : SharedMaterial
+            Immutable material holding material_data
+        """
+
+        key = dict(material_data).get("material_id")
+        try:
+            return self._shared_materials[key]
+        except KeyError:
+            material = SharedMaterial(material_data)
+            self._shared_materials[key] = material
+            return material
+
+    @property
+    def material_index(self):
+
+        if self._material_index is None:
+            if self.catalog_db is not None:
+                self._material_index = catalogdb.MaterialQuery(
+                    self.catalog_db)
+            else:
+                self._material_index = MaterialIndex(self.material_bind)
+        return self._material_index
+
+    @property
+    def conditions_bind(self):
+        return self._conditions_bind
+
+    @conditions_bind.setter
+    def conditions_bind(self, value):
+
+        self._conditions_bind = value
+        self._conditions_index = None
+
+    @property
+    def conditions_index(self):
+
+        if self._conditions_index is None:
+            if self.catalog_db is not None:
+                self._conditions_index = catalogdb.UseConditionsQuery(
+                    self.catalog_db)
+            else:
+                self._conditions_index = UseConditionsIndex(
+                    self.conditions_bind)
+        return self._conditions_index
+
+    def load_tb_binding(self, shared=True):
         """Loads TypeBuildingElement XML into binding classes
+
+        Parameters
+        ----------
+        shared : bool
+            If True (default), the binding is taken from the process wide
+            catalog_registry and only parsed if the file has not been parsed
+            before or has changed since. Shared bindings must not be
+            modified, use own_binding() to get a private copy. If False, a
+            private binding is parsed. Ignored if catalog_db is set, the
+            binding is then the header of the catalog in the database.
+        """
+
+        if self.catalog_db is not None:
+            self.element_bind = self.catalog_db.catalog(
+                "elements", self.used_statistic)
+        elif shared is True:
+            self.element_bind = catalog_registry.get(
+                path=self.path_tb,
+                statistic=self.used_statistic,
+                parse=self._parse_tb_binding)
+        else:
+            self.element_bind = self._parse_tb_binding()
+
+    def load_uc_binding(self, shared=True):
+        """Loads UseConditions XML into binding classes
+
+        Parameters
+        ----------
+        shared : bool
+            If True (default), the binding is taken from the process wide
+            catalog_registry, see load_tb_binding(). If False, a private
+            binding is parsed.
+        """
+
+        if self.catalog_db is not None:
+            self.conditions_bind = self.catalog_db.catalog("conditions")
+        elif shared is True:
+            self.conditions_bind = catalog_registry.get(
+                path=self.path_uc,
+                statistic=None,
+                parse=self._parse_uc_binding)
+        else:
+            self.conditions_bind = self._parse_uc_binding()
+
+    def load_mat_binding(self, shared=True):
+        """Loads MaterialTemplates XML into binding classes
+
+        Parameters
+        ----------
+        shared : bool
+            If True (default), the binding is taken from the process wide
+            catalog_registry, see load_tb_binding(). If False, a private
+            binding is parsed.
+        """
+
+        if self.catalog_db is not None:
+            self.material_bind = self.catalog_db.catalog("materials")
+        elif shared is True:
+            self.material_bind = catalog_registry.get(
+                path=self.path_mat,
+                statistic=None,
+                parse=self._parse_mat_binding)
+        else:
+            self.material_bind = self._parse_mat_binding()
+
+    def own_binding(self, binding):
+        """Returns a binding of this DataClass that may be modified
+
+        If the binding is a read-only catalog (a Record, e.g. handed out by
+        the catalog_registry or loaded from a snapshot) or is shared with
+        other DataClass instances through the catalog_registry, it is
+        replaced by a private PyXB binding parsed from the same file first
+        and the file is removed from the registry. A Record stays read-only
+        after the registry dropped it, e.g. because another DataClass saved
+        to the file. All
+        functions modifying a binding and its file (e.g. save_type_element)
+        need to fetch the binding with this function.
+
+        Parameters
+        ----------
+        binding : str
+            Name of the binding, one of 'element_bind', 'material_bind' or
+            'conditions_bind'
+
+        Returns
+        ----------
+        bind : instance of PyXB binding
+            Private binding of this DataClass
+        """
+
+        path, load = self._binding_file(binding)
+
+        bind = getattr(self, binding)
+        if isinstance(bind, catalog.Record) or \
+                catalog_registry.is_shared(bind):
+            load(shared=False)
+        # the caller is about to rewrite the file, which might not change
+        # its modification time within the resolution of the file system
+        catalog_registry.discard(path)
+        return getattr(self, binding)
+
+    def binding_changed(self, binding):
+        """Stores a binding modified by one of the save functions
+
+        Discards everything derived from the content of the binding (type
+        element prototypes and shared materials) and writes the binding into
+        its XML file. Within a batch() the file is written once when the
+        batch is committed. The lookup index of the binding is kept, the
+        caller has to update it along with the binding.
+
+        Parameters
+        ----------
+        binding : str
+            Name of the binding, one of 'element_bind', 'material_bind' or
+            'conditions_bind'
+        """
+
+        path, load = self._binding_file(binding)
+
+        if binding == "element_bind":
+            self._prototypes = {}
+        elif binding == "material_bind":
+            self._prototypes = {}
+            self._shared_materials = {}
+            for catalog_parked in self._element_catalogs.values():
+                catalog_parked[3].clear()
+
+        if self._batch is not None:
+            self._batch.changed.add(binding)
+        else:
+            self._write_binding(binding)
+
+    def batch(self):
+        """Returns a transaction for many save, modify and delete calls
+
+        Within the transaction the save functions (e.g. save_type_element,
+        save_material, save_bound_conditions) only change the bindings and
+        write each modified XML file once on commit, instead of writing the
+        whole file for every single element. If an exception leaves the
+        transaction, all changes are rolled back by loading the bindings
+        from their files again. With a CatalogDatabase, all changes are one
+        database transaction. Nested calls join the outer transaction.
+
+        Returns
+        ----------
+        batch : CatalogBatch
+            Context manager of the transaction
+
+        Example
+        ----------
+        >>> with prj.data.batch():
+        ...     for element in elements:
+        ...         element.save_type_element(data_class=prj.data)
+        """
+
+        if self._batch is None:
+            return CatalogBatch(self)
+        return self._batch
+
+    def _binding_file(self, binding):
+        """Returns path and loader of a binding
+
+        Parameters
+        ----------
+        binding : str
+            Name of the binding, one of 'element_bind', 'material_bind' or
+            'conditions_bind'
+        """
+
+        if binding == "element_bind":
+            return self.path_tb, self.load_tb_binding
+        elif binding == "material_bind":
+            return self.path_mat, self.load_mat_binding
+        elif binding == "conditions_bind":
+            return self.path_uc, self.load_uc_binding
+        else:
+            raise ValueError("Unknown binding " + str(binding))
+
+    def _write_binding(self, binding):
+        """Writes a binding into its XML file
         """
 
+        path, load = self._binding_file(binding)
+        with open(utils.get_full_path(path), "w") as out_file:
+            out_file.write(getattr(self, binding).toDOM().toprettyxml())
+        catalog_registry.discard(path)
+
+    def _parse_tb_binding(self, path=None):
+        """Parses TypeBuildingElement XML into a new binding
+
+        Parameters
+        ----------
+        path : str
+            Path of the XML file, default is path_tb
+        """
+
+        if path is None:
+            path = self.path_tb
+
+        bind = None
+
         try:
-            __xml_file_tb = open(self.path_tb, 'r+')
-            version_parse = et.parse(self.path_tb)
+            __xml_file_tb = open(path, 'r+')
+            version_parse = et.parse(path)
         except et.ParseError:
-            __xml_file_tb = open(self.path_tb, 'w')
+            __xml_file_tb = open(path, 'w')
             version_parse = False
         except FileNotFoundError:
-            __xml_file_tb = open(self.path_tb, 'w+')
+            __xml_file_tb = open(path, 'w+')
             version_parse = False
 
         if version_parse is False:
             import teaser.data.bindings.v_0_6.typeelement_bind as tb_bind
-            self.element_bind = tb_bind.TypeBuildingElements()
+            bind = tb_bind.TypeBuildingElements()
         elif bool(version_parse.getroot().attrib) is False:
             warnings.warn(
                 "You are using an old version of type building element data "
                 "base XML file")
             import teaser.data.bindings.v_0_3_9.typeelement_bind as tb_bind
-            self.element_bind = tb_bind.CreateFromDocument(
+            bind = tb_bind.CreateFromDocument(
                 __xml_file_tb.read())
         elif version_parse.getroot().attrib['version'] == "0.3.9":
             warnings.warn(
                 "You are using an old version of type building element data "
                 "base XML file")
             import teaser.data.bindings.v_0_3_9.typeelement_bind as tb_bind
-            self.element_bind = tb_bind.CreateFromDocument(
+            bind = tb_bind.CreateFromDocument(
                 __xml_file_tb.read())
         elif version_parse.getroot().attrib['version'] == "0.4":
             warnings.warn(
                 "You are using an old version of type building element data "
                 "base XML file")
             import teaser.data.bindings.v_0_4.typeelement_bind as tb_bind
-            self.element_bind = tb_bind.CreateFromDocument(
+            bind = tb_bind.CreateFromDocument(
                 __xml_file_tb.read())
         elif version_parse.getroot().attrib['version'] == "0.6":
             import teaser.data.bindings.v_0_6.typeelement_bind as tb_bind
-            self.element_bind = tb_bind.CreateFromDocument(
+            bind = tb_bind.CreateFromDocument(
                 __xml_file_tb.read())
 
-    def load_uc_binding(self):
-        """Loads UseConditions XML into binding classes
+        return bind
+
+    def _parse_uc_binding(self):
+        """Parses UseConditions XML into a new binding
         """
 
+        bind = None
+
         try:
             __xml_file_uc = open(self.path_uc, 'r+')
             version_parse = et.parse(self.path_uc)
@@ -142,33 +622,37 @@ class DataClass(object):
 
         if version_parse is False:
             import teaser.data.bindings.v_0_6.boundaryconditions_bind as uc_bind
-            self.conditions_bind = uc_bind.UseConditions()
+            bind = uc_bind.UseConditions()
         elif bool(version_parse.getroot().attrib) is False:
             warnings.warn("You are using an old version of use condition data "
                           "base XML file")
             import teaser.data.bindings.v_0_3_9.boundaryconditions_bind as uc_bind
-            self.conditions_bind = uc_bind.CreateFromDocument(
+            bind = uc_bind.CreateFromDocument(
                 __xml_file_uc.read())
         elif version_parse.getroot().attrib['version'] == "0.3.9":
             warnings.warn("You are using an old version of use condition data "
                           "base XML file")
             import teaser.data.bindings.v_0_3_9.boundaryconditions_bind as uc_bind
-            self.conditions_bind = uc_bind.CreateFromDocument(
+            bind = uc_bind.CreateFromDocument(
                 __xml_file_uc.read())
         elif version_parse.getroot().attrib['version'] == "0.4":
             warnings.warn("You are using an old version of use condition data "
                           "base XML file")
             import teaser.data.bindings.v_0_4.boundaryconditions_bind as uc_bind
-            self.conditions_bind = uc_bind.CreateFromDocument(
+            bind = uc_bind.CreateFromDocument(
                 __xml_file_uc.read())
         elif version_parse.getroot().attrib['version'] == "0.6":
             import teaser.data.bindings.v_0_6.boundaryconditions_bind as uc_bind
-            self.conditions_bind = uc_bind.CreateFromDocument(
+            bind = uc_bind.CreateFromDocument(
                 __xml_file_uc.read())
 
-    def load_mat_binding(self):
-        """Loads MaterialTemplates XML into binding classes
+        return bind
+
+    def _parse_mat_binding(self):
+        """Parses MaterialTemplates XML into a new binding
         """
+
+        bind = None
         try:
             __xml_file_mat = open(self.path_mat, 'r+')
             version_parse = et.parse(self.path_mat)
@@ -178,26 +662,596 @@ class DataClass(object):
 
         if version_parse is False:
             import teaser.data.bindings.v_0_6.material_bind as mat_bind
-            self.material_bind = mat_bind.MaterialTemplates()
+            bind = mat_bind.MaterialTemplates()
         elif bool(version_parse.getroot().attrib) is False:
             warnings.warn(
                 "You are using an old version of material data base XML file")
             import teaser.data.bindings.v_0_3_9.material_bind as mat_bind
-            self.material_bind = mat_bind.CreateFromDocument(
+            bind = mat_bind.CreateFromDocument(
                 __xml_file_mat.read())
         elif version_parse.getroot().attrib['version'] == "0.3.9":
             warnings.warn(
                 "You are using an old version of material data base XML file")
             import teaser.data.bindings.v_0_3_9.material_bind as mat_bind
-            self.material_bind = mat_bind.CreateFromDocument(
+            bind = mat_bind.CreateFromDocument(
                 __xml_file_mat.read())
         elif version_parse.getroot().attrib['version'] == "0.4":
             warnings.warn(
                 "You are using an old version of material data base XML file")
             import teaser.data.bindings.v_0_4.material_bind as mat_bind
-            self.material_bind = mat_bind.CreateFromDocument(
+            bind = mat_bind.CreateFromDocument(
                 __xml_file_mat.read())
         elif version_parse.getroot().attrib['version'] == "0.6":
             import teaser.data.bindings.v_0_6.material_bind as mat_bind
-            self.material_bind = mat_bind.CreateFromDocument(
+            bind = mat_bind.CreateFromDocument(
                 __xml_file_mat.read())
+
+        return bind
+
+
+class TypeElementIndex(object):
+    """Lookup table for type building elements
+
+    Groups the entries of a TypeBuildingElements binding by element type and
+    construction type. The building age groups of each group are split into
+    disjoint year intervals, each holding all entries valid within the
+    interval in the order of the XML file. Finding the type elements for a
+    given year is therefore one bisection instead of a scan over the whole
+    binding. Overlapping building age groups behave like in the linear scan,
+    i.e. all matching entries are returned.
+
+    Parameters
+    ----------
+
+    element_bind : instance of PyXB TypeBuildingElements
+        PyXB instance of the TypeBuildingElements binding
+
+    Attributes
+    ----------
+
+    element_types : tuple
+        Names of all element types that are indexed
+    """
+
+    element_types = (
+        "OuterWall",
+        "Door",
+        "InnerWall",
+        "Floor",
+        "Ceiling",
+        "GroundFloor",
+        "Rooftop",
+        "Window")
+
+    def __init__(self, element_bind):
+        """Constructor of TypeElementIndex
+        """
+        self._bounds = {}
+        self._entries = {}
+        self._groups = {}
+        self._keys = {}
+
+        if element_bind is not None:
+            for element_type in self.element_types:
+                for entry in getattr(element_bind, element_type, []):
+                    self._register(element_type, entry)
+
+        for key in self._groups:
+            self._split(key)
+
+    def _register(self, element_type, entry):
+        """Adds an entry to its group and key without splitting the group
+        """
+        self._groups.setdefault(
+            (element_type, entry.construction_type), []).append(entry)
+        self._keys.setdefault(
+            (element_type, entry.construction_type,
+             tuple(entry.building_age_group)), []).append(entry)
+
+    def _split(self, key):
+        """Splits the building age groups of a group into year intervals
+        """
+        entries = self._groups.get(key)
+        if not entries:
+            self._groups.pop(key, None)
+            self._bounds.pop(key, None)
+            self._entries.pop(key, None)
+            return
+        bounds = set()
+        for entry in entries:
+            bounds.add(entry.building_age_group[0])
+            bounds.add(entry.building_age_group[1] + 1)
+        bounds = sorted(bounds)
+        self._bounds[key] = bounds
+        self._entries[key] = [
+            [entry for entry in entries
+             if entry.building_age_group[0] <= start <=
+             entry.building_age_group[1]] for start in bounds]
+
+    def add(self, element_type, entry):
+        """Adds an entry appended to the binding to the index
+
+        Parameters
+        ----------
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        entry : PyXB type element
+            Entry appended to the binding
+        """
+        key = (element_type, entry.construction_type)
+        self._register(element_type, entry)
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            self._split(key)
+            return
+        intervals = self._entries[key]
+        start = entry.building_age_group[0]
+        stop = entry.building_age_group[1] + 1
+        for bound in (start, stop):
+            position = bisect.bisect_left(bounds, bound)
+            if position == len(bounds) or bounds[position] != bound:
+                # the new interval holds the entries of the interval it is
+                # split from, all of them span the whole interval
+                bounds.insert(position, bound)
+                intervals.insert(position, list(
+                    intervals[position - 1]) if position > 0 else [])
+        for position in range(bisect.bisect_left(bounds, start),
+                              bisect.bisect_left(bounds, stop)):
+            intervals[position].append(entry)
+
+    def remove(self, element_type, entry):
+        """Removes an entry removed from the binding from the index
+
+        Parameters
+        ----------
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        entry : PyXB type element
+            Entry removed from the binding
+        """
+        key = (element_type, entry.construction_type)
+        exact = key + (tuple(entry.building_age_group),)
+        self._groups[key] = [
+            item for item in self._groups.get(key, []) if item is not entry]
+        self._keys[exact] = [
+            item for item in self._keys.get(exact, []) if item is not entry]
+        if not self._keys[exact]:
+            del self._keys[exact]
+        self._split(key)
+
+    def find_exact(self, element_type, construction, building_age_group):
+        """Returns the first type element with exactly the given keys
+
+        Parameters
+        ----------
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        construction : str
+            Construction type, code list ('heavy', 'light')
+        building_age_group : list
+            First and last year of the building age group
+
+        Returns
+        ----------
+        entry : PyXB type element or None
+            First entry of the binding with these keys, None if there is
+            none
+        """
+        entries = self._keys.get(
+            (element_type, construction, tuple(building_age_group)))
+        if entries:
+            return entries[0]
+        return None
+
+    def find(self, element_type, construction, year):
+        """Returns all type elements matching the given keys
+
+        Parameters
+        ----------
+        element_type : str
+            Name of the element class, e.g. 'OuterWall'
+        construction : str
+            Construction type, code list ('heavy', 'light')
+        year : int
+            Year of construction
+
+        Returns
+        ----------
+        entries : list
+            List of PyXB type elements with given element type and
+            construction type whose building age group contains year.
+        """
+        key = (element_type, construction)
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            return []
+        position = bisect.bisect_right(bounds, year) - 1
+        if position < 0:
+            return []
+        return [entry for entry in self._entries[key][position]
+                if entry.building_age_group[0] <= year <=
+                entry.building_age_group[1]]
+
+
+class MaterialIndex(object):
+    """Lookup table for material templates
+
+    Maps material_id and name of all entries of a MaterialTemplates binding
+    to the entry. If several entries share an id or a name, the last one in
+    the XML file is kept, which is the entry a linear scan ends up copying.
+
+    Parameters
+    ----------
+
+    material_bind : instance of PyXB MaterialTemplates
+        PyXB instance of the MaterialTemplates binding
+    """
+
+    def __init__(self, material_bind):
+        """Constructor of MaterialIndex
+        """
+        self._by_id = {}
+        self._by_name = {}
+
+        if material_bind is not None:
+            for entry in material_bind.Material:
+                self.add(entry)
+
+    def add(self, entry):
+        """Adds an entry appended to the binding to the index
+
+        Parameters
+        ----------
+        entry : PyXB Material
+            Entry appended to the binding
+        """
+        self._by_id[entry.material_id] = entry
+        self._by_name.setdefault(entry.name, []).append(entry)
+
+    def rename(self, entry, old_name):
+        """Moves an entry whose name has been changed in the binding
+
+        Parameters
+        ----------
+        entry : PyXB Material
+            Modified entry of the binding
+        old_name : str
+            Name of the entry before the change
+        """
+        named = [item for item in self._by_name.get(old_name, [])
+                 if item is not entry]
+        if named:
+            self._by_name[old_name] = named
+        else:
+            self._by_name.pop(old_name, None)
+        self._by_name.setdefault(entry.name, []).append(entry)
+
+    def find_id(self, material_id):
+        """Returns the material template with given material_id
+
+        Parameters
+        ----------
+        material_id : str
+            UUID of the material
+
+        Returns
+        ----------
+        entry : PyXB Material or None
+            Matching entry of the binding, None if the id is unknown
+        """
+        return self._by_id.get(material_id)
+
+    def find_name(self, name):
+        """Returns the material template with given name
+
+        Parameters
+        ----------
+        name : str
+            Name of the material
+
+        Returns
+        ----------
+        entry : PyXB Material or None
+            Matching entry of the binding, None if the name is unknown
+        """
+        named = self._by_name.get(name)
+        if named:
+            return named[-1]
+        return None
+
+    def find_all_name(self, name):
+        """Returns all material templates with given name
+
+        Parameters
+        ----------
+        name : str
+            Name of the material
+
+        Returns
+        ----------
+        entries : list
+            All entries of the binding with this name
+        """
+        return list(self._by_name.get(name, []))
+
+
+class UseConditionsIndex(object):
+    """Lookup table for use conditions
+
+    Maps the usage of all entries of a UseConditions binding to the entry.
+    On first request of a usage the entry is resolved into a flat record of
+    attribute values (see boundcond_input.resolve_boundary_conditions), which
+    is kept for all further requests. If several entries share a usage, the
+    last one in the XML file is kept, which is the entry a linear scan ends
+    up copying.
+
+    Parameters
+    ----------
+
+    conditions_bind : instance of PyXB UseConditions
+        PyXB instance of the UseConditions binding
+    """
+
+    def __init__(self, conditions_bind):
+        """Constructor of UseConditionsIndex
+        """
+        self._entries = {}
+        self._records = {}
+        self._version = None
+
+        if conditions_bind is not None:
+            self._version = conditions_bind.version
+            for entry in conditions_bind.BoundaryConditions:
+                self.add(entry)
+
+    def add(self, entry):
+        """Adds an entry appended to the binding to the index
+
+        Parameters
+        ----------
+        entry : PyXB UseConditions
+            Entry appended to the binding
+        """
+        self._entries[entry.usage] = entry
+        self._records.pop(entry.usage, None)
+
+    def contains(self, usage):
+        """Returns True if the binding holds use conditions for usage
+
+        Parameters
+        ----------
+        usage : str
+            Usage of the zone, e.g. 'Living'
+        """
+        return usage in self._entries
+
+    def find(self, usage):
+        """Returns the resolved use condition record for given usage
+
+        Parameters
+        ----------
+        usage : str
+            Usage of the zone, e.g. 'Living' or 'Group Office (between 2
+            and 6 employees)'
+
+        Returns
+        ----------
+        record : list or None
+            List of (attribute name, value) tuples, None if the usage is
+            unknown
+        """
+        try:
+            return self._records[usage]
+        except KeyError:
+            entry = self._entries.get(usage)
+            if entry is None:
+                return None
+            record = boundcond_input.resolve_boundary_conditions(
+                usage=entry,
+                version=float(self._version))
+            self._records[usage] = record
+            return record
+
+
+class CatalogBatch(object):
+    """Transaction of changes to the catalogs of a DataClass
+
+    Created by DataClass.batch(), see there. Leaving the transaction
+    without exception commits it, i.e. writes every XML file changed within
+    the transaction once, otherwise it is rolled back.
+
+    Parameters
+    ----------
+
+    data_class : DataClass()
+        DataClass whose catalogs are changed
+
+    Attributes
+    ----------
+
+    changed : set
+        Names of the bindings changed within the transaction
+    """
+
+    def __init__(self, data_class):
+        """Constructor of CatalogBatch
+        """
+        self.data_class = data_class
+        self.changed = set()
+        self._depth = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            self.data_class._batch = self
+            if self.data_class.catalog_db is not None:
+                self.data_class.catalog_db.begin()
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._depth -= 1
+        if self._depth == 0:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        return False
+
+    def commit(self):
+        """Writes all changed bindings and ends the transaction
+        """
+
+        self.data_class._batch = None
+        if self.data_class.catalog_db is not None:
+            self.data_class.catalog_db.commit()
+        for binding in sorted(self.changed):
+            self.data_class._write_binding(binding)
+        self.changed = set()
+
+    def rollback(self):
+        """Discards all changes and ends the transaction
+
+        Changed bindings are loaded from their (unchanged) files again.
+        """
+
+        self.data_class._batch = None
+        if self.data_class.catalog_db is not None:
+            self.data_class.catalog_db.rollback()
+            # reassign the bindings to discard indices of rolled back rows
+            self.data_class.element_bind = self.data_class.element_bind
+            self.data_class.material_bind = self.data_class.material_bind
+            self.data_class.conditions_bind = \
+                self.data_class.conditions_bind
+        for binding in sorted(self.changed):
+            path, load = self.data_class._binding_file(binding)
+            load()
+        self.changed = set()
+
+
+class CatalogRegistry(object):
+    """Process wide registry of parsed XML catalogs
+
+    Parsing the XML catalogs with PyXB is by far the most expensive part of
+    creating a DataClass. The registry keeps one parsed catalog per file
+    (and statistic) and hands it out to every DataClass loading the same
+    unchanged file, so many projects in one process cost one parse per
+    catalog. A file is parsed again as soon as its modification time or size
+    changes. Files that do not exist are never cached.
+
+    The catalogs are handed out as read-only records (see
+    teaser.data.catalog) with the attribute names of the PyXB bindings.
+    Catalogs of version 0.6 are read with ElementTree, older ones are parsed
+    with PyXB and converted. Use DataClass.own_binding() to get a PyXB
+    binding that can be modified.
+
+    Between processes the records are kept in on-disk snapshots, which are
+    checked against the SHA-1 digest of the XML file and written on the
+    first parse of a file. This avoids the PyXB parse at every interpreter
+    start.
+
+    Attributes
+    ----------
+
+    snapshot_dir : str
+        Directory of the snapshots. Default is the folder catalogs in the
+        default output path of TEASER (see utilities.get_default_path()),
+        which is looked up on each access. Set to None to disable snapshots.
+    """
+
+    def __init__(self):
+        """Constructor of CatalogRegistry
+        """
+        self._catalogs = {}
+        self._default_snapshot_dir = True
+        self._snapshot_dir = None
+
+    @property
+    def snapshot_dir(self):
+        if self._default_snapshot_dir:
+            return os.path.join(utils.get_default_path(), "catalogs")
+        return self._snapshot_dir
+
+    @snapshot_dir.setter
+    def snapshot_dir(self, value):
+        self._default_snapshot_dir = False
+        self._snapshot_dir = value
+
+    def get(self, path, statistic, parse):
+        """Returns the parsed binding of a catalog file
+
+        Parameters
+        ----------
+        path : str
+            Path to the XML file
+        statistic : str
+            Statistic the catalog is used for (e.g. 'iwu' or 'tabula_de'),
+            None for catalogs independent of the statistic
+        parse : function
+            Function without arguments parsing the file into a new PyXB
+            binding, only called if the file is not yet cached and cannot
+            be read without PyXB
+
+        Returns
+        ----------
+        bind : instance of Record
+            Shared records of the catalog, a new PyXB binding if the file
+            does not exist
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return parse()
+
+        key = (os.path.abspath(path), statistic)
+        stamp = (stat.st_mtime, stat.st_size)
+        cached = self._catalogs.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        bind = None
+        if self.snapshot_dir is not None:
+            digest = catalog.file_digest(path)
+            snapshot = catalog.snapshot_path(self.snapshot_dir, path)
+            bind = catalog.load_snapshot(snapshot, digest)
+        if bind is None:
+            bind = catalog.record_from_xml(path)
+            if bind is None:
+                bind = catalog.record_from_binding(parse())
+            if self.snapshot_dir is not None:
+                catalog.save_snapshot(snapshot, digest, bind)
+
+        self._catalogs[key] = (stamp, bind)
+        return bind
+
+    def is_shared(self, bind):
+        """Returns True if the catalog is handed out by this registry
+
+        Parameters
+        ----------
+        bind : instance of Record or PyXB binding
+            Binding to check
+        """
+
+        return any(cached[1] is bind for cached in self._catalogs.values())
+
+    def discard(self, path):
+        """Removes all cached catalogs of a file
+
+        Parameters
+        ----------
+        path : str
+            Path to the XML file
+        """
+
+        path = os.path.abspath(path)
+        for key in [key for key in self._catalogs if key[0] == path]:
+            del self._catalogs[key]
+
+    def clear(self):
+        """Discards all cached catalogs
+        """
+        self._catalogs.clear()
+
+
+catalog_registry = CatalogRegistry()
@@ -9,6 +9,8 @@ This module contains function to load building element classes
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 from teaser.logic.buildingobjects.buildingphysics.material import Material
 import teaser.data.input.material_input as mat_input
+from teaser.logic.buildingobjects.calculation.equivalent_res import \
+    cached_per_area
 
 
 def load_type_element(element,
@@ -40,163 +42,159 @@ def load_type_element(element,
     data_class : DataClass()
         DataClass containing the bindings for TypeBuildingElement and
         Material (typically this is the data class stored in prj.data,
-        but the user can individually change that.
+        but the user can individually change that. The element is built
+        from the TypeElementPrototype given by
+        data_class.type_element_prototype(), from the type element catalog
+        of the used_statistic of the building the element belongs to. If
+        data_class.shared_materials is True, the layers reference shared
+        materials of data_class.shared_material().
 
 
     """
 
-    element_binding = data_class.element_bind
-
     element.year_of_construction = year
 
-    if type(element).__name__ == 'OuterWall':
-
-        for out_wall in element_binding.OuterWall:
-            if out_wall.building_age_group[0] <= year <= \
-                    out_wall.building_age_group[1] and \
-                    out_wall.construction_type == construction:
-                _set_basic_data(element=element,
-                                pyxb_class=out_wall)
-                for pyxb_layer in out_wall.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-    if type(element).__name__ == 'Door':
-
-        for out_wall in element_binding.Door:
-            if out_wall.building_age_group[0] <= year <= \
-                    out_wall.building_age_group[1] and \
-                    out_wall.construction_type == construction:
-                _set_basic_data(element=element,
-                                pyxb_class=out_wall)
-                for pyxb_layer in out_wall.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-    elif type(element).__name__ == 'InnerWall':
-
-        for in_wall in element_binding.InnerWall:
-            if in_wall.building_age_group[0] <= year <= \
-                    in_wall.building_age_group[1] and \
-                    in_wall.construction_type == construction:
-                _set_basic_data(element=element,
-                                pyxb_class=in_wall)
-                for pyxb_layer in in_wall.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-    elif type(element).__name__ == 'Floor':
-
-        for floor in element_binding.Floor:
-            if floor.building_age_group[0] <= year <= \
-                    floor.building_age_group[1] and \
-                    floor.construction_type == construction:
-                _set_basic_data(element=element,
-                                pyxb_class=floor)
-                for pyxb_layer in floor.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-    elif type(element).__name__ == 'Ceiling':
-
-        for ceiling in element_binding.Ceiling:
-            if ceiling.building_age_group[0] <= year <= \
-                    ceiling.building_age_group[1] and \
-                    ceiling.construction_type == construction:
-                _set_basic_data(element=element,
-                                pyxb_class=ceiling)
-                for pyxb_layer in ceiling.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-    elif type(element).__name__ == 'GroundFloor':
-
-        for gr_floor in element_binding.GroundFloor:
-            if gr_floor.building_age_group[0] <= year <= \
-                    gr_floor.building_age_group[1] and \
-                    gr_floor.construction_type == construction:
-                _set_basic_data(element=element,
-                                pyxb_class=gr_floor)
-                for pyxb_layer in gr_floor.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-    elif type(element).__name__ == 'Rooftop':
-
-        for roof in element_binding.Rooftop:
-            if roof.building_age_group[0] <= year <= \
-                    roof.building_age_group[1] and \
-                    roof.construction_type == construction:
-                _set_basic_data(element=element,
-                                pyxb_class=roof)
-                for pyxb_layer in roof.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-    elif type(element).__name__ == 'Window':
-
-        for win in element_binding.Window:
-            if win.building_age_group[0] <= year <= \
-                    win.building_age_group[1] and win.construction_type == \
-                    construction:
-                _set_basic_data(element=element,
-                                pyxb_class=win)
-                for pyxb_layer in win.Layers.layer:
-
-                    layer = Layer(element)
-                    material = Material(layer)
-                    _set_layer_data(material=material,
-                                    layer=layer,
-                                    pyxb_class=pyxb_layer,
-                                    data_class=data_class)
-
-
-def _set_layer_data(material, layer, pyxb_class, data_class):
-    """Helper function for load_type_element to set the layer data.
+    # zones without a building have no parent attribute
+    building = getattr(element.parent, "parent", None)
+    statistic = getattr(building, "used_statistic", None)
+
+    prototype = data_class.type_element_prototype(
+        element_type=type(element).__name__,
+        construction=construction,
+        year=year,
+        statistic=statistic)
+
+    if prototype is None:
+        element.prototype = None
+        return
+
+    for basic_data, layers in prototype.type_elements:
+        for attr, value in basic_data:
+            if isinstance(value, list):
+                value = list(value)
+            setattr(element, attr, value)
+        for thickness, layer_id, material_data in layers:
+            layer = Layer(element)
+            if data_class.shared_materials is True:
+                layer.thickness = thickness
+                layer.id = layer_id
+                layer.material = data_class.shared_material(material_data)
+                continue
+            material = Material(layer)
+            layer.thickness = thickness
+            layer.id = layer_id
+            for attr, value in material_data:
+                if isinstance(value, list):
+                    value = list(value)
+                setattr(material, attr, value)
+
+    if data_class.shared_materials is True and element.layer and \
+            element.area is not None and \
+            element.inner_convection is not None and \
+            element.inner_radiation is not None:
+        element.calc_ua_value()
+
+    if prototype.fingerprint is None:
+        prototype.fingerprint = element.gather_layer_fingerprint()
+    element.prototype = prototype
+
+
+class TypeElementPrototype(object):
+    """Resolved type element of the TypeBuildingElements XML
+
+    Holds everything needed to build an element of one element type,
+    construction type and building age group: the basic data and the layer
+    stack with resolved material data of all matching XML entries.
+    Prototypes are created by resolve_type_element() and cached in
+    DataClass.
+
+    Attributes
+    ----------
+
+    element_type : str
+        Class name of the element, e.g. 'OuterWall'
+    type_elements : list
+        One (basic data, layers) tuple per matching XML entry, in the order
+        of the XML. Basic data is a list of (attribute name, value) tuples,
+        layers a list of (thickness, id, material data) tuples with material
+        data as list of (attribute name, value) tuples.
+    fingerprint : tuple
+        Layer properties (see BuildingElement.gather_layer_fingerprint()) of
+        elements loaded from this prototype, i.e. of elements whose layers
+        have not been changed after loading.
+    """
+
+    def __init__(self, element_type, type_elements):
+        """Constructor of TypeElementPrototype
+        """
+        self.element_type = element_type
+        self.type_elements = type_elements
+        self.fingerprint = None
+
+    def equivalent_res(self, t_bt=7):
+        """Equivalent resistances and capacities for an area of 1 m2
+
+        The values are read from the cache of equivalent_res by the
+        fingerprint of the prototype, they are only valid for elements
+        with this fingerprint.
+
+        Parameters
+        ----------
+        t_bt : int
+            Time constant according to VDI 6007 (default t_bt = 7)
+
+        Returns
+        ----------
+        per_area : tuple or None
+            (r1, r2, r3, c1, c2, c1_korr) in m2*K/W and J/(m2*K), None if
+            no element of the prototype has been calculated yet
+        """
+        return cached_per_area(self.fingerprint, t_bt)
+
+
+def resolve_type_element(element_type, type_elements, data_class):
+    """Resolves the matching XML entries of a type element into a prototype
 
     Parameters
     ----------
-    material : Material()
-        Material() instance of TEASER
+    element_type : str
+        Class name of the element, e.g. 'OuterWall'
+
+    type_elements : list
+        Pyxb class representations of all XML entries matching element
+        type, construction type and year of construction
+
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material (typically this is the data class stored in prj.data,
+        but the user can individually change that.
+
+    Returns
+    ----------
+    prototype : TypeElementPrototype
+        Resolved type element
+    """
+
+    resolved = []
+    for type_element in type_elements:
+        layers = []
+        for pyxb_layer in type_element.Layers.layer:
+            layers.append((float(pyxb_layer.thickness),
+                           pyxb_layer.id,
+                           _resolve_layer_material(pyxb_class=pyxb_layer,
+                                                   data_class=data_class)))
+        resolved.append((_resolve_basic_data(element_type=element_type,
+                                             pyxb_class=type_element),
+                         layers))
+    return TypeElementPrototype(element_type=element_type,
+                                type_elements=resolved)
 
-    layer : Layer()
-        Layer() instance of TEASER
 
+def _resolve_layer_material(pyxb_class, data_class):
+    """Helper function for resolve_type_element to get the material data.
+
+    Parameters
+    ----------
     pyxb_class :
         Pyxb class representation of xml
 
@@ -204,61 +202,74 @@ def _set_layer_data(material, layer, pyxb_class, data_class):
         DataClass containing the bindings for TypeBuildingElement and
         Material (typically this is the data class stored in prj.data,
         but the user can individually change that.
-    """
 
-    layer.thickness = pyxb_class.thickness
-    layer.id = pyxb_class.id
+    Returns
+    ----------
+    material_data : list
+        List of (attribute name, value) tuples to set in Material
+    """
 
     if float(data_class.element_bind.version) >= 0.4:
-        mat_input.load_material_id(material,
-                                   pyxb_class.material.material_id,
-                                   data_class)
+        mat = data_class.material_index.find_id(
+            pyxb_class.material.material_id)
+        if mat is None:
+            return []
+        return mat_input.resolve_material(pyxb_class=mat,
+                                          data_class=data_class)
     else:
-        material.name = pyxb_class.Material.name
-        material.density = pyxb_class.Material.density
-        material.thermal_conduc = pyxb_class.Material.thermal_conduc
-        material.heat_capac = pyxb_class.Material.heat_capac
+        material_data = [
+            ("name", pyxb_class.Material.name),
+            ("density", pyxb_class.Material.density),
+            ("thermal_conduc", pyxb_class.Material.thermal_conduc),
+            ("heat_capac", pyxb_class.Material.heat_capac)]
         if pyxb_class.Material.solar_absorp is not None:
-            material.solar_absorp = pyxb_class.Material.solar_absorp
+            material_data.append(
+                ("solar_absorp", pyxb_class.Material.solar_absorp))
         if pyxb_class.Material.ir_emissivity is not None:
-            material.ir_emissivity = pyxb_class.Material.ir_emissivity
+            material_data.append(
+                ("ir_emissivity", pyxb_class.Material.ir_emissivity))
+        return material_data
 
 
-def _set_basic_data(element, pyxb_class):
-    """Helper function for load_type_element to set the layer data.
+def _resolve_basic_data(element_type, pyxb_class):
+    """Helper function for resolve_type_element to get the basic data.
 
     Parameters
     ----------
+    element_type : str
+        Class name of the element, e.g. 'OuterWall'
+
     pyxb_class :
         Pyxb class representation of xml
-    """
 
-    element.building_age_group = pyxb_class.building_age_group
-    element.construction_type = pyxb_class.construction_type
-    element.inner_radiation = pyxb_class.inner_radiation
-    element.inner_convection = pyxb_class.inner_convection
+    Returns
+    ----------
+    basic_data : list
+        List of (attribute name, value) tuples to set in the element
+    """
 
-    if type(element).__name__ == 'OuterWall' or \
-            type(element).__name__ == 'Rooftop' or \
-            type(element).__name__ == 'Door':
+    basic_data = [
+        ("building_age_group", pyxb_class.building_age_group),
+        ("construction_type", pyxb_class.construction_type),
+        ("inner_radiation", pyxb_class.inner_radiation),
+        ("inner_convection", pyxb_class.inner_convection)]
 
-        element.inner_radiation = pyxb_class.inner_radiation
-        element.inner_convection = pyxb_class.inner_convection
-        element.outer_radiation = pyxb_class.outer_radiation
-        element.outer_convection = pyxb_class.outer_convection
+    if element_type == 'OuterWall' or \
+            element_type == 'Rooftop' or \
+            element_type == 'Door':
 
-    elif type(element).__name__ == 'InnerWall' or \
-            type(element).__name__ == 'Ceiling' or \
-            type(element).__name__ == 'Floor' or \
-            type(element).__name__ == 'GroundFloor':
+        basic_data += [
+            ("outer_radiation", pyxb_class.outer_radiation),
+            ("outer_convection", pyxb_class.outer_convection)]
 
-        pass
+    elif element_type == 'Window':
 
-    elif type(element).__name__ == 'Window':
+        basic_data += [
+            ("outer_radiation", pyxb_class.outer_radiation),
+            ("outer_convection", pyxb_class.outer_convection),
+            ("g_value", pyxb_class.g_value),
+            ("a_conv", pyxb_class.a_conv),
+            ("shading_g_total", pyxb_class.shading_g_total),
+            ("shading_max_irr", pyxb_class.shading_max_irr)]
 
-        element.outer_radiation = pyxb_class.outer_radiation
-        element.outer_convection = pyxb_class.outer_convection
-        element.g_value = pyxb_class.g_value
-        element.a_conv = pyxb_class.a_conv
-        element.shading_g_total = pyxb_class.shading_g_total
-        element.shading_max_irr = pyxb_class.shading_max_irr
+    return basic_data
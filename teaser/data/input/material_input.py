@@ -27,28 +27,16 @@ def load_material(material, mat_name, data_class):
     data_class : DataClass()
         DataClass containing the bindings for TypeBuildingElement and
         Material (typically this is the data class stored in prj.data,
-        but the user can individually change that.
+        but the user can individually change that. The material is looked
+        up in data_class.material_index.
     """
 
-    binding = data_class.material_bind
-
-    for mat in binding.Material:
-
-        if mat.name == mat_name:
+    mat = data_class.material_index.find_name(mat_name)
 
-            material.material_id = mat.material_id
-            material.name = mat.name
-            material.density = mat.density
-            material.thermal_conduc = float(mat.thermal_conduc)
-            material.heat_capac = mat.heat_capac
-            material.solar_absorp = mat.solar_absorp
-            material.ir_emissivity = mat.ir_emissivity
-            if float(data_class.material_bind.version) >= 0.6:
-                try:
-                    material.thickness_default = mat.thickness_default
-                    material.thickness_list = mat.thickness_list
-                except AttributeError:
-                    pass
+    if mat is not None:
+        _set_material_data(material=material,
+                           pyxb_class=mat,
+                           data_class=data_class)
 
 
 def load_material_id(material, mat_id, data_class):
@@ -65,28 +53,79 @@ def load_material_id(material, mat_id, data_class):
     mat_id : name
         id of material from XML
 
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material (typically this is the data class stored in prj.data,
+        but the user can individually change that. The material is looked
+        up in data_class.material_index.
+    """
+
+    mat = data_class.material_index.find_id(mat_id)
+
+    if mat is not None:
+        _set_material_data(material=material,
+                           pyxb_class=mat,
+                           data_class=data_class)
+
+
+def _set_material_data(material, pyxb_class, data_class):
+    """Helper function for the material loaders to set the material data.
+
+    Parameters
+    ----------
+
+    material : Material()
+        instance of TEASERS Material class
+
+    pyxb_class :
+        Pyxb class representation of xml
+
     data_class : DataClass()
         DataClass containing the bindings for TypeBuildingElement and
         Material (typically this is the data class stored in prj.data,
         but the user can individually change that.
     """
 
-    binding = data_class.material_bind
-
-    for mat in binding.Material:
-
-        if mat.material_id == mat_id:
-
-            material.material_id = mat.material_id
-            material.name = mat.name
-            material.density = mat.density
-            material.thermal_conduc = float(mat.thermal_conduc)
-            material.heat_capac = mat.heat_capac
-            material.solar_absorp = mat.solar_absorp
-            material.ir_emissivity = mat.ir_emissivity
-            if float(data_class.material_bind.version) >= 0.6:
-                try:
-                    material.thickness_default = mat.thickness_default
-                    material.thickness_list = mat.thickness_list
-                except AttributeError:
-                    pass
+    for attr, value in resolve_material(pyxb_class=pyxb_class,
+                                        data_class=data_class):
+        if isinstance(value, list):
+            value = list(value)
+        setattr(material, attr, value)
+
+
+def resolve_material(pyxb_class, data_class):
+    """Resolves one material entry of the XML into a flat record
+
+    Parameters
+    ----------
+
+    pyxb_class :
+        Pyxb class representation of xml
+
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material (typically this is the data class stored in prj.data,
+        but the user can individually change that.
+
+    Returns
+    ----------
+    record : list
+        List of (attribute name, value) tuples in the order the attributes
+        are set in Material
+    """
+
+    record = [
+        ("material_id", pyxb_class.material_id),
+        ("name", pyxb_class.name),
+        ("density", pyxb_class.density),
+        ("thermal_conduc", float(pyxb_class.thermal_conduc)),
+        ("heat_capac", pyxb_class.heat_capac),
+        ("solar_absorp", pyxb_class.solar_absorp),
+        ("ir_emissivity", pyxb_class.ir_emissivity)]
+    if float(data_class.material_bind.version) >= 0.6:
+        try:
+            record.append(("thickness_default", pyxb_class.thickness_default))
+            record.append(("thickness_list", pyxb_class.thickness_list))
+        except AttributeError:
+            pass
+    return record
@@ -390,7 +390,8 @@ def set_basic_data_teaser(pyxb_class, element):
         element.inner_convection = pyxb_class.inner_convection
         element.outer_radiation = pyxb_class.outer_radiation
         element.outer_convection = pyxb_class.outer_convection
-        element.g_Value = pyxb_class.g_value
+        if pyxb_class.g_value is not None:
+            element.g_value = pyxb_class.g_value
         element.a_conv = pyxb_class.a_conv
         element.shading_g_total = pyxb_class.shading_g_total
         element.shading_max_irr = pyxb_class.shading_max_irr
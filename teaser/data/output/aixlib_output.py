@@ -61,6 +61,8 @@ def export_multizone(buildings, prj, path=None):
         Template for MultiZone model
     """
 
+    path = utilities.create_path(path)
+
     lookup = TemplateLookup(directories=[utilities.get_full_path(
         os.path.join('data', 'output', 'modelicatemplate'))])
     zone_template_1 = Template(
@@ -110,11 +112,10 @@ def export_multizone(buildings, prj, path=None):
 
         assert bldg.used_library_calc == 'AixLib', ass_error
 
-        bldg_path = os.path.join(path, bldg.name)
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path,
-                         bldg.name + "_DataBase")))
+        bldg_path = utilities.create_path(os.path.join(path, bldg.name))
+        utilities.create_path(os.path.join(
+            bldg_path,
+            bldg.name + "_DataBase"))
         bldg.library_attr.modelica_set_temp(path=bldg_path)
         bldg.library_attr.modelica_AHU_boundary(
             time_line=None,
@@ -142,8 +143,7 @@ def export_multizone(buildings, prj, path=None):
                                                "the project list.")
                 bldg.building_id = i
 
-        out_file = open(utilities.get_full_path
-                        (os.path.join(bldg_path, bldg.name + ".mo")), 'w')
+        out_file = open(os.path.join(bldg_path, bldg.name + ".mo"), 'w')
 
         out_file.write(model_template.render_unicode(
             bldg=bldg,
@@ -155,8 +155,8 @@ def export_multizone(buildings, prj, path=None):
 
         for zone in bldg.thermal_zones:
 
-            out_file = open(utilities.get_full_path(os.path.join(
-                zone_path, bldg.name + '_' + zone.name + '.mo')), 'w')
+            out_file = open(os.path.join(
+                zone_path, bldg.name + '_' + zone.name + '.mo'), 'w')
             if type(zone.model_attr).__name__ == "OneElement":
                 out_file.write(zone_template_1.render_unicode(zone=zone))
             elif type(zone.model_attr).__name__ == "TwoElement":
@@ -201,8 +201,7 @@ def _help_package(path, name, uses=None, within=None):
 
     package_template = Template(filename=utilities.get_full_path(
         "data/output/modelicatemplate/package"))
-    out_file = open(
-        utilities.get_full_path(os.path.join(path, "package.mo")), 'w')
+    out_file = open(os.path.join(path, "package.mo"), 'w')
     out_file.write(package_template.render_unicode(
         name=name,
         within=within,
@@ -234,8 +233,7 @@ def _help_package_order(path, package_list, addition=None, extra=None):
     order_template = Template(filename=utilities.get_full_path(
         "data/output/modelicatemplate/package_order"))
 
-    out_file = open(
-        utilities.get_full_path(path + "/" + "package" + ".order"), 'w')
+    out_file = open(os.path.join(path, "package.order"), 'w')
     out_file.write(order_template.render_unicode
                    (list=package_list, addition=addition, extra=extra))
     out_file.close()
@@ -6,10 +6,7 @@
 This module contains function to save building element classes
 """
 
-import teaser.data.bindings.v_0_6.typeelement_bind as tb_bind
-import teaser.logic.utilities as utilities
 import warnings
-import pyxb
 
 
 def save_type_element(element, data_class):
@@ -20,7 +17,8 @@ def save_type_element(element, data_class):
     elements. If the Project parent is set, it automatically saves it to
     the file given in Project.data. Alternatively you can specify a path to
     a file of TypeBuildingElements. If this file does not exist,
-    a new file is created.
+    a new file is created. If the DataClass uses a CatalogDatabase, the
+    element is added to the database instead.
 
     Parameters
     ----------
@@ -33,181 +31,48 @@ def save_type_element(element, data_class):
         but the user can individually change that.
     """
 
-    element_binding = data_class.element_bind
-    element_binding.version = "0.6"
-    add_to_xml = True
-
-    pyxb.utils.domutils.BindingDOMSupport.DeclareNamespace(
-        tb_bind.Namespace, 'elements')
-
     warning_text = ("Construction Type and building age "
                     "group already exist in this XML, consider revising "
                     "your inputs. The Element is NOT saved into XML")
-    if type(element).__name__ == "OuterWall":
-
-        for check in element_binding.OuterWall:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
-
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.OuterWallType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-
-            element_binding.OuterWall.append(pyxb_wall)
-
-    if type(element).__name__ == "Door":
-
-        for check in element_binding.Door:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
-
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.DoorType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-
-            element_binding.Door.append(pyxb_wall)
-
-    elif type(element).__name__ == 'InnerWall':
-
-        for check in element_binding.InnerWall:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
-
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.InnerWallType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-
-            element_binding.InnerWall.append(pyxb_wall)
-
-    elif type(element).__name__ == 'Ceiling':
-
-        for check in element_binding.Ceiling:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
-
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.CeilingType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-
-            element_binding.Ceiling.append(pyxb_wall)
-
-    elif type(element).__name__ == 'Floor':
-
-        for check in element_binding.Floor:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
-
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.FloorType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-
-            element_binding.Floor.append(pyxb_wall)
-
-    elif type(element).__name__ == 'GroundFloor':
-
-        for check in element_binding.GroundFloor:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
 
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.GroundFloorType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-
-            element_binding.GroundFloor.append(pyxb_wall)
-
-    elif type(element).__name__ == 'Rooftop':
-
-        for check in element_binding.Rooftop:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
-
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.RooftopType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-
-            element_binding.Rooftop.append(pyxb_wall)
-
-    elif type(element).__name__ == 'Window':
-
-        for check in element_binding.Window:
-            if check.building_age_group == element.building_age_group and\
-               check.construction_type == element.construction_type:
-                warnings.warn(warning_text)
-                add_to_xml = False
-                break
-
-        if add_to_xml is True:
-
-            pyxb_wall = tb_bind.WindowType()
-            _set_basic_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
-            pyxb_wall.Layers = tb_bind.LayersType()
-            _set_layer_data_pyxb(element=element,
-                                 pyxb_class=pyxb_wall)
+    if data_class.catalog_db is not None:
+        if data_class.catalog_db.has_type_element(
+                statistic=data_class.used_statistic,
+                element_type=type(element).__name__,
+                construction=element.construction_type,
+                building_age_group=element.building_age_group):
+            warnings.warn(warning_text)
+        else:
+            data_class.catalog_db.add_type_element(
+                statistic=data_class.used_statistic,
+                element_type=type(element).__name__,
+                entry=_create_element_pyxb(element=element))
+            # reassign the binding to discard the outdated type element
+            # index
+            data_class.element_bind = data_class.element_bind
+        return
+
+    element_binding = data_class.own_binding("element_bind")
+    element_binding.version = "0.6"
+    element_type = type(element).__name__
 
-            element_binding.Window.append(pyxb_wall)
+    import pyxb.utils.domutils
+    import teaser.data.bindings.v_0_6.typeelement_bind as tb_bind
 
-    if add_to_xml is True:
+    pyxb.utils.domutils.BindingDOMSupport.DeclareNamespace(
+        tb_bind.Namespace, 'elements')
 
-        out_file = open(utilities.get_full_path(data_class.path_tb), "w")
+    if data_class.element_index.find_exact(
+            element_type=element_type,
+            construction=element.construction_type,
+            building_age_group=element.building_age_group) is not None:
+        warnings.warn(warning_text)
+        return
 
-        out_file.write(element_binding.toDOM().toprettyxml())
+    pyxb_wall = _create_element_pyxb(element=element)
+    getattr(element_binding, element_type).append(pyxb_wall)
+    data_class.element_index.add(element_type, pyxb_wall)
+    data_class.binding_changed("element_bind")
 
 
 def delete_type_element(element, data_class):
@@ -218,7 +83,8 @@ def delete_type_element(element, data_class):
     elements. If the Project parent is set, it automatically saves it to
     the file given in Project.data. Alternatively you can specify a path to
     a file of TypeBuildingElements. If this file does not exist,
-    a new file is created.
+    a new file is created. If the DataClass uses a CatalogDatabase, the
+    element is deleted from the database instead.
 
     Parameters
     ----------
@@ -232,73 +98,53 @@ def delete_type_element(element, data_class):
 
     """
 
-    element_binding = data_class.element_bind
-
-    if type(element).__name__ == "OuterWall":
-        for check in element_binding.OuterWall:
-            if check.building_age_group == element.building_age_group and \
-               check.construction_type == element.construction_type:
-                element_binding.OuterWall.remove(check)
-                break
+    if data_class.catalog_db is not None:
+        data_class.catalog_db.delete_type_element(
+            statistic=data_class.used_statistic,
+            element_type=type(element).__name__,
+            construction=element.construction_type,
+            building_age_group=element.building_age_group)
+        # reassign the binding to discard the outdated type element index
+        data_class.element_bind = data_class.element_bind
+        return
 
-    if type(element).__name__ == "Door":
-        for check in element_binding.Door:
-            if check.building_age_group == element.building_age_group and \
-               check.construction_type == element.construction_type:
-                element_binding.Door.remove(check)
-                break
+    element_binding = data_class.own_binding("element_bind")
+    element_type = type(element).__name__
 
-    elif type(element).__name__ == 'InnerWall':
+    check = data_class.element_index.find_exact(
+        element_type=element_type,
+        construction=element.construction_type,
+        building_age_group=element.building_age_group)
+    if check is not None:
+        getattr(element_binding, element_type).remove(check)
+        data_class.element_index.remove(element_type, check)
 
-        for check in element_binding.InnerWall:
-            if check.building_age_group == element.building_age_group and \
-                    check.construction_type == element.construction_type:
-                element_binding.InnerWall.remove(check)
-                break
+    data_class.binding_changed("element_bind")
 
-    elif type(element).__name__ == 'Ceiling':
 
-        for check in element_binding.Ceiling:
-            if check.building_age_group == element.building_age_group and \
-                    check.construction_type == element.construction_type:
-                element_binding.Ceiling.remove(check)
-                break
+def _create_element_pyxb(element):
+    """Helper function for save_type_element to create a PyXB type element.
 
-    elif type(element).__name__ == 'Floor':
-
-        for check in element_binding.Floor:
-            if check.building_age_group == element.building_age_group and \
-                    check.construction_type == element.construction_type:
-                element_binding.Floor.remove(check)
-                break
-
-    elif type(element).__name__ == 'GroundFloor':
-
-        for check in element_binding.GroundFloor:
-            if check.building_age_group == element.building_age_group and \
-                    check.construction_type == element.construction_type:
-                element_binding.GroundFloor.remove(check)
-                break
-
-    elif type(element).__name__ == 'Rooftop':
-
-        for check in element_binding.Rooftop:
-            if check.building_age_group == element.building_age_group and \
-                    check.construction_type == element.construction_type:
-                element_binding.Rooftop.remove(check)
-                break
-
-    elif type(element).__name__ == 'Window':
+    Parameters
+    ----------
+    element : BuildingElement()
+        Instance of BuildingElement or inherited Element of TEASER
 
-        for check in element_binding.Window:
-            if check.building_age_group == element.building_age_group and \
-                    check.construction_type == element.construction_type:
-                element_binding.Window.remove(check)
-                break
+    Returns
+    ----------
+    pyxb_class :
+        Pyxb class representation of the element
+    """
 
-    out_file = open(utilities.get_full_path(data_class.path_tb), "w")
+    import teaser.data.bindings.v_0_6.typeelement_bind as tb_bind
 
-    out_file.write(element_binding.toDOM().toprettyxml())
+    pyxb_class = getattr(tb_bind, type(element).__name__ + "Type")()
+    _set_basic_data_pyxb(element=element,
+                         pyxb_class=pyxb_class)
+    pyxb_class.Layers = tb_bind.LayersType()
+    _set_layer_data_pyxb(element=element,
+                         pyxb_class=pyxb_class)
+    return pyxb_class
 
 
 def _set_basic_data_pyxb(element, pyxb_class):
@@ -349,6 +195,8 @@ def _set_layer_data_pyxb(element, pyxb_class):
         pyxb class representation of xml
     """
 
+    import teaser.data.bindings.v_0_6.typeelement_bind as tb_bind
+
     for layer in element.layer:
 
         pyxb_layer = tb_bind.layerType()
@@ -73,6 +73,8 @@ def export_ibpsa(
         library + '(version="' + prj.buildings[-1].library_attr.version[
             library] + '")']
 
+    path = utilities.create_path(path)
+
     lookup = TemplateLookup(directories=[utilities.get_full_path(
         os.path.join('data', 'output', 'modelicatemplate'))])
     model_template_1 = Template(
@@ -111,11 +113,8 @@ def export_ibpsa(
 
         assert bldg.used_library_calc == 'IBPSA', ass_error
 
-        bldg_path = os.path.join(path, bldg.name)
-
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path, bldg.name + "_Models")))
+        bldg_path = utilities.create_path(os.path.join(path, bldg.name))
+        utilities.create_path(os.path.join(bldg_path, bldg.name + "_Models"))
 
         ibpsa_output._help_package(
             path=bldg_path,
@@ -141,8 +140,8 @@ def export_ibpsa(
                 time_line=None,
                 path=zone_path)
 
-            out_file = open(utilities.get_full_path(os.path.join(
-                zone_path, bldg.name + '_' + zone.name + '.mo')), 'w')
+            out_file = open(os.path.join(
+                zone_path, bldg.name + '_' + zone.name + '.mo'), 'w')
 
             if type(zone.model_attr).__name__ == "OneElement":
                 out_file.write(model_template_1.render_unicode(zone=zone,
@@ -7,11 +7,6 @@ This module contains function to save material classes
 """
 import warnings
 
-import pyxb
-
-import teaser.data.bindings.v_0_6.material_bind as mat_bind
-import teaser.logic.utilities as utilities
-
 
 def save_material(material, data_class):
     """Material saver.
@@ -20,6 +15,8 @@ def save_material(material, data_class):
     elements. If the Project parent is set, it automatically saves it to
     the file given in Project.data. Alternatively you can specify a path to
     a file with Materials. If this file does not exist, a new file is created.
+    If the DataClass uses a CatalogDatabase, the material is added to the
+    database instead.
 
     Parameters
     ----------
@@ -32,43 +29,41 @@ def save_material(material, data_class):
         but the user can individually change that.
 
     """
-    mat_binding = data_class.material_bind
-    add_to_xml = True
-    mat_binding.version = "0.6"
     warning_text = ("Material with same name and same properties already "
                     "exists in XML, consider this material or revising your "
                     "properties")
 
+    if data_class.catalog_db is not None:
+        for check in data_class.catalog_db.find_materials_by_name(
+                material.name):
+            if _is_same_material(check, material):
+                warnings.warn(warning_text)
+                return
+        data_class.catalog_db.add_material(
+            _create_material_pyxb(material=material))
+        # reassign the binding to discard the outdated material index
+        data_class.material_bind = data_class.material_bind
+        return
+
+    mat_binding = data_class.own_binding("material_bind")
+    mat_binding.version = "0.6"
+
+    import pyxb.utils.domutils
+    import teaser.data.bindings.v_0_6.material_bind as mat_bind
+
     pyxb.utils.domutils.BindingDOMSupport.DeclareNamespace(
         mat_bind.Namespace, 'materials')
 
-    for check in mat_binding.Material:
-        if check.name == material.name and \
-                check.density == material.density and \
-                check.thermal_conduc == material.thermal_conduc and \
-                check.heat_capac == material.heat_capac and \
-                check.thickness_default == material.thickness_default and \
-                check.thickness_list == material.thickness_list:
+    for check in data_class.material_index.find_all_name(material.name):
+        if _is_same_material(check, material):
             warnings.warn(warning_text)
-            add_to_xml = False
-            break
-
-    if add_to_xml is True:
-        mat_pyxb = mat_bind.MaterialType()
+            return
 
-        mat_pyxb.name = material.name
-        mat_pyxb.density = material.density
-        mat_pyxb.thermal_conduc = material.thermal_conduc
-        mat_pyxb.heat_capac = material.heat_capac
-        mat_pyxb.material_id = material.material_id
-        mat_pyxb.thickness_default = material.thickness_default
-        mat_pyxb.thickness_list = material.thickness_list
-        mat_pyxb.solar_absorp = material.solar_absorp
+    mat_pyxb = _create_material_pyxb(material=material)
 
-        mat_binding.Material.append(mat_pyxb)
-        out_file = open(utilities.get_full_path(data_class.path_mat), "w")
-
-        out_file.write(mat_binding.toDOM().toprettyxml())
+    mat_binding.Material.append(mat_pyxb)
+    data_class.material_index.add(mat_pyxb)
+    data_class.binding_changed("material_bind")
 
 
 def modify_material(material, data_class):
@@ -76,7 +71,8 @@ def modify_material(material, data_class):
 
     Modifies material and their properties the XML file for type building
     elements. If the Project parent is set, it automatically modifies it to
-    the file given in Project.data.
+    the file given in Project.data. If the DataClass uses a
+    CatalogDatabase, the material is modified in the database instead.
 
     Parameters
     ----------
@@ -90,18 +86,81 @@ def modify_material(material, data_class):
 
     """
 
-    mat_binding = data_class.material_bind
-
-    for mat in mat_binding.Material:
-        if mat.material_id == material.material_id:
-            # mat_binding.Material.remove(mat)
-            mat.material_id = material.material_id
-            mat.name = material.name
-            mat.density = material.density
-            mat.thermal_conduc = material.thermal_conduc
-            mat.heat_capac = material.heat_capac
-            # mat_binding.Material.append(mat)"""
-            break
-
-    out_file = open(utilities.get_full_path(data_class.path_mat), "w")
-    out_file.write(mat_binding.toDOM().toprettyxml())
+    if data_class.catalog_db is not None:
+        data_class.catalog_db.update_material(
+            material_id=material.material_id,
+            name=material.name,
+            density=material.density,
+            thermal_conduc=material.thermal_conduc,
+            heat_capac=material.heat_capac)
+        # reassign the binding to discard the outdated material index
+        data_class.material_bind = data_class.material_bind
+        return
+
+    data_class.own_binding("material_bind")
+
+    mat = data_class.material_index.find_id(material.material_id)
+    if mat is not None:
+        old_name = mat.name
+        mat.material_id = material.material_id
+        mat.name = material.name
+        mat.density = material.density
+        mat.thermal_conduc = material.thermal_conduc
+        mat.heat_capac = material.heat_capac
+        data_class.material_index.rename(mat, old_name)
+
+    data_class.binding_changed("material_bind")
+
+
+def _is_same_material(check, material):
+    """Helper function for save_material to find duplicates.
+
+    Parameters
+    ----------
+    check :
+        Pyxb class representation of xml or Record of a material
+
+    material : Material()
+        instance of TEASERS Material class
+
+    Returns
+    ----------
+    same : bool
+        True if name and properties of both materials are equal
+    """
+
+    return check.name == material.name and \
+        check.density == material.density and \
+        check.thermal_conduc == material.thermal_conduc and \
+        check.heat_capac == material.heat_capac and \
+        check.thickness_default == material.thickness_default and \
+        check.thickness_list == material.thickness_list
+
+
+def _create_material_pyxb(material):
+    """Helper function for save_material to create a PyXB material.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+
+    Returns
+    ----------
+    mat_pyxb :
+        Pyxb class representation of the material
+    """
+
+    import teaser.data.bindings.v_0_6.material_bind as mat_bind
+
+    mat_pyxb = mat_bind.MaterialType()
+
+    mat_pyxb.name = material.name
+    mat_pyxb.density = material.density
+    mat_pyxb.thermal_conduc = material.thermal_conduc
+    mat_pyxb.heat_capac = material.heat_capac
+    mat_pyxb.material_id = material.material_id
+    mat_pyxb.thickness_default = material.thickness_default
+    mat_pyxb.thickness_list = material.thickness_list
+    mat_pyxb.solar_absorp = material.solar_absorp
+    return mat_pyxb
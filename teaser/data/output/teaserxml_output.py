@@ -392,7 +392,7 @@ def set_basic_data_pyxb(pyxb_class, element):
         pyxb_class.inner_convection = element.inner_convection
         pyxb_class.outer_radiation = element.outer_radiation
         pyxb_class.outer_convection = element.outer_convection
-        pyxb_class.g_Value = element.g_value
+        pyxb_class.g_value = element.g_value
         pyxb_class.a_conv = element.a_conv
         pyxb_class.shading_g_total = element.shading_g_total
         pyxb_class.shading_max_irr = element.shading_max_irr
@@ -61,10 +61,9 @@ def export_parameters_txt(prj, path):
         lookup=lookup)
 
     for bldg in prj.buildings:
-        bldg_path = os.path.join(
+        bldg_path = utilities.create_path(os.path.join(
             path,
-            bldg.name + "_txtOutput")
-        utilities.create_path(bldg_path)
+            bldg.name + "_txtOutput"))
         out_file = open(os.path.join(bldg_path, bldg.name + ".txt"), 'w')
 
         if type(bldg.thermal_zones[0].model_attr).__name__ == "OneElement":
@@ -0,0 +1,60 @@
+# Created October 2026
+# TEASER 4 Development Team
+
+"""This module measures the time needed to import teaser.project. The import
+runs in a fresh interpreter for each repetition (5 by default), so modules
+cached by an earlier import do not distort the result.
+"""
+
+import subprocess
+import sys
+
+
+def import_benchmark(repetitions=5):
+    """Imports teaser.project in fresh interpreters and measures the time
+
+    Parameters
+    ----------
+
+    repetitions : int
+        Number of interpreters importing teaser.project, default is 5
+
+    Returns
+    -------
+
+    durations : list
+        Time in s needed for the import, one per repetition
+    modules : int
+        Number of modules loaded by the import
+
+    """
+
+    script = (
+        "import sys, time\n"
+        "before = len(sys.modules)\n"
+        "start = time.time()\n"
+        "import teaser.project\n"
+        "print(time.time() - start)\n"
+        "print(len(sys.modules) - before)\n")
+
+    durations = []
+    modules = 0
+    for repetition in range(repetitions):
+        output = subprocess.check_output([sys.executable, "-c", script])
+        duration, modules = output.decode("utf-8").split()
+        durations.append(float(duration))
+        modules = int(modules)
+
+    return durations, modules
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        repetitions = int(sys.argv[1])
+    else:
+        repetitions = 5
+
+    durations, modules = import_benchmark(repetitions)
+
+    print("import teaser.project: {:.3f} s (best of {}), {} modules loaded"
+          .format(min(durations), repetitions, modules))
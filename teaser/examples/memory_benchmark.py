@@ -0,0 +1,72 @@
+# Created October 2026
+# TEASER 4 Development Team
+
+"""This module measures the memory a large building stock takes before any
+calculation starts. It generates a number of residential archetype buildings
+(10000 by default) and reports the memory allocated by Python objects,
+traced with tracemalloc, and the time needed for the generation.
+"""
+
+import sys
+import time
+import tracemalloc
+
+
+def memory_benchmark(number_of_buildings=10000):
+    """Generates a residential building stock and measures its memory
+
+    Parameters
+    ----------
+
+    number_of_buildings : int
+        Number of archetype buildings to generate, default is 10000
+
+    Returns
+    -------
+
+    prj : Project
+        The project holding the generated buildings
+    memory : float
+        Memory in MB allocated for the building stock
+    duration : float
+        Time in s needed for the generation
+
+    """
+
+    from teaser.project import Project
+
+    prj = Project(load_data=True)
+    prj.name = "MemoryBenchmark"
+
+    tracemalloc.start()
+    start = time.time()
+
+    for number in range(number_of_buildings):
+        prj.add_residential(
+            method='iwu',
+            usage='single_family_dwelling',
+            name="ResidentialBuilding" + str(number),
+            year_of_construction=1900 + number % 110,
+            number_of_floors=1 + number % 3,
+            height_of_floors=3.0,
+            net_leased_area=100.0 + number % 200,
+            with_ahu=False)
+
+    duration = time.time() - start
+    memory = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+
+    return prj, memory, duration
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        number_of_buildings = int(sys.argv[1])
+    else:
+        number_of_buildings = 10000
+
+    prj, memory, duration = memory_benchmark(number_of_buildings)
+
+    print("{} buildings: {:.1f} MB ({:.1f} kB per building) in {:.1f} s"
+          .format(number_of_buildings, memory,
+                  memory * 1000 / number_of_buildings, duration))
@@ -147,6 +147,8 @@ class SingleFamilyDwelling(Residential):
         Estimation factor to calculate heated cellar area
     """
 
+    used_statistic = 'iwu'
+
     def __init__(
             self,
             parent,
@@ -306,188 +308,190 @@ class SingleFamilyDwelling(Residential):
         With given values, this class generates a archetype building for
         single family dwellings according to TEASER requirements
         """
-        # help area for the correct building area setting while using typeBldgs
-        self.thermal_zones = None
-        type_bldg_area = self.net_leased_area
-        self.net_leased_area = 0.0
+        with self.bulk_edit():
+            # help area for the correct building area setting while using
+            # typeBldgs
+            self.thermal_zones = None
+            type_bldg_area = self.net_leased_area
+            self.net_leased_area = 0.0
 
-        self._number_of_heated_floors = self._est_factor_heated_cellar + \
-            self.number_of_floors + self.est_living_area_factor \
-            * self._est_factor_heated_attic
+            self._number_of_heated_floors = self._est_factor_heated_cellar + \
+                self.number_of_floors + self.est_living_area_factor \
+                * self._est_factor_heated_attic
 
-        self._living_area_per_floor = type_bldg_area / \
-            self._number_of_heated_floors
+            self._living_area_per_floor = type_bldg_area / \
+                self._number_of_heated_floors
 
-        self._est_ground_floor_area = self.est_bottom_building_closure * \
-            self._living_area_per_floor
+            self._est_ground_floor_area = self.est_bottom_building_closure * \
+                self._living_area_per_floor
 
-        self._est_roof_area = self.est_upper_building_closure * \
-            self._est_factor_dormer * self._est_area_per_floor * \
-            self._living_area_per_floor
+            self._est_roof_area = self.est_upper_building_closure * \
+                self._est_factor_dormer * self._est_area_per_floor * \
+                self._living_area_per_floor
 
-        self._top_floor_area = self._est_area_per_roof * \
-            self._living_area_per_floor
+            self._top_floor_area = self._est_area_per_roof * \
+                self._living_area_per_floor
 
-        if self._est_roof_area == 0:
-            self._est_roof_area = self._top_floor_area
+            if self._est_roof_area == 0:
+                self._est_roof_area = self._top_floor_area
 
-        self._est_facade_area = self._est_facade_to_floor_area * \
-            self._living_area_per_floor + self._est_extra_floor_area
+            self._est_facade_area = self._est_facade_to_floor_area * \
+                self._living_area_per_floor + self._est_extra_floor_area
 
-        self._est_win_area = self.est_factor_win_area * type_bldg_area
+            self._est_win_area = self.est_factor_win_area * type_bldg_area
 
-        self._est_cellar_wall_area = self.est_factor_cellar_area * \
-            self._est_factor_heated_cellar * self._est_facade_area
+            self._est_cellar_wall_area = self.est_factor_cellar_area * \
+                self._est_factor_heated_cellar * self._est_facade_area
 
-        self._est_outer_wall_area = (self._number_of_heated_floors *
-                                     self._est_facade_area) - \
-            self._est_cellar_wall_area - \
-            self._est_win_area
+            self._est_outer_wall_area = (self._number_of_heated_floors *
+                                         self._est_facade_area) - \
+                self._est_cellar_wall_area - \
+                self._est_win_area
 
-        # self._est_factor_volume = type_bldg_area * 2.5
+            # self._est_factor_volume = type_bldg_area * 2.5
 
-        for key, value in self.zone_area_factors.items():
-            zone = ThermalZone(self)
-            zone.name = key
-            zone.area = type_bldg_area * value[0]
-            use_cond = UseCond(zone)
-            use_cond.load_use_conditions(value[1],
-                                         data_class=self.parent.data)
+            for key, value in self.zone_area_factors.items():
+                zone = ThermalZone(self)
+                zone.name = key
+                zone.area = type_bldg_area * value[0]
+                use_cond = UseCond(zone)
+                use_cond.load_use_conditions(value[1],
+                                             data_class=self.parent.data)
 
-            zone.use_conditions = use_cond
-            zone.use_conditions.with_ahu = False
-            zone.use_conditions.persons *= zone.area * 0.01
-            zone.use_conditions.machines *= zone.area * 0.01
-
-        for key, value in self.outer_wall_names.items():
-            # North and South
-
-            if value[1] == 0 or value[1] == 180.0:
-                self.outer_area[value[1]] = self._est_outer_wall_area / \
-                    self.nr_of_orientation
-            # East and West
-            elif value[1] == 90 or value[1] == 270:
-
-                self.outer_area[value[1]] = self._est_outer_wall_area / \
-                    self.nr_of_orientation
-
-            for zone in self.thermal_zones:
-                # create wall and set building elements
-                outer_wall = OuterWall(zone)
-                outer_wall.load_type_element(
-                    year=self.year_of_construction,
-                    construction=self.construction_type,
-                    data_class=self.parent.data)
-                outer_wall.name = key
-                outer_wall.tilt = value[0]
-                outer_wall.orientation = value[1]
+                zone.use_conditions = use_cond
+                zone.use_conditions.with_ahu = False
+                zone.use_conditions.persons *= zone.area * 0.01
+                zone.use_conditions.machines *= zone.area * 0.01
 
-        for key, value in self.window_names.items():
+            for key, value in self.outer_wall_names.items():
+                # North and South
 
-            if value[1] == 0 or value[1] == 180:
+                if value[1] == 0 or value[1] == 180.0:
+                    self.outer_area[value[1]] = self._est_outer_wall_area / \
+                        self.nr_of_orientation
+                # East and West
+                elif value[1] == 90 or value[1] == 270:
 
-                self.window_area[value[1]] = self._est_win_area / \
-                    self.nr_of_orientation
+                    self.outer_area[value[1]] = self._est_outer_wall_area / \
+                        self.nr_of_orientation
 
-            elif value[1] == 90 or value[1] == 270:
+                for zone in self.thermal_zones:
+                    # create wall and set building elements
+                    outer_wall = OuterWall(zone)
+                    outer_wall.load_type_element(
+                        year=self.year_of_construction,
+                        construction=self.construction_type,
+                        data_class=self.parent.data)
+                    outer_wall.name = key
+                    outer_wall.tilt = value[0]
+                    outer_wall.orientation = value[1]
 
-                self.window_area[value[1]] = self._est_win_area / \
-                    self.nr_of_orientation
+            for key, value in self.window_names.items():
 
-            '''
-            There is no real classification for windows, so this is a bit hard
-            code - will be fixed sometime
-            '''
-            for zone in self.thermal_zones:
-                window = Window(zone)
+                if value[1] == 0 or value[1] == 180:
 
-                window.load_type_element(self.year_of_construction,
-                                         "Kunststofffenster, "
-                                         "Isolierverglasung",
-                                         data_class=self.parent.data)
-                window.name = key
-                window.tilt = value[0]
-                window.orientation = value[1]
-
-        for key, value in self.roof_names.items():
+                    self.window_area[value[1]] = self._est_win_area / \
+                        self.nr_of_orientation
 
-            self.outer_area[value[1]] = self._est_roof_area
+                elif value[1] == 90 or value[1] == 270:
 
-            for zone in self.thermal_zones:
-                roof = Rooftop(zone)
-                roof.load_type_element(
-                    year=self.year_of_construction,
-                    construction=self.construction_type,
-                    data_class=self.parent.data)
-                roof.name = key
-                roof.tilt = value[0]
-                roof.orientation = value[1]
+                    self.window_area[value[1]] = self._est_win_area / \
+                        self.nr_of_orientation
 
-        for key, value in self.ground_floor_names.items():
+                '''
+                There is no real classification for windows, so this is a bit
+                hard code - will be fixed sometime
+                '''
+                for zone in self.thermal_zones:
+                    window = Window(zone)
 
-            self.outer_area[value[1]] = self._est_ground_floor_area
+                    window.load_type_element(self.year_of_construction,
+                                             "Kunststofffenster, "
+                                             "Isolierverglasung",
+                                             data_class=self.parent.data)
+                    window.name = key
+                    window.tilt = value[0]
+                    window.orientation = value[1]
 
-            for zone in self.thermal_zones:
-                ground_floor = GroundFloor(zone)
-                ground_floor.load_type_element(
-                    year=self.year_of_construction,
-                    construction=self.construction_type,
-                    data_class=self.parent.data)
-                ground_floor.name = key
-                ground_floor.tilt = value[0]
-                ground_floor.orientation = value[1]
+            for key, value in self.roof_names.items():
 
-        for key, value in self.inner_wall_names.items():
+                self.outer_area[value[1]] = self._est_roof_area
 
-            for zone in self.thermal_zones:
-                inner_wall = InnerWall(zone)
-                inner_wall.load_type_element(
-                    year=self.year_of_construction,
-                    construction=self.construction_type,
-                    data_class=self.parent.data)
-                inner_wall.name = key
-                inner_wall.tilt = value[0]
-                inner_wall.orientation = value[1]
-                # zone.inner_walls.append(inner_wall)
+                for zone in self.thermal_zones:
+                    roof = Rooftop(zone)
+                    roof.load_type_element(
+                        year=self.year_of_construction,
+                        construction=self.construction_type,
+                        data_class=self.parent.data)
+                    roof.name = key
+                    roof.tilt = value[0]
+                    roof.orientation = value[1]
 
-        if self.number_of_floors > 1:
+            for key, value in self.ground_floor_names.items():
 
-            for key, value in self.ceiling_names.items():
+                self.outer_area[value[1]] = self._est_ground_floor_area
 
                 for zone in self.thermal_zones:
-                    ceiling = Ceiling(zone)
-                    ceiling.load_type_element(
+                    ground_floor = GroundFloor(zone)
+                    ground_floor.load_type_element(
                         year=self.year_of_construction,
                         construction=self.construction_type,
                         data_class=self.parent.data)
-                    ceiling.name = key
-                    ceiling.tilt = value[0]
-                    ceiling.orientation = value[1]
-                    # zone.inner_walls.append(ceiling)
+                    ground_floor.name = key
+                    ground_floor.tilt = value[0]
+                    ground_floor.orientation = value[1]
 
-            for key, value in self.floor_names.items():
+            for key, value in self.inner_wall_names.items():
 
                 for zone in self.thermal_zones:
-                    floor = Floor(zone)
-                    floor.load_type_element(
+                    inner_wall = InnerWall(zone)
+                    inner_wall.load_type_element(
                         year=self.year_of_construction,
                         construction=self.construction_type,
                         data_class=self.parent.data)
-                    floor.name = key
-                    floor.tilt = value[0]
-                    floor.orientation = value[1]
-                    # zone.inner_walls.append(floor)
-        else:
-            pass
+                    inner_wall.name = key
+                    inner_wall.tilt = value[0]
+                    inner_wall.orientation = value[1]
+                    # zone.inner_walls.append(inner_wall)
 
-        for key, value in self.outer_area.items():
-            self.set_outer_wall_area(value, key)
-        for key, value in self.window_area.items():
-            self.set_window_area(value, key)
+            if self.number_of_floors > 1:
 
-        for zone in self.thermal_zones:
-            zone.set_inner_wall_area()
-            zone.set_volume_zone()
+                for key, value in self.ceiling_names.items():
+
+                    for zone in self.thermal_zones:
+                        ceiling = Ceiling(zone)
+                        ceiling.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self.construction_type,
+                            data_class=self.parent.data)
+                        ceiling.name = key
+                        ceiling.tilt = value[0]
+                        ceiling.orientation = value[1]
+                        # zone.inner_walls.append(ceiling)
+
+                for key, value in self.floor_names.items():
+
+                    for zone in self.thermal_zones:
+                        floor = Floor(zone)
+                        floor.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self.construction_type,
+                            data_class=self.parent.data)
+                        floor.name = key
+                        floor.tilt = value[0]
+                        floor.orientation = value[1]
+                        # zone.inner_walls.append(floor)
+            else:
+                pass
+
+            for key, value in self.outer_area.items():
+                self.set_outer_wall_area(value, key)
+            for key, value in self.window_area.items():
+                self.set_window_area(value, key)
+
+            for zone in self.thermal_zones:
+                zone.set_inner_wall_area()
+                zone.set_volume_zone()
 
     def generate_from_gml(self):
         """Enriches lod1 or lod2 data from CityGML
@@ -90,6 +90,8 @@ class SingleFamilyHouse(Residential):
                 TABULA
     """
 
+    used_statistic = 'tabula_de'
+
     def __init__(
             self,
             parent,
@@ -318,217 +320,209 @@ class SingleFamilyHouse(Residential):
         With given values, this function generates an archetype building for
         Tabula Single Family House.
         """
-        self.thermal_zones = None
-        self._check_year_of_construction()
-        # help area for the correct building area setting while using typeBldgs
-        type_bldg_area = self.net_leased_area
-        self.net_leased_area = 0.0
-
-        for key, value in self.zone_area_factors.items():
-            zone = ThermalZone(parent=self)
-            zone.name = key
-            zone.area = type_bldg_area * value[0]
-            use_cond = UseCond(parent=zone)
-            use_cond.load_use_conditions(
-                zone_usage=value[1])
-            zone.use_conditions = use_cond
-
-            zone.use_conditions.with_ahu = False
-            zone.use_conditions.persons *= zone.area * 0.01
-            zone.use_conditions.machines *= zone.area * 0.01
-
-        if self.facade_estimation_factors[self.building_age_group]['ow1'] != 0:
-            for key, value in self._outer_wall_names_1.items():
-                for zone in self.thermal_zones:
-                    outer_wall = OuterWall(zone)
-                    outer_wall.load_type_element(
-                        year=self.year_of_construction,
-                        construction=self._construction_type_1,
-                        data_class=self.parent.data)
-                    outer_wall.name = key
-                    outer_wall.tilt = value[0]
-                    outer_wall.orientation = value[1]
-                    outer_wall.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group]['ow1'] * type_bldg_area) /
-                        len(self._outer_wall_names_1))
-
-        if self.facade_estimation_factors[self.building_age_group]['ow2'] != 0:
-            for key, value in self._outer_wall_names_2.items():
-                for zone in self.thermal_zones:
-                    outer_wall = OuterWall(zone)
-                    outer_wall.load_type_element(
-                        year=self.year_of_construction,
-                        construction=self._construction_type_2,
-                        data_class=self.parent.data)
-                    outer_wall.name = key
-                    outer_wall.tilt = value[0]
-                    outer_wall.orientation = value[1]
-                    outer_wall.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group]['ow2'] * type_bldg_area) /
-                        len(self._outer_wall_names_2))
-
-        if self.facade_estimation_factors[self.building_age_group]['win1'] != 0:
-            for key, value in self.window_names_1.items():
-                for zone in self.thermal_zones:
-                    window = Window(zone)
-                    window.load_type_element(
-                        self.year_of_construction,
-                        construction=self._construction_type_1,
-                        data_class=self.parent.data)
-                    window.name = key
-                    window.tilt = value[0]
-                    window.orientation = value[1]
-                    window.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group][
-                            'win1'] * type_bldg_area) /
-                        len(self.window_names_1))
-
-        if self.facade_estimation_factors[self.building_age_group]['win2'] != 0:
-            for key, value in self.window_names_2.items():
-                for zone in self.thermal_zones:
-                    window = Window(zone)
-                    window.load_type_element(
-                        self.year_of_construction,
-                        construction=self._construction_type_2,
-                        data_class=self.parent.data)
-                    window.name = key
-                    window.tilt = value[0]
-                    window.orientation = value[1]
-                    window.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group][
-                            'win2'] * type_bldg_area) /
-                        len(self.window_names_2))
-
-        if self.facade_estimation_factors[self.building_age_group]['gf1'] != 0:
-            for key, value in self.ground_floor_names_1.items():
-
-                for zone in self.thermal_zones:
-                    gf = GroundFloor(zone)
-                    gf.load_type_element(
-                        year=self.year_of_construction,
-                        construction=self._construction_type_1,
-                        data_class=self.parent.data)
-                    gf.name = key
-                    gf.tilt = value[0]
-                    gf.orientation = value[1]
-                    gf.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group]['gf1'] * type_bldg_area) /
-                        len(self.ground_floor_names_1))
-
-        if self.facade_estimation_factors[self.building_age_group]['gf2'] != 0:
-            for key, value in self.ground_floor_names_2.items():
-
-                for zone in self.thermal_zones:
-                    gf = GroundFloor(zone)
-                    gf.load_type_element(
-                        year=self.year_of_construction,
-                        construction=self._construction_type_2,
-                        data_class=self.parent.data)
-                    gf.name = key
-                    gf.tilt = value[0]
-                    gf.orientation = value[1]
-                    gf.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group]['gf2'] * type_bldg_area) /
-                        len(self.ground_floor_names_2))
-
-        if self.facade_estimation_factors[self.building_age_group]['rt1'] != 0:
-            for key, value in self.roof_names_1.items():
+        with self.bulk_edit():
+            self.thermal_zones = None
+            self._check_year_of_construction()
+            # help area for the correct building area setting while using
+            # typeBldgs
+            type_bldg_area = self.net_leased_area
+            self.net_leased_area = 0.0
+            factors = self.facade_estimation_factors[self.building_age_group]
+
+            for key, value in self.zone_area_factors.items():
+                zone = ThermalZone(parent=self)
+                zone.name = key
+                zone.area = type_bldg_area * value[0]
+                use_cond = UseCond(parent=zone)
+                use_cond.load_use_conditions(
+                    zone_usage=value[1])
+                zone.use_conditions = use_cond
+
+                zone.use_conditions.with_ahu = False
+                zone.use_conditions.persons *= zone.area * 0.01
+                zone.use_conditions.machines *= zone.area * 0.01
+
+            if factors['ow1'] != 0:
+                for key, value in self._outer_wall_names_1.items():
+                    for zone in self.thermal_zones:
+                        outer_wall = OuterWall(zone)
+                        outer_wall.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self._construction_type_1,
+                            data_class=self.parent.data)
+                        outer_wall.name = key
+                        outer_wall.tilt = value[0]
+                        outer_wall.orientation = value[1]
+                        outer_wall.area = (
+                            (factors['ow1'] * type_bldg_area) /
+                            len(self._outer_wall_names_1))
+
+            if factors['ow2'] != 0:
+                for key, value in self._outer_wall_names_2.items():
+                    for zone in self.thermal_zones:
+                        outer_wall = OuterWall(zone)
+                        outer_wall.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self._construction_type_2,
+                            data_class=self.parent.data)
+                        outer_wall.name = key
+                        outer_wall.tilt = value[0]
+                        outer_wall.orientation = value[1]
+                        outer_wall.area = (
+                            (factors['ow2'] * type_bldg_area) /
+                            len(self._outer_wall_names_2))
+
+            if factors['win1'] != 0:
+                for key, value in self.window_names_1.items():
+                    for zone in self.thermal_zones:
+                        window = Window(zone)
+                        window.load_type_element(
+                            self.year_of_construction,
+                            construction=self._construction_type_1,
+                            data_class=self.parent.data)
+                        window.name = key
+                        window.tilt = value[0]
+                        window.orientation = value[1]
+                        window.area = (
+                            (factors['win1'] * type_bldg_area) /
+                            len(self.window_names_1))
+
+            if factors['win2'] != 0:
+                for key, value in self.window_names_2.items():
+                    for zone in self.thermal_zones:
+                        window = Window(zone)
+                        window.load_type_element(
+                            self.year_of_construction,
+                            construction=self._construction_type_2,
+                            data_class=self.parent.data)
+                        window.name = key
+                        window.tilt = value[0]
+                        window.orientation = value[1]
+                        window.area = (
+                            (factors['win2'] * type_bldg_area) /
+                            len(self.window_names_2))
+
+            if factors['gf1'] != 0:
+                for key, value in self.ground_floor_names_1.items():
+
+                    for zone in self.thermal_zones:
+                        gf = GroundFloor(zone)
+                        gf.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self._construction_type_1,
+                            data_class=self.parent.data)
+                        gf.name = key
+                        gf.tilt = value[0]
+                        gf.orientation = value[1]
+                        gf.area = (
+                            (factors['gf1'] * type_bldg_area) /
+                            len(self.ground_floor_names_1))
+
+            if factors['gf2'] != 0:
+                for key, value in self.ground_floor_names_2.items():
+
+                    for zone in self.thermal_zones:
+                        gf = GroundFloor(zone)
+                        gf.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self._construction_type_2,
+                            data_class=self.parent.data)
+                        gf.name = key
+                        gf.tilt = value[0]
+                        gf.orientation = value[1]
+                        gf.area = (
+                            (factors['gf2'] * type_bldg_area) /
+                            len(self.ground_floor_names_2))
+
+            if factors['rt1'] != 0:
+                for key, value in self.roof_names_1.items():
+
+                    for zone in self.thermal_zones:
+                        rt = Rooftop(zone)
+                        rt.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self._construction_type_1,
+                            data_class=self.parent.data)
+                        rt.name = key
+                        rt.tilt = value[0]
+                        rt.orientation = value[1]
+                        rt.area = (
+                            (factors['rt1'] * type_bldg_area) /
+                            len(self.roof_names_1))
+
+            if factors['rt2'] != 0:
+                for key, value in self.roof_names_2.items():
+
+                    for zone in self.thermal_zones:
+                        rt = Rooftop(zone)
+                        rt.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self._construction_type_2,
+                            data_class=self.parent.data)
+                        rt.name = key
+                        rt.tilt = value[0]
+                        rt.orientation = value[1]
+                        rt.area = (
+                            (factors['rt2'] * type_bldg_area) /
+                            len(self.roof_names_2))
+
+            if factors['door'] != 0:
+                for key, value in self.door_names.items():
+
+                    for zone in self.thermal_zones:
+                        door = Door(zone)
+                        door.load_type_element(
+                            year=self.year_of_construction,
+                            construction=self._construction_type_1,
+                            data_class=self.parent.data)
+                        door.name = key
+                        door.tilt = value[0]
+                        door.orientation = value[1]
+                        door.area = (
+                            (factors['door'] * type_bldg_area) /
+                            len(self.door_names))
+
+            for key, value in self.inner_wall_names.items():
 
                 for zone in self.thermal_zones:
-                    rt = Rooftop(zone)
-                    rt.load_type_element(
-                        year=self.year_of_construction,
-                        construction=self._construction_type_1,
-                        data_class=self.parent.data)
-                    rt.name = key
-                    rt.tilt = value[0]
-                    rt.orientation = value[1]
-                    rt.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group]['rt1'] * type_bldg_area) /
-                        len(self.roof_names_1))
-
-        if self.facade_estimation_factors[self.building_age_group]['rt2'] != 0:
-            for key, value in self.roof_names_2.items():
-
-                for zone in self.thermal_zones:
-                    rt = Rooftop(zone)
-                    rt.load_type_element(
-                        year=self.year_of_construction,
-                        construction=self._construction_type_2,
-                        data_class=self.parent.data)
-                    rt.name = key
-                    rt.tilt = value[0]
-                    rt.orientation = value[1]
-                    rt.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group]['rt2'] * type_bldg_area) /
-                        len(self.roof_names_2))
-
-        if self.facade_estimation_factors[self.building_age_group]['door'] != 0:
-            for key, value in self.door_names.items():
-
-                for zone in self.thermal_zones:
-                    door = Door(zone)
-                    door.load_type_element(
-                        year=self.year_of_construction,
-                        construction=self._construction_type_1,
-                        data_class=self.parent.data)
-                    door.name = key
-                    door.tilt = value[0]
-                    door.orientation = value[1]
-                    door.area = (
-                        (self.facade_estimation_factors[
-                            self.building_age_group]['door'] *
-                         type_bldg_area) / len(self.door_names))
-
-        for key, value in self.inner_wall_names.items():
-
-            for zone in self.thermal_zones:
-                inner_wall = InnerWall(zone)
-                inner_wall.load_type_element(
-                    year=self.year_of_construction,
-                    construction="tabula_standard",
-                    data_class=self.parent.data)
-                inner_wall.name = key
-                inner_wall.tilt = value[0]
-                inner_wall.orientation = value[1]
-
-        if self.number_of_floors > 1:
-
-            for key, value in self.ceiling_names.items():
-
-                for zone in self.thermal_zones:
-                    ceiling = Ceiling(zone)
-                    ceiling.load_type_element(
+                    inner_wall = InnerWall(zone)
+                    inner_wall.load_type_element(
                         year=self.year_of_construction,
                         construction="tabula_standard",
                         data_class=self.parent.data)
-                    ceiling.name = key
-                    ceiling.tilt = value[0]
-                    ceiling.orientation = value[1]
-
-            for key, value in self.floor_names.items():
+                    inner_wall.name = key
+                    inner_wall.tilt = value[0]
+                    inner_wall.orientation = value[1]
+
+            if self.number_of_floors > 1:
+
+                for key, value in self.ceiling_names.items():
+
+                    for zone in self.thermal_zones:
+                        ceiling = Ceiling(zone)
+                        ceiling.load_type_element(
+                            year=self.year_of_construction,
+                            construction="tabula_standard",
+                            data_class=self.parent.data)
+                        ceiling.name = key
+                        ceiling.tilt = value[0]
+                        ceiling.orientation = value[1]
+
+                for key, value in self.floor_names.items():
+
+                    for zone in self.thermal_zones:
+                        floor = Floor(zone)
+                        floor.load_type_element(
+                            year=self.year_of_construction,
+                            construction="tabula_standard",
+                            data_class=self.parent.data)
+                        floor.name = key
+                        floor.tilt = value[0]
+                        floor.orientation = value[1]
 
-                for zone in self.thermal_zones:
-                    floor = Floor(zone)
-                    floor.load_type_element(
-                        year=self.year_of_construction,
-                        construction="tabula_standard",
-                        data_class=self.parent.data)
-                    floor.name = key
-                    floor.tilt = value[0]
-                    floor.orientation = value[1]
-
-        for zone in self.thermal_zones:
-            zone.set_inner_wall_area()
-            zone.set_volume_zone()
+            for zone in self.thermal_zones:
+                zone.set_inner_wall_area()
+                zone.set_volume_zone()
 
     @property
     def construction_type(self):
@@ -102,6 +102,8 @@ class EST1a(Residential):
 
     """
 
+    used_statistic = 'iwu'
+
     def __init__(
             self,
             parent,
@@ -201,151 +203,154 @@ class EST1a(Residential):
         building according to TEASER requirements.
 
         """
-        # help area for the correct building area setting while using typeBldgs
-        self.thermal_zones = None
-        type_bldg_area = self.net_leased_area
-        self.net_leased_area = 0.0
-
-        self._est_ground_floor_area = type_bldg_area / self.number_of_floors
-
-        self._est_roof_area = type_bldg_area / self.number_of_floors
-
-        self._est_win_area = self.est_factor_win_area * type_bldg_area * \
-            (1 - self._est_factor_neighbour / 4)
-
-        self._est_outer_wall_area = (self.est_factor_facade_to_volume *
-                                     type_bldg_area *
-                                     self.height_of_floors -
-                                     self._est_ground_floor_area -
-                                     self._est_roof_area -
-                                     self._est_win_area) *\
-            (1 - self._est_factor_neighbour / 4)
-
-        for key, value in self.zone_area_factors.items():
-            zone = ThermalZone(self)
-            zone.name = key
-            zone.area = type_bldg_area * value[0]
-            use_cond = UseCond(zone)
-            use_cond.load_use_conditions(value[1])
-
-            zone.use_conditions = use_cond
-
-        for key, value in self.outer_wall_names.items():
-            # North and South
-
-            if value[1] == 0 or value[1] == 180.0:
-                self.outer_area[value[1]] = self._est_outer_wall_area / \
-                    self.nr_of_orientation
-            # East and West
-            elif value[1] == 90 or value[1] == 270:
-
-                self.outer_area[value[1]] = self._est_outer_wall_area / \
-                    self.nr_of_orientation
-
-            for zone in self.thermal_zones:
-                # create wall and set building elements
-                outer_wall = OuterWall(zone)
-                outer_wall.load_type_element(self.year_of_construction,
-                                             self.construction_type)
-                outer_wall.name = key
-                outer_wall.tilt = value[0]
-                outer_wall.orientation = value[1]
-
-        for key, value in self.window_names.items():
+        with self.bulk_edit():
+            # help area for the correct building area setting while using
+            # typeBldgs
+            self.thermal_zones = None
+            type_bldg_area = self.net_leased_area
+            self.net_leased_area = 0.0
+
+            self._est_ground_floor_area = \
+                type_bldg_area / self.number_of_floors
+
+            self._est_roof_area = type_bldg_area / self.number_of_floors
+
+            self._est_win_area = self.est_factor_win_area * type_bldg_area * \
+                (1 - self._est_factor_neighbour / 4)
+
+            self._est_outer_wall_area = (self.est_factor_facade_to_volume *
+                                         type_bldg_area *
+                                         self.height_of_floors -
+                                         self._est_ground_floor_area -
+                                         self._est_roof_area -
+                                         self._est_win_area) *\
+                (1 - self._est_factor_neighbour / 4)
+
+            for key, value in self.zone_area_factors.items():
+                zone = ThermalZone(self)
+                zone.name = key
+                zone.area = type_bldg_area * value[0]
+                use_cond = UseCond(zone)
+                use_cond.load_use_conditions(value[1])
+
+                zone.use_conditions = use_cond
+
+            for key, value in self.outer_wall_names.items():
+                # North and South
+
+                if value[1] == 0 or value[1] == 180.0:
+                    self.outer_area[value[1]] = self._est_outer_wall_area / \
+                        self.nr_of_orientation
+                # East and West
+                elif value[1] == 90 or value[1] == 270:
+
+                    self.outer_area[value[1]] = self._est_outer_wall_area / \
+                        self.nr_of_orientation
 
-            if value[1] == 0 or value[1] == 180:
-
-                self.window_area[value[1]] = self._est_win_area / \
-                    self.nr_of_orientation
-
-            elif value[1] == 90 or value[1] == 270:
+                for zone in self.thermal_zones:
+                    # create wall and set building elements
+                    outer_wall = OuterWall(zone)
+                    outer_wall.load_type_element(self.year_of_construction,
+                                                 self.construction_type)
+                    outer_wall.name = key
+                    outer_wall.tilt = value[0]
+                    outer_wall.orientation = value[1]
 
-                self.window_area[value[1]] = self._est_win_area / \
-                    self.nr_of_orientation
+            for key, value in self.window_names.items():
 
-            '''
-            There is no real classification for windows, so this is a bit hard
-            code - will be fixed sometime
-            '''
-            for zone in self.thermal_zones:
-                window = Window(zone)
+                if value[1] == 0 or value[1] == 180:
 
-                window.load_type_element(self.year_of_construction,
-                                         "Kunststofffenster, Isolierverglasung"
-                                         )
-                window.name = key
-                window.tilt = value[0]
-                window.orientation = value[1]
+                    self.window_area[value[1]] = self._est_win_area / \
+                        self.nr_of_orientation
 
-        for key, value in self.roof_names.items():
+                elif value[1] == 90 or value[1] == 270:
 
-            self.outer_area[value[1]] = self._est_roof_area
+                    self.window_area[value[1]] = self._est_win_area / \
+                        self.nr_of_orientation
 
-            for zone in self.thermal_zones:
-                roof = Rooftop(zone)
-                roof.load_type_element(self.year_of_construction,
-                                       self.construction_type)
-                roof.name = key
-                roof.tilt = value[0]
-                roof.orientation = value[1]
+                '''
+                There is no real classification for windows, so this is a bit
+                hard code - will be fixed sometime
+                '''
+                for zone in self.thermal_zones:
+                    window = Window(zone)
 
-        for key, value in self.ground_floor_names.items():
+                    window.load_type_element(
+                        self.year_of_construction,
+                        "Kunststofffenster, Isolierverglasung")
+                    window.name = key
+                    window.tilt = value[0]
+                    window.orientation = value[1]
 
-            self.outer_area[value[1]] = self._est_ground_floor_area
+            for key, value in self.roof_names.items():
 
-            for zone in self.thermal_zones:
-                ground_floor = GroundFloor(zone)
-                ground_floor.load_type_element(self.year_of_construction,
-                                               self.construction_type)
-                ground_floor.name = key
-                ground_floor.tilt = value[0]
-                ground_floor.orientation = value[1]
+                self.outer_area[value[1]] = self._est_roof_area
 
-        for key, value in self.inner_wall_names.items():
-
-            for zone in self.thermal_zones:
-                inner_wall = InnerWall(zone)
-                inner_wall.load_type_element(self.year_of_construction,
-                                             self.construction_type)
-                inner_wall.name = key
-                inner_wall.tilt = value[0]
-                inner_wall.orientation = value[1]
-                # zone.inner_walls.append(inner_wall)
+                for zone in self.thermal_zones:
+                    roof = Rooftop(zone)
+                    roof.load_type_element(self.year_of_construction,
+                                           self.construction_type)
+                    roof.name = key
+                    roof.tilt = value[0]
+                    roof.orientation = value[1]
 
-        if self.number_of_floors > 1:
+            for key, value in self.ground_floor_names.items():
 
-            for key, value in self.ceiling_names.items():
+                self.outer_area[value[1]] = self._est_ground_floor_area
 
                 for zone in self.thermal_zones:
-                    ceiling = Ceiling(zone)
-                    ceiling.load_type_element(self.year_of_construction,
-                                              self.construction_type)
-                    ceiling.name = key
-                    ceiling.tilt = value[0]
-                    ceiling.orientation = value[1]
-                    # zone.inner_walls.append(ceiling)
+                    ground_floor = GroundFloor(zone)
+                    ground_floor.load_type_element(self.year_of_construction,
+                                                   self.construction_type)
+                    ground_floor.name = key
+                    ground_floor.tilt = value[0]
+                    ground_floor.orientation = value[1]
 
-            for key, value in self.floor_names.items():
+            for key, value in self.inner_wall_names.items():
 
                 for zone in self.thermal_zones:
-                    floor = Floor(zone)
-                    floor.load_type_element(self.year_of_construction,
-                                            self.construction_type)
-                    floor.name = key
-                    floor.tilt = value[0]
-                    floor.orientation = value[1]
-                    # zone.inner_walls.append(floor)
-        else:
-            pass
+                    inner_wall = InnerWall(zone)
+                    inner_wall.load_type_element(self.year_of_construction,
+                                                 self.construction_type)
+                    inner_wall.name = key
+                    inner_wall.tilt = value[0]
+                    inner_wall.orientation = value[1]
+                    # zone.inner_walls.append(inner_wall)
+
+            if self.number_of_floors > 1:
+
+                for key, value in self.ceiling_names.items():
+
+                    for zone in self.thermal_zones:
+                        ceiling = Ceiling(zone)
+                        ceiling.load_type_element(self.year_of_construction,
+                                                  self.construction_type)
+                        ceiling.name = key
+                        ceiling.tilt = value[0]
+                        ceiling.orientation = value[1]
+                        # zone.inner_walls.append(ceiling)
+
+                for key, value in self.floor_names.items():
+
+                    for zone in self.thermal_zones:
+                        floor = Floor(zone)
+                        floor.load_type_element(self.year_of_construction,
+                                                self.construction_type)
+                        floor.name = key
+                        floor.tilt = value[0]
+                        floor.orientation = value[1]
+                        # zone.inner_walls.append(floor)
+            else:
+                pass
 
-        for key, value in self.outer_area.items():
-            self.set_outer_wall_area(value, key)
-        for key, value in self.window_area.items():
-            self.set_window_area(value, key)
+            for key, value in self.outer_area.items():
+                self.set_outer_wall_area(value, key)
+            for key, value in self.window_area.items():
+                self.set_window_area(value, key)
 
-        for zone in self.thermal_zones:
-            zone.set_inner_wall_area()
-            zone.set_volume_zone()
+            for zone in self.thermal_zones:
+                zone.set_inner_wall_area()
+                zone.set_volume_zone()
 
     @property
     def construction_type(self):
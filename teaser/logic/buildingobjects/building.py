@@ -3,8 +3,8 @@
 
 """This module includes the Building class
 """
+import contextlib
 import inspect
-import random
 import re
 import warnings
 from teaser.logic.buildingobjects.calculation.aixlib import AixLib
@@ -53,12 +53,20 @@ class Building(object):
         number of floors above ground (default: None)
     height_of_floors : float [m]
         Average height of the floors (default: None)
-    internal_id : float
-        Random id for the distinction between different buildings.
+    internal_id : int
+        Id for the distinction between different buildings, assigned in
+        order by the project the building is added to (see
+        Project.get_building_by_id()). None as long as the building does
+        not belong to a project.
     year_of_retrofit : int
         Year of last retrofit.
     type_of_building : string
         Type of a Building (e.g. Building (unspecified), Office etc.).
+    used_statistic : str
+        Statistic of the type element catalog the elements of this building
+        are loaded from ('iwu' or 'tabula_de'), set by the archetype
+        classes. Default is None, which uses the catalog of
+        DataClass.used_statistic.
     building_id : None
         ID of building, can be set by the user to keep track of a building
         even outside of TEASER, e.g. in a simulation or in post-processing.
@@ -113,6 +121,8 @@ class Building(object):
 
     """
 
+    used_statistic = None
+
     def __init__(
             self,
             parent=None,
@@ -123,6 +133,12 @@ class Building(object):
         """Constructor of Building Class
         """
 
+        self._bulk_edit_level = 0
+        self._bulk_edit_queue = {}
+        self._net_leased_area_change = 0.0
+        self.internal_id = None
+        self.__name = None
+
         self.parent = parent
         self.name = name
         self.year_of_construction = year_of_construction
@@ -135,7 +151,6 @@ class Building(object):
 
         self.number_of_floors = None
         self.height_of_floors = None
-        self.internal_id = random.random()
         self._year_of_retrofit = None
         self.type_of_building = type(self).__name__
         self.building_id = None
@@ -148,6 +163,10 @@ class Building(object):
         self.gml_surfaces = []
         self._outer_area = {}
         self._window_area = {}
+        self._outer_area_sums = {}
+        self._window_area_sums = {}
+        self._outer_area_dirty = False
+        self._window_area_dirty = False
 
         self.bldg_height = None
         self.volume = 0
@@ -407,17 +426,17 @@ class Building(object):
         covers OuterWalls, GroundFloors and Rooftops.
 
         """
-        self.outer_area = {}
+        sums = {}
         for zone_count in self.thermal_zones:
             for wall_count in zone_count.outer_walls:
-                self.outer_area[wall_count.orientation] = None
+                self._add_area(sums, wall_count.orientation, wall_count.area)
             for roof in zone_count.rooftops:
-                self.outer_area[roof.orientation] = None
+                self._add_area(sums, roof.orientation, roof.area)
             for ground in zone_count.ground_floors:
-                self.outer_area[ground.orientation] = None
+                self._add_area(sums, ground.orientation, ground.area)
 
-        for key in self.outer_area:
-            self.outer_area[key] = self.get_outer_wall_area(key)
+        self._outer_area_sums = sums
+        self.outer_area = {key: value[1] for key, value in sums.items()}
 
     def fill_window_area_dict(self):
         """Fills the attribute
@@ -426,13 +445,283 @@ class Building(object):
         corresponding to the orientations of the building.
 
         """
-        self.window_area = {}
+        sums = {}
         for zone_count in self.thermal_zones:
             for win_count in zone_count.windows:
-                self.window_area[win_count.orientation] = None
+                self._add_area(sums, win_count.orientation, win_count.area)
+
+        self._window_area_sums = sums
+        self.window_area = {key: value[1] for key, value in sums.items()}
+
+    def update_area_dict(self, element, orientation, area):
+        """Updates outer_area or window_area after an element changed
+
+        Called by the building elements if area or orientation of an
+        OuterWall, Rooftop, GroundFloor or Window changes. The dictionaries
+        are not recalculated at once but on the next read. As long as the
+        sums per orientation are known, only the contribution of the
+        changed element is moved between the orientations. Elements removed
+        from or added to the lists of the thermal zones directly change the
+        number of elements, the sums are then calculated from scratch.
+
+        Parameters
+        ----------
+        element : BuildingElement()
+            The element whose area or orientation changed
+        orientation : float
+            Orientation of the element before the change
+        area : float
+            Area of the element before the change
+        """
+        type_name = type(element).__name__
+        if type_name == "Window":
+            sums = self._window_area_sums
+            groups = ("windows",)
+        elif type_name in ("OuterWall", "Rooftop", "GroundFloor"):
+            sums = self._outer_area_sums
+            groups = ("outer_walls", "rooftops", "ground_floors")
+        else:
+            return
+
+        if sums is not None and \
+                sum(entry[0] for entry in sums.values()) != \
+                sum(len(getattr(zone, group)) for zone in self.thermal_zones
+                    for group in groups):
+            sums = None
+
+        if sums is not None:
+            if orientation in sums and sums[orientation][0] > 0:
+                self._remove_area(sums, orientation, area)
+                self._add_area(sums, element.orientation, element.area)
+            else:
+                sums = None
+
+        dirty = element.orientation is not None and element.area is not None
+        if type_name == "Window":
+            self._window_area_sums = sums
+            self._window_area_dirty = self._window_area_dirty or dirty
+        else:
+            self._outer_area_sums = sums
+            self._outer_area_dirty = self._outer_area_dirty or dirty
+
+    def invalidate_area_dicts(self):
+        """Drops the sums per orientation of outer_area and window_area
+
+        Needs to be called if elements or thermal zones are added to or
+        removed from the building. The dictionaries are calculated from
+        scratch after the next change of an element area or orientation.
+        """
+        self._outer_area_sums = None
+        self._window_area_sums = None
+
+    @staticmethod
+    def _add_area(sums, orientation, area):
+        """Adds one element to the sums per orientation"""
+        entry = sums.setdefault(orientation, [0, 0.0])
+        entry[0] += 1
+        if area is not None:
+            entry[1] += area
+
+    @staticmethod
+    def _remove_area(sums, orientation, area):
+        """Removes one element from the sums per orientation"""
+        entry = sums[orientation]
+        entry[0] -= 1
+        if entry[0] == 0:
+            del sums[orientation]
+        elif area is not None:
+            entry[1] -= area
+
+    def clone(
+            self,
+            name=None,
+            net_leased_area=None,
+            rotation=None,
+            parent=None):
+        """Returns a copy of the building
+
+        Copies the building with its thermal zones, use conditions, building
+        elements and layers without generating the archetype again and
+        without loading anything from the data classes. Shared materials are
+        referenced by the copy, all other objects are copied. Calculation
+        results are not copied, the copy needs to be calculated again.
+
+        With a new net leased area all areas and volumes of the zones and
+        building elements are scaled by the ratio of the net leased areas,
+        which keeps the distribution of set_outer_wall_area() and
+        set_window_area() among the zones. A rotation is added to the
+        orientation of all vertical and tilted outer elements (orientation
+        not -1 or -2).
+
+        Parameters
+        ----------
+        name : str
+            Name of the copy, default is the name of this building
+        net_leased_area : float [m2]
+            Net leased area of the copy, default is the area of this building
+        rotation : float [degree]
+            Rotation of the copy, default is None (no rotation)
+        parent : Project()
+            Project the copy belongs to, default is the project of this
+            building
+
+        Returns
+        ----------
+        building : Building()
+            New building of the same type (archetype) as this building
+        """
+
+        self.resolve_bulk_edit()
+        if parent is None:
+            parent = self.parent
+
+        bldg = type(self).__new__(type(self))
+        for key, value in self.__dict__.items():
+            if isinstance(value, list):
+                value = list(value)
+            elif isinstance(value, dict):
+                value = dict(value)
+            bldg.__dict__[key] = value
+        bldg.__dict__["_Building__parent"] = None
+        bldg.__dict__["_Building__name"] = None
+        bldg.internal_id = None
+        bldg.library_attr = None
+        bldg.sum_heat_load = 0
+        bldg.sum_cooling_load = 0
+        bldg._bulk_edit_level = 0
+        bldg._bulk_edit_queue = {}
+        bldg._thermal_zones = []
+        bldg.invalidate_area_dicts()
+        if self.central_ahu is not None:
+            self.central_ahu.copy(parent=bldg)
+
+        bldg.parent = parent
+        if name is None:
+            name = self.name
+        bldg.name = name
+
+        with bldg.bulk_edit():
+            for zone in self.thermal_zones:
+                zone.copy(parent=bldg)
+
+            if net_leased_area is not None:
+                factor = net_leased_area / self.net_leased_area
+                for zone in bldg.thermal_zones:
+                    zone.area = zone.area * factor
+                    if zone.volume is not None:
+                        zone.volume = zone.volume * factor
+                    for element in zone.outer_walls + zone.doors + \
+                            zone.rooftops + zone.ground_floors + \
+                            zone.windows + zone.inner_walls + \
+                            zone.floors + zone.ceilings:
+                        if element.area is not None:
+                            element.area = element.area * factor
+                bldg.net_leased_area = net_leased_area
+
+            if rotation is not None:
+                for zone in bldg.thermal_zones:
+                    for element in zone.outer_walls + zone.doors + \
+                            zone.rooftops + zone.ground_floors + \
+                            zone.windows:
+                        if element.orientation is not None and \
+                                element.orientation >= 0:
+                            element.orientation = \
+                                (element.orientation + rotation) % 360
+        return bldg
+
+    @contextlib.contextmanager
+    def bulk_edit(self):
+        """Context manager for many changes of the building at once
+
+        Inside the context the cascades of the property setters are queued
+        instead of being executed on every single change: building elements
+        calculate their U*A value and resistances once for the last values
+        and the areas of thermal zones are added to net_leased_area in one
+        step. Everything is resolved on exit of the outermost context.
+        Reading net_leased_area inside the context resolves the queued
+        area changes at once, the calculation of the zone parameters
+        resolves all queued cascades. The context can be nested and is also
+        active inside Project.bulk_edit().
+        """
+        self._bulk_edit_level += 1
+        try:
+            yield self
+        finally:
+            self._bulk_edit_level -= 1
+            if not self.in_bulk_edit:
+                self.resolve_bulk_edit()
+
+    @property
+    def in_bulk_edit(self):
+        """True inside Building.bulk_edit() or Project.bulk_edit()"""
+        return self._bulk_edit_level > 0 or (
+            self.parent is not None and self.parent.in_bulk_edit)
+
+    def defer(self, element):
+        """Queues the U*A value calculation of an element during bulk edit
+
+        Parameters
+        ----------
+        element : BuildingElement()
+            The element whose U*A value needs to be calculated
+
+        Returns
+        ----------
+        deferred : bool
+            True if the calculation has been queued, False if the building
+            is not in a bulk edit and the caller has to calculate at once
+        """
+        if not self.in_bulk_edit:
+            return False
+        self._bulk_edit_queue[element] = None
+        return True
 
-        for key in self.window_area:
-            self.window_area[key] = self.get_window_area(key)
+    def defer_area_change(self, old_area, new_area):
+        """Queues the change of net_leased_area by a thermal zone
+
+        Parameters
+        ----------
+        old_area : float
+            Area of the thermal zone before the change, None if not set
+        new_area : float
+            Area of the thermal zone after the change
+
+        Returns
+        ----------
+        deferred : bool
+            True if the change has been queued, False if the building is
+            not in a bulk edit and the caller has to change at once
+        """
+        if not self.in_bulk_edit:
+            return False
+        if old_area is not None:
+            self._net_leased_area_change -= old_area
+        self._net_leased_area_change += new_area
+        return True
+
+    def _apply_area_change(self):
+        """Adds the queued area changes of thermal zones to net_leased_area"""
+        if self._net_leased_area_change != 0.0:
+            if self.__net_leased_area is None:
+                self.__net_leased_area = 0.0
+            self.__net_leased_area += self._net_leased_area_change
+            self._net_leased_area_change = 0.0
+
+    def resolve_bulk_edit(self):
+        """Executes the cascades queued during bulk edit
+
+        Adds the queued area changes of the thermal zones to
+        net_leased_area and calculates the U*A value of each changed
+        building element once.
+        """
+        self._apply_area_change()
+        queue = self._bulk_edit_queue
+        self._bulk_edit_queue = {}
+        for element in queue:
+            if element.inner_convection is not None and \
+                    element.inner_radiation is not None and \
+                    element.area is not None:
+                element.calc_ua_value()
 
     def calc_building_parameter(
             self,
@@ -602,10 +891,7 @@ class Building(object):
             self.__parent = value
 
             if inspect.isclass(Building):
-                if self in self.__parent.buildings:
-                    pass
-                else:
-                    self.__parent.buildings.append(self)
+                self.__parent.register_building(self)
 
         else:
 
@@ -617,6 +903,7 @@ class Building(object):
 
     @name.setter
     def name(self, value):
+        name = self.__name
         if isinstance(value, str):
             regex = re.compile('[^a-zA-z0-9]')
             self.__name = regex.sub('', value)
@@ -631,6 +918,9 @@ class Building(object):
         if self.__name[0].isdigit():
             self.__name = "B" + self.__name
 
+        if self.parent is not None:
+            self.parent.rename_building(self, name)
+
     @property
     def year_of_construction(self):
         return self.__year_of_construction
@@ -687,11 +977,13 @@ class Building(object):
 
     @property
     def net_leased_area(self):
+        self._apply_area_change()
         return self.__net_leased_area
 
     @net_leased_area.setter
     def net_leased_area(self, value):
 
+        self._net_leased_area_change = 0.0
         if isinstance(value, float):
             self.__net_leased_area = value
         elif value is None:
@@ -712,22 +1004,39 @@ class Building(object):
 
         if value is None:
             self._thermal_zones = []
+            self.invalidate_area_dicts()
 
     @property
     def outer_area(self):
+        if self._outer_area_dirty:
+            if self._outer_area_sums is None:
+                self.fill_outer_area_dict()
+            else:
+                self.outer_area = {
+                    key: value[1] for key, value in
+                    self._outer_area_sums.items()}
         return self._outer_area
 
     @outer_area.setter
     def outer_area(self, value):
         self._outer_area = value
+        self._outer_area_dirty = False
 
     @property
     def window_area(self):
+        if self._window_area_dirty:
+            if self._window_area_sums is None:
+                self.fill_window_area_dict()
+            else:
+                self.window_area = {
+                    key: value[1] for key, value in
+                    self._window_area_sums.items()}
         return self._window_area
 
     @window_area.setter
     def window_area(self, value):
         self._window_area = value
+        self._window_area_dirty = False
 
     @property
     def year_of_retrofit(self):
@@ -13,6 +13,8 @@ import numpy as np
 import random
 import re
 
+_COPIED_ATTRIBUTES = {}
+
 
 class BuildingElement(object):
     """Building element class.
@@ -72,6 +74,10 @@ class BuildingElement(object):
         List of all layers of a building element (to be filled with Layer
         objects). Use element.layer = None to delete all layers of the building
         element
+    prototype : TypeElementPrototype
+        Resolved type element this element was loaded from with
+        load_type_element(), None otherwise. Its fingerprint matches the
+        element as long as the layers of the element are unchanged.
 
     Calculated Attributes
 
@@ -115,8 +121,25 @@ class BuildingElement(object):
         InnerWalls and GroundFloors this value is set to 0.0
     wf_out : float
         Weightfactor of building element ua_value/ua_value_zone
+
+    Note
+    ----------
+    Building elements, their layers and materials use __slots__ instead of
+    a per-instance __dict__, as large building stocks hold millions of
+    them. Subclasses need to declare __slots__ for their own attributes,
+    arbitrary attributes cannot be added to instances.
     """
 
+    __slots__ = (
+        "__parent", "internal_id", "_name", "_construction_type",
+        "_year_of_retrofit", "_year_of_construction", "building_age_group",
+        "_area", "_tilt", "_orientation", "_inner_convection",
+        "_inner_radiation", "_outer_convection", "_outer_radiation",
+        "_layer", "prototype", "r1", "r2", "r3", "c1", "c2", "c1_korr",
+        "ua_value", "u_value", "r_conduc", "r_inner_conv", "r_inner_rad",
+        "r_inner_comb", "r_outer_conv", "r_outer_rad", "r_outer_comb",
+        "wf_out")
+
     def __init__(self, parent=None):
         """Constructor for BuildingElement
         """
@@ -140,6 +163,7 @@ class BuildingElement(object):
         self._outer_radiation = None
 
         self._layer = []
+        self.prototype = None
 
         self.r1 = 0.0
         self.r2 = 0.0
@@ -194,6 +218,59 @@ class BuildingElement(object):
             self.r_inner_comb + self.r_conduc + self.r_outer_comb))
         self.u_value = self.ua_value / self.area
 
+    def copy(self, parent=None):
+        """Returns a copy of the building element
+
+        Copies all values of the element and its layers without running
+        the property setters. Layers referencing a SharedMaterial keep
+        referencing it, private materials are copied.
+
+        Parameters
+        ----------
+        parent : ThermalZone()
+            Thermal zone the copy belongs to, if not None this adds the copy
+            to the element lists of the zone. Default is None
+
+        Returns
+        ----------
+        element : BuildingElement()
+            New element of the same type with the values of this element
+        """
+        cls = type(self)
+        attributes = _COPIED_ATTRIBUTES.get(cls)
+        if attributes is None:
+            attributes = []
+            for klass in cls.__mro__:
+                for attr in getattr(klass, "__slots__", ()):
+                    if attr not in ("__parent", "_layer"):
+                        attributes.append(attr)
+            _COPIED_ATTRIBUTES[cls] = attributes
+
+        element = cls.__new__(cls)
+        for attr in attributes:
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                value = list(value)
+            setattr(element, attr, value)
+        element.internal_id = random.random()
+        element._layer = []
+        for layer in self._layer:
+            layer.copy(parent=element)
+        element.parent = parent
+        return element
+
+    def update_ua_value(self):
+        """Calculates the U*A value after a change of the element
+
+        Used by the property setters of the element, its layers and
+        materials. Inside Building.bulk_edit() the calculation is queued
+        and done once on exit, otherwise calc_ua_value() is called at once.
+        """
+        if self.parent is not None and self.parent.parent is not None:
+            if self.parent.parent.defer(self):
+                return
+        self.calc_ua_value()
+
     def gather_element_properties(self):
         """Helper function for matrix calculation.
 
@@ -234,6 +311,26 @@ class BuildingElement(object):
 
         return number_of_layer, density, thermal_conduc, heat_capac, thickness
 
+    def gather_layer_fingerprint(self):
+        """Helper function to compare constructions.
+
+        Gathers the properties of all layers needed for the calculation of
+        resistances and capacities. Two elements with the same fingerprint
+        have the same values normalised to their area.
+
+        Returns
+        ----------
+        fingerprint : tuple
+            Tuple of (thickness, density, thermal_conduc, heat_capac) for
+            each layer
+        """
+
+        return tuple(
+            (lay.thickness,
+             lay.material.density,
+             lay.material.thermal_conduc,
+             lay.material.heat_capac) for lay in self.layer)
+
     def add_layer(self, layer, position=None):
         """Adds a layer at a certain position
 
@@ -309,6 +406,7 @@ class BuildingElement(object):
             data_class = data_class
 
         self.layer = None
+        self.prototype = None
         self._inner_convection = None
         self._inner_radiation = None
         self._outer_convection = None
@@ -403,6 +501,14 @@ class BuildingElement(object):
         self.r_outer_rad = 0.0
         self.r_outer_comb = 0.0
 
+    @property
+    def parent(self):
+        return self.__parent
+
+    @parent.setter
+    def parent(self, value):
+        self.__parent = value
+
     @property
     def name(self):
         return self._name
@@ -450,13 +556,13 @@ class BuildingElement(object):
     @orientation.setter
     def orientation(self, value):
 
+        orientation = self._orientation
         self._orientation = value
-        if type(self).__name__ == "OuterWall":
-            if self.parent.parent is not None and self.area is not None:
-                self.parent.parent.fill_outer_area_dict()
-        elif type(self).__name__ == "Window":
-            if self.parent.parent is not None and self.area is not None:
-                self.parent.parent.fill_window_area_dict()
+        if self.parent is not None:
+            self.parent.update_element_index(self, orientation, self.tilt)
+            if self.parent.parent is not None:
+                self.parent.parent.update_area_dict(
+                    self, orientation, self.area)
 
     @property
     def layer(self):
@@ -471,7 +577,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.update_ua_value()
 
     @property
     def inner_convection(self):
@@ -495,7 +601,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.update_ua_value()
 
     @property
     def inner_radiation(self):
@@ -519,7 +625,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.update_ua_value()
 
     @property
     def outer_convection(self):
@@ -543,7 +649,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.update_ua_value()
 
     @property
     def outer_radiation(self):
@@ -567,7 +673,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.update_ua_value()
 
     @property
     def area(self):
@@ -586,20 +692,15 @@ class BuildingElement(object):
             except:
                 raise ValueError("Can't convert element area to float")
 
+        area = self._area
         if value is not None:
             self._area = value
-        if type(self).__name__ == "OuterWall"\
-                or type(self).__name__ == "Rooftop" \
-                or type(self).__name__ == "GroundFloor":
-            if self.parent.parent is not None and self.orientation is not None:
-                self.parent.parent.fill_outer_area_dict()
-        elif type(self).__name__ == "Window":
-            if self.parent is not None and self.orientation is not None:
-                self.parent.parent.fill_window_area_dict()
+        if self.parent is not None and self.parent.parent is not None:
+            self.parent.parent.update_area_dict(self, self.orientation, area)
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.update_ua_value()
 
     @property
     def tilt(self):
@@ -608,6 +709,7 @@ class BuildingElement(object):
     @tilt.setter
     def tilt(self, value):
 
+        tilt = self._tilt
         if isinstance(value, float):
             self._tilt = value
         elif value is None:
@@ -618,6 +720,8 @@ class BuildingElement(object):
                 self._tilt = value
             except:
                 raise ValueError("Can't convert tilt to float")
+        if self.parent is not None:
+            self.parent.update_element_index(self, self.orientation, tilt)
 
     @property
     def year_of_construction(self):
@@ -105,6 +105,8 @@ class Ceiling(InnerWall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None):
         """Constructor Ceiling (InnerWall)
 
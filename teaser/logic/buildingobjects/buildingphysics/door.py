@@ -108,6 +108,8 @@ class Door(OuterWall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("__parent",)
+
     def __init__(self, parent=None):
         """
         """
@@ -106,6 +106,8 @@ class Floor(InnerWall):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None):
         """
         """
@@ -104,6 +104,8 @@ class GroundFloor(OuterWall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None):
         """
         """
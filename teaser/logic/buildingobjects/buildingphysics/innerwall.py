@@ -106,6 +106,8 @@ class InnerWall(Wall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("__parent",)
+
     def __init__(self, parent=None):
         """
         """
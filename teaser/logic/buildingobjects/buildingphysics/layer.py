@@ -3,6 +3,7 @@
 
 
 import random
+from teaser.logic.buildingobjects.buildingphysics.material import MaterialView
 
 
 class Layer(object):
@@ -24,11 +25,15 @@ class Layer(object):
     id : int
         Position (starting from 0 and the inner side)
     material : Material()
-        Material class of TEASER
+        Material class of TEASER. For layers referencing a SharedMaterial
+        this is a MaterialView, which copies the shared material on the
+        first change (see own_material())
     thickness : float [m]
         Thickness of the layer
     """
 
+    __slots__ = ("__parent", "internal_id", "id", "_material", "_thickness")
+
     def __init__(self, parent=None, id=0):
         """Constructor of Layer.
 
@@ -66,15 +71,65 @@ class Layer(object):
         else:
             self.__parent = None
 
+    def copy(self, parent=None):
+        """Returns a copy of the layer
+
+        A SharedMaterial is referenced by the copy as well, a private
+        material is copied.
+
+        Parameters
+        ----------
+        parent : BuildingElement
+            Building element the copy belongs to, if not None this adds the
+            copy to BuildingElement.layer. Default is None
+
+        Returns
+        ----------
+        layer : Layer()
+            New layer with the values of this layer
+        """
+
+        layer = Layer(parent=parent, id=self.id)
+        layer._thickness = self._thickness
+        if self._material is not None:
+            if self._material.shared:
+                layer._material = self._material
+            else:
+                self._material.copy(parent=layer)
+        return layer
+
+    def own_material(self):
+        """Replaces a shared material by a private copy
+
+        Layers referencing a SharedMaterial get their own copy of it, so it
+        can be changed without affecting other layers (copy-on-write).
+        Layers with a private material keep it.
+
+        Returns
+        ----------
+        material : Material()
+            Private material of the layer
+        """
+
+        if self._material is not None and self._material.shared:
+            self._material.copy(parent=self)
+        return self._material
+
     @property
     def material(self):
+        if self._material is not None and self._material.shared:
+            return MaterialView(self)
         return self._material
 
     @material.setter
     def material(self, value):
         ass_error_1 = "Material has to be an instance of Material()"
 
-        assert type(value).__name__ == ("Material"), ass_error_1
+        if type(value).__name__ == "MaterialView":
+            value = value.parent._material
+
+        assert type(value).__name__ == ("Material") \
+            or type(value).__name__ == ("SharedMaterial"), ass_error_1
 
         self._material = value
 
@@ -98,6 +153,6 @@ class Layer(object):
         if value is not None:
             self._thickness = float(value)
 
-        if self.material is not None and self.parent is not None:
-            if vars(self.material)['_thermal_conduc'] != 0:
-                self.parent.calc_ua_value()
+        if self._material is not None and self.parent is not None:
+            if self._material.thermal_conduc != 0:
+                self.parent.update_ua_value()
@@ -7,6 +7,11 @@ import uuid
 import teaser.data.input.material_input as material_input
 import teaser.data.output.material_output as material_output
 
+_MATERIAL_VALUES = (
+    "_name", "_density", "_thermal_conduc", "_heat_capac", "_solar_absorp",
+    "_ir_emissivity", "_transmittance", "_thickness_default",
+    "_thickness_list", "material_id")
+
 
 class Material(object):
     """Material class
@@ -45,9 +50,17 @@ class Material(object):
     material_id : str(uuid)
         UUID of material, this is used to have similar behaviour like foreign
         key in SQL data bases for use in TypeBuildingElements and Material xml
+    shared : bool
+        True for immutable materials shared by several layers (see
+        SharedMaterial), False for materials owned by a single layer
 
     """
 
+    __slots__ = (
+        "__parent", "__material_id", "_name", "_density", "_thermal_conduc",
+        "_heat_capac", "_solar_absorp", "_ir_emissivity", "_transmittance",
+        "_thickness_default", "_thickness_list")
+
     def __init__(self, parent=None):
         """Constructor of Material.
         """
@@ -142,6 +155,36 @@ class Material(object):
 
         material_output.modify_material(material=self, data_class=data_class)
 
+    def copy(self, parent=None):
+        """Returns a private copy of the material
+
+        Parameters
+        ----------
+
+        parent : Layer
+            Layer the copy belongs to, if not None this adds the copy to
+            Layer.material. Default is None
+
+        Returns
+        ----------
+
+        material : Material()
+            New material with the values of this material
+        """
+
+        material = Material()
+        for attr in _MATERIAL_VALUES:
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                value = list(value)
+            setattr(material, attr, value)
+        material.parent = parent
+        return material
+
+    @property
+    def shared(self):
+        return False
+
     @property
     def material_id(self):
         return self.__material_id
@@ -213,7 +256,7 @@ class Material(object):
                             self.parent.parent.inner_radiation is \
                             not None and \
                             self.parent.parent.area is not None:
-                        self.parent.parent.calc_ua_value()
+                        self.parent.parent.update_ua_value()
 
     @property
     def density(self):
@@ -347,3 +390,94 @@ class Material(object):
                             "Can't convert entry of thickness_list to float")
 
                 self._thickness_list = value
+
+
+class SharedMaterial(Material):
+    """Immutable material shared by several layers
+
+    Shared materials are interned by DataClass.shared_material() when type
+    elements are loaded with DataClass.shared_materials enabled, so all
+    layers of a project using the same material of MaterialTemplates.xml
+    reference one single instance. A shared material has no parent, layers
+    referencing it return a MaterialView in Layer.material, which is
+    replaced by a private copy of the material as soon as it is changed
+    (copy-on-write).
+
+    Parameters
+    ----------
+    material_data : list
+        List of (attribute name, value) tuples as returned by
+        material_input.resolve_material()
+
+    """
+
+    __slots__ = ("_frozen",)
+
+    def __init__(self, material_data):
+        """Constructor of SharedMaterial.
+        """
+
+        Material.__init__(self)
+        for attr, value in material_data:
+            if isinstance(value, list):
+                value = list(value)
+            setattr(self, attr, value)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                "Shared materials are read-only, change the material "
+                "through Layer.material to get a private copy")
+        Material.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (
+            SharedMaterial,
+            ([(attr, getattr(self, attr)) for attr in _MATERIAL_VALUES],))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def shared(self):
+        return True
+
+
+class MaterialView(object):
+    """Material of a layer referencing a SharedMaterial
+
+    Returned by Layer.material for layers referencing a shared material.
+    All attributes are read from the shared material. Changing an attribute
+    or calling a method (e.g. load_material_template()) first replaces the
+    shared material of the layer by a private copy (see
+    Layer.own_material()), so the other layers keep the shared values.
+
+    Parameters
+    ----------
+    layer : Layer
+        Layer referencing the shared material
+
+    """
+
+    __slots__ = ("_layer",)
+
+    def __init__(self, layer):
+        """Constructor of MaterialView.
+        """
+        object.__setattr__(self, "_layer", layer)
+
+    def __getattr__(self, name):
+        material = self._layer._material
+        if name == "parent":
+            return self._layer
+        if material.shared and \
+                callable(getattr(type(material), name, None)):
+            material = self._layer.own_material()
+        return getattr(material, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._layer.own_material(), name, value)
@@ -104,6 +104,8 @@ class OuterWall(Wall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("__parent",)
+
     def __init__(self, parent=None):
         """
         """
@@ -139,6 +141,7 @@ class OuterWall(Wall):
                 raise ValueError('Instance of OuterWall not known')
 
             if self.parent.parent is not None:
+                self.parent.parent.invalidate_area_dicts()
                 self.year_of_construction = \
                     self.parent.parent.year_of_construction
             else:
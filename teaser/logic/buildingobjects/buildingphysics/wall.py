@@ -6,7 +6,7 @@ from teaser.logic.buildingobjects.buildingphysics.buildingelement \
     import BuildingElement
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 from teaser.logic.buildingobjects.buildingphysics.material import Material
-import numpy as np
+from teaser.logic.buildingobjects.calculation import equivalent_res
 import warnings
 
 
@@ -111,6 +111,8 @@ class Wall(BuildingElement):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None):
         """Constructor of Wall
         """
@@ -120,108 +122,64 @@ class Wall(BuildingElement):
         """Equivalent resistance according to VDI 6007.
 
         Calculates the equivalent resistance and capacity of a wall according
-        to VDI 6007 guideline. (Analogous model).
+        to VDI 6007 guideline. (Analogous model). The values are calculated
+        for an area of 1 m2 (see calc_equivalent_res_per_area()) and scaled
+        by the area of the wall. The values for 1 m2 are cached by the
+        construction of the wall, see equivalent_res.calc_equivalent_res(),
+        which also calculates many walls at once.
+
+        Parameters
+        ----------
+        t_bt : int
+            Time constant according to VDI 6007 (default t_bt = 7)
+        """
+
+        equivalent_res.calc_equivalent_res([self], t_bt=t_bt)
+
+    def calc_equivalent_res_per_area(self, t_bt=7):
+        """Equivalent resistance according to VDI 6007 for 1 m2.
+
+        Calculates the equivalent resistance and capacity of the layers of
+        the wall according to VDI 6007 guideline (Analogous model) for an
+        area of 1 m2. Resistances are inversely, capacities directly
+        proportional to the area of the wall.
 
         Parameters
         ----------
         t_bt : int
             Time constant according to VDI 6007 (default t_bt = 7)
+
+        Returns
+        ----------
+        per_area : tuple
+            Equivalent resistances and capacities (r1, r2, r3, c1, c2,
+            c1_korr) in m2*K/W and J/(m2*K)
+        """
+
+        return equivalent_res.calc_equivalent_res_per_area(
+            [self], t_bt=t_bt)[0]
+
+    def scale_equivalent_res(self, per_area):
+        """Sets the equivalent resistances and capacities of the wall
+
+        Scales the values for an area of 1 m2 by the area of the wall. For
+        OuterWall, Rooftop and GroundFloor c1 is set to c1_korr.
+
+        Parameters
+        ----------
+        per_area : tuple
+            Equivalent resistances and capacities (r1, r2, r3, c1, c2,
+            c1_korr) in m2*K/W and J/(m2*K)
         """
 
-        nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
-            self.gather_element_properties()
-
-        omega = 2 * np.pi / (86400 * t_bt)
-
-        r_layer = thickness / thermal_conduc
-        c_layer = heat_capac * density * thickness * 1000
-
-        re11 = np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.cos(np.sqrt(0.5 * omega * r_layer * c_layer))
-        im11 = np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.sin(np.sqrt(0.5 * omega * r_layer * c_layer))
-        re12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re21 = (-1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im21 = (1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re22 = re11
-        im22 = im11
-
-        # -----setting up the matrix for each layer
-        a_layer = np.zeros((nr_of_layer, 4, 4))
-
-        for i, r in enumerate(re11):
-            a_layer[i][0][0] = r
-            a_layer[i][0][1] = im11[i]
-            a_layer[i][0][2] = re12[i]
-            a_layer[i][0][3] = im12[i]
-            a_layer[i][1][0] = -im11[i]
-            a_layer[i][1][1] = re11[i]
-            a_layer[i][1][2] = -im12[i]
-            a_layer[i][1][3] = re12[i]
-            a_layer[i][2][0] = re21[i]
-            a_layer[i][2][1] = im21[i]
-            a_layer[i][2][2] = re22[i]
-            a_layer[i][2][3] = im22[i]
-            a_layer[i][3][0] = -im21[i]
-            a_layer[i][3][1] = re21[i]
-            a_layer[i][3][2] = -im22[i]
-            a_layer[i][3][3] = re22[i]
-
-        # -----multiplication of the matrix
-        new_mat = np.diag(np.ones(4))
-
-        for count_layer in a_layer:
-            new_mat = np.dot(new_mat, count_layer)
-
-        # calculation of equivalent Resistance and capacities of each element
-        self.r1 = (1 / self.area) * ((new_mat[3][3] - 1) *
-                                     new_mat[0][2] + new_mat[2][3] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[3][3] - 1) ** 2 + new_mat[2][3] ** 2)
-        self.r2 = (1 / self.area) * ((new_mat[0][0] - 1) *
-                                     new_mat[0][2] + new_mat[0][1] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[0][0] - 1) ** 2 + new_mat[0][1] ** 2)
-        self.c1 = self.area * ((new_mat[3][3] - 1) ** 2 +
-                               (new_mat[2][3]) ** 2) / \
-            (omega * (new_mat[0][2] * new_mat[2][3] -
-                      (new_mat[3][3] - 1) * new_mat[0][3]))
-        self.c2 = self.area * ((new_mat[0][0] - 1) ** 2 +
-                               (new_mat[0][1]) ** 2) / (
-            omega * (new_mat[0][2] *
-                     new_mat[0][1] -
-                     (new_mat[0][0] - 1) *
-                     new_mat[0][3]))
-        self.r3 = (1 / self.area) * (np.sum(r_layer)) - self.r1 - self.r2
-
-        r_wall = self.r1 + self.r2 + self.r3
-
-        self.c1_korr = (1 / (omega * self.r1)) * ((r_wall * self.area -
-                                                   new_mat[0][2] * new_mat[3][
-                                                       3] -
-                                                   new_mat[0][3] * new_mat[2][
-                                                       3]) /
-                                                  (new_mat[3][3] * new_mat[0][
-                                                      3] -
-                                                   new_mat[0][2] * new_mat[2][
-                                                       3]))
+        r1, r2, r3, c1, c2, c1_korr = per_area
+
+        self.r1 = r1 / self.area
+        self.r2 = r2 / self.area
+        self.r3 = r3 / self.area
+        self.c1 = c1 * self.area
+        self.c2 = c2 * self.area
+        self.c1_korr = c1_korr * self.area
 
         if type(self).__name__ == "OuterWall" \
                 or type(self).__name__ == "Rooftop" \
@@ -4,6 +4,7 @@
 
 from teaser.logic.buildingobjects.buildingphysics.buildingelement \
     import BuildingElement
+from teaser.logic.buildingobjects.calculation import equivalent_res
 import warnings
 
 
@@ -119,6 +120,10 @@ class Window(BuildingElement):
 
     """
 
+    __slots__ = (
+        "__parent", "_g_value", "_a_conv", "_shading_g_total",
+        "_shading_max_irr")
+
     def __init__(self, parent=None):
 
         super(Window, self).__init__(parent)
@@ -144,17 +149,10 @@ class Window(BuildingElement):
             time constant according to VDI 6007 (default t_bt = 7)
         """
         self.set_calc_default()
-        number_of_layer, density, thermal_conduc, heat_capac, thickness = \
-            self.gather_element_properties()
-
-        r_layer = thickness / thermal_conduc
-        c_layer = heat_capac * density * thickness  # *1000
-
-        for layer_count in r_layer:
-            self.r1 += layer_count / self.area
+        r_conduc, c_conduc = equivalent_res.calc_window_res_per_area(self)
 
-        for layer_count in c_layer:
-            self.c1 += layer_count
+        self.r1 = r_conduc / self.area
+        self.c1 = c_conduc  # *1000
 
     def replace_window(self, year_of_retrofit, window_type=None):
         """Replace a window, with a newer one.
@@ -205,6 +203,7 @@ class Window(BuildingElement):
                 raise ValueError('Instance of Window not known')
 
             if self.parent.parent is not None:
+                self.parent.parent.invalidate_area_dicts()
                 self.year_of_construction = \
                     self.parent.parent.year_of_construction
             else:
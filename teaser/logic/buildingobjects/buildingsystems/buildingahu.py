@@ -98,6 +98,28 @@ class BuildingAHU(object):
         self._profile_v_flow = None
         self._profile_temperature = None
 
+    def copy(self, parent):
+        """Returns a copy of the AHU
+
+        Parameters
+        ----------
+        parent : Building()
+            Building the copy belongs to, the copy is set as its central_ahu
+
+        Returns
+        ----------
+        central_ahu : BuildingAHU()
+            New AHU with the values and profiles of this AHU
+        """
+
+        central_ahu = BuildingAHU.__new__(BuildingAHU)
+        for key, value in self.__dict__.items():
+            if isinstance(value, list):
+                value = list(value)
+            central_ahu.__dict__[key] = value
+        central_ahu.parent = parent
+        return central_ahu
+
     @property
     def parent(self):
         return self.__parent
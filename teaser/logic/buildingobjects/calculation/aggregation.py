@@ -0,0 +1,705 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""This module includes the AggregationEngine class
+"""
+
+from __future__ import division
+import math
+import random
+import warnings
+import numpy as np
+from teaser.logic.buildingobjects.calculation import equivalent_res
+from teaser.logic.buildingobjects.calculation.element_store import \
+    ElementStore
+
+
+class AggregationEngine(object):
+    """Aggregation of the building elements of a thermal zone
+
+    Base class of OneElement, TwoElement, ThreeElement and FourElement. The
+    engine lumps the building elements of a thermal zone into the walls of
+    the analogous model of VDI 6007. Which element lists of the zone are
+    lumped into which wall is configured by the class attributes of the
+    models, the engine computes all area-weighted values, parallel
+    resistances and lumped resistances/capacities for any such partition.
+    All sums are taken from the ElementStore of the zone, which gathers the
+    element attributes in one pass.
+
+    Attribute names are composed of the quantity and the suffix of the
+    partition, e.g. area_ow, r_conv_inner_gf or alpha_rad_outer_rt.
+
+    Parameters
+    ----------
+
+    thermal_zone: ThermalZone()
+        TEASER instance of ThermalZone
+    merge_windows : bool
+        True for merging the windows into the outer wall's RC-combination,
+        False for separate resistance for window, default is False
+    t_bt : float
+        Time constant according to VDI 6007 (default t_bt = 5)
+
+    Attributes
+    ----------
+    outer_partitions : tuple
+        Lumped outer walls of the model, one (suffix, description,
+        element lists, ambient element lists) tuple per wall. Element lists
+        are names of the element lists of ThermalZone, ambient element lists
+        those of them with coefficients of heat transfer on the ambient
+        side. The first partition is the outer wall ("ow"), windows are
+        merged into it if merge_windows is True. Weightfactors are
+        calculated for all partitions with ambient element lists.
+    inner_groups : tuple
+        Element lists lumped into the inner wall ("iw"), empty if the model
+        has no inner wall.
+    facade_groups : tuple
+        Element lists of the walls of the facades filled by
+        _fill_zone_lists(). Windows are always part of the facades.
+    facade_ground_floors : bool
+        If True, ground floors are part of the facades.
+    rooftop_facades : bool
+        If True, rooftops have their own facade lists (orientation_rt,
+        tilt_rt, rooftop_areas, ...).
+    """
+
+    outer_partitions = ()
+    inner_groups = ()
+    facade_groups = ()
+    facade_ground_floors = False
+    rooftop_facades = False
+
+    wall_groups = ("outer_walls", "ground_floors", "rooftops",
+                   "inner_walls", "floors", "ceilings")
+
+    find_methods = {"outer_walls": "find_walls",
+                    "ground_floors": "find_gfs",
+                    "rooftops": "find_rts",
+                    "windows": "find_wins"}
+
+    def __init__(self, thermal_zone, merge_windows, t_bt):
+        """Constructor for AggregationEngine"""
+
+        self.internal_id = random.random()
+
+        self.thermal_zone = thermal_zone
+        self.merge_windows = merge_windows
+        self.t_bt = t_bt
+        self._element_store = None
+
+        self.set_calc_default()
+
+    @property
+    def element_store(self):
+        if self._element_store is None:
+            self._element_store = ElementStore(self.thermal_zone)
+        return self._element_store
+
+    def calc_attributes(self):
+        """Calls all necessary function to calculate model attributes"""
+
+        walls = []
+        for group in self.wall_groups:
+            walls.extend(getattr(self.thermal_zone, group))
+
+        equivalent_res.calc_equivalent_res(walls)
+
+        for wall in walls:
+            wall.calc_ua_value()
+        for win in self.thermal_zone.windows:
+            win.calc_equivalent_res()
+            win.calc_ua_value()
+
+        self._element_store = ElementStore(self.thermal_zone)
+        self.set_calc_default()
+        store = self.element_store
+
+        for index, (suffix, description, groups, ambient_groups) in \
+                enumerate(self.outer_partitions):
+            if not store.elements(*groups):
+                if index == 0:
+                    warnings.warn(
+                        "No walls are defined as outer walls for thermal "
+                        "zone " + str(self.thermal_zone.name) +
+                        " in building " + str(self.thermal_zone.parent.name) +
+                        ", please be careful with results. In addition " +
+                        "this might lead to RunTimeErrors")
+                else:
+                    self._warn_missing(description)
+                continue
+            self._sum_elements(suffix, groups, ambient_groups)
+            if index > 0:
+                self._calc_lumped_elements(suffix, groups)
+        if self.inner_groups:
+            if not store.elements(*self.inner_groups):
+                self._warn_missing("inner walls")
+            else:
+                self._sum_inner_wall_elements()
+                self._calc_inner_elements()
+        if not self.thermal_zone.windows:
+            self._warn_missing("windows")
+        else:
+            self._sum_window_elements()
+        if store.elements(*self.outer_partitions[0][2]) or \
+                self.thermal_zone.windows:
+            self._calc_outer_elements()
+            self._calc_wf()
+            self._calc_mean_values()
+        self._calc_number_of_elements()
+        self._fill_zone_lists()
+        self._calc_heat_load()
+
+        return True
+
+    def _warn_missing(self, description):
+        """Warns that the thermal zone has no elements of one kind"""
+        warnings.warn('For thermal zone ' + str(self.thermal_zone.name) +
+                      ' in building ' + str(self.thermal_zone.parent.name) +
+                      ', no ' + description + ' have been defined.')
+
+    def _partition(self, suffix):
+        """Returns the configuration of the outer partition with suffix"""
+        for partition in self.outer_partitions:
+            if partition[0] == suffix:
+                return partition
+        raise KeyError("Model has no partition " + suffix)
+
+    @staticmethod
+    def _calc_parallel_connection(element_list, omega):
+        """Parallel connection of walls according to VDI 6007
+
+        Calculates the parallel connection of wall elements according to VDI
+        6007, resulting in R1 and C1 (equation 23, 24), see
+        equivalent_res.calc_parallel_connection().
+
+        Parameters
+        ----------
+        element_list : list
+            List of inner or outer walls
+        omega : float
+            VDI 6007 frequency
+
+        Returns
+        ----------
+        r1 : float [K/W]
+            VDI 6007 resistance for all inner or outer walls
+        c1 : float [K/W]
+            VDI 6007 capacity all for inner or outer walls
+        """
+
+        return equivalent_res.calc_parallel_connection(
+            [element.r1 for element in element_list],
+            [element.c1 for element in element_list],
+            omega)
+
+    def _aggregate(self, groups, ambient_groups):
+        """Area-weighted values and parallel resistances of element lists
+
+        Parameters
+        ----------
+        groups : tuple
+            Names of the element lists of ThermalZone
+        ambient_groups : tuple
+            Names of the element lists with coefficients of heat transfer on
+            the ambient side, empty for walls without ambient side
+
+        Returns
+        ----------
+        values : dict
+            Aggregated values by quantity name, e.g. "area" or
+            "r_conv_inner"
+        """
+
+        store = self.element_store
+        values = {}
+
+        area = store.total("area", *groups)
+        values["area"] = area
+        values["ua_value"] = store.total("ua_value", *groups)
+        values["r_total"] = 1 / values["ua_value"]
+
+        # values facing the inside of the thermal zone
+
+        for kind in ("conv", "rad", "comb"):
+            r_inner = 1 / store.total_reciprocal("r_inner_" + kind, *groups)
+            values["r_" + kind + "_inner"] = r_inner
+            values["alpha_" + kind + "_inner"] = 1 / (r_inner * area)
+
+        values["ir_emissivity_inner"] = store.total_weighted(
+            "ir_emissivity_inner", *groups) / area
+
+        if not ambient_groups:
+            return values
+
+        # values facing the ambient
+
+        if tuple(ambient_groups) != tuple(groups):
+            area = store.total("area", *ambient_groups)
+
+        for kind in ("conv", "rad", "comb"):
+            r_outer = 1 / store.total_reciprocal(
+                "r_outer_" + kind, *ambient_groups)
+            values["r_" + kind + "_outer"] = r_outer
+            values["alpha_" + kind + "_outer"] = 1 / (r_outer * area)
+
+        values["ir_emissivity_outer"] = store.total_weighted(
+            "ir_emissivity_outer", *ambient_groups) / area
+        values["solar_absorp"] = store.total_weighted(
+            "solar_absorp_outer", *ambient_groups) / area
+
+        return values
+
+    def _sum_elements(self, suffix, groups, ambient_groups):
+        """Sum attributes for the elements of one lumped wall
+
+        This function sums and computes the area-weighted values,
+        where necessary (the class doc string) for coefficients of heat
+        transfer, resistances, areas and UA-Values and sets them with the
+        suffix of the wall.
+
+        Parameters
+        ----------
+        suffix : str
+            Suffix of the attribute names, e.g. "ow"
+        groups : tuple
+            Names of the element lists of ThermalZone
+        ambient_groups : tuple
+            Names of the element lists with coefficients of heat transfer on
+            the ambient side
+        """
+
+        for name, value in self._aggregate(groups, ambient_groups).items():
+            setattr(self, name + "_" + suffix, value)
+
+    def _sum_partition(self, suffix):
+        """Sum attributes for the elements of one outer partition"""
+        suffix, description, groups, ambient_groups = self._partition(suffix)
+        self._sum_elements(suffix, groups, ambient_groups)
+
+    def _sum_outer_wall_elements(self):
+        """Sum attributes for outer wall elements"""
+        self._sum_partition("ow")
+
+    def _sum_ground_floor_elements(self):
+        """Sum attributes for ground floor elements"""
+        self._sum_partition("gf")
+
+    def _sum_rooftop_elements(self):
+        """Sum attributes for rooftop elements"""
+        self._sum_partition("rt")
+
+    def _sum_inner_wall_elements(self):
+        """Sum attributes for interior elements
+
+        Calculation of adjacent thermal zones and thus the values facing
+        the adjacent thermal zone are currently not supported.
+        """
+        self._sum_elements("iw", self.inner_groups, ())
+
+    def _sum_window_elements(self):
+        """Sum attributes for window elements
+
+        This function sums and computes the area-weighted values,
+        where necessary (the class doc string) for coefficients of heat
+        transfer, resistances, areas and UA-Values.
+        """
+
+        store = self.element_store
+        values = self._aggregate(("windows",), ("windows",))
+        values["ir_emissivity"] = values.pop("ir_emissivity_outer")
+        for name, value in values.items():
+            setattr(self, name + "_win", value)
+
+        self.u_value_win = self.ua_value_win / self.area_win
+        self.ratio_conv_rad_inner_win = store.total_weighted(
+            "a_conv", "windows") / self.area_win
+        self.weighted_g_value = store.total_weighted(
+            "g_value", "windows") / self.area_win
+
+    def _calc_lumped_elements(self, suffix, groups, r_rest=True):
+        """Lumped resistance and capacity of one wall
+
+        Calculates R1 and C1 of the parallel connection of all elements of
+        the given lists and the remaining resistance R_rest.
+
+        Parameters
+        ----------
+        suffix : str
+            Suffix of the attribute names, e.g. "gf"
+        groups : tuple
+            Names of the element lists of ThermalZone
+        r_rest : bool
+            If False, R_rest is not calculated (inner walls)
+        """
+
+        omega = 2 * math.pi / 86400 / self.t_bt
+
+        walls = self.element_store.elements(*groups)
+
+        if 0 < len(walls) <= 1:
+            # only one wall, no need to calculate chain matrix
+            setattr(self, "r1_" + suffix, walls[0].r1)
+            setattr(self, "c1_" + suffix, walls[0].c1_korr)
+        elif len(walls) > 1:
+            # more than one wall, calculate chain matrix
+            r1, c1 = self._calc_parallel_connection(walls, omega)
+            setattr(self, "r1_" + suffix, r1)
+            setattr(self, "c1_" + suffix, c1)
+
+        if r_rest is True:
+            conduction = (1 / self.element_store.total_reciprocal(
+                "r_conduc", *groups))
+            setattr(self, "r_rest_" + suffix,
+                    conduction - getattr(self, "r1_" + suffix))
+
+    def _calc_ground_floor_elements(self):
+        """Lumped parameter for ground floor elements"""
+        self._calc_lumped_elements("gf", self._partition("gf")[2])
+
+    def _calc_rooftop_elements(self):
+        """Lumped parameter for rooftop elements"""
+        self._calc_lumped_elements("rt", self._partition("rt")[2])
+
+    def _calc_inner_elements(self):
+        """Lumped parameter for inner wall elements"""
+        self._calc_lumped_elements("iw", self.inner_groups, r_rest=False)
+
+    def _calc_outer_elements(self):
+        """Lumped parameter for outer wall elements
+
+        Calculates all necessary parameters for outer walls, including the
+        windows if merge_windows is True.
+        """
+
+        groups = self.outer_partitions[0][2]
+        store = self.element_store
+
+        self._calc_lumped_elements("ow", groups, r_rest=False)
+
+        windows = self.thermal_zone.windows
+        outer_walls = self.thermal_zone.outer_walls
+
+        if self.merge_windows is False:
+            if len(windows) > 0:
+                self.r1_win = (1 / store.total_reciprocal("r1", "windows"))
+            if len(outer_walls) > 0:
+                conduction = (1 / store.total_reciprocal(
+                    "r_conduc", *groups))
+
+                self.r_rest_ow = (conduction - self.r1_ow)
+
+        if self.merge_windows is True:
+            if len(windows) > 0 and len(outer_walls) > 0:
+                self.r1_win = 1 / float(np.sum(
+                    1 / (store.column("r1", "windows") / 6)))
+
+                self.r1_ow = 1 / (1 / self.r1_ow + 1 / self.r1_win)
+
+                self.r_total_ow = 1 / (self.ua_value_ow +
+                                       self.ua_value_win)
+                self.r_rest_ow = (self.r_total_ow - self.r1_ow - 1 / (
+                    ((1 / self.r_conv_inner_ow)
+                     + (1 / self.r_conv_inner_win)
+                     + (1 / self.r_rad_inner_ow)
+                     + (1 / self.r_rad_inner_win)))) - 1 / (
+                    self.alpha_comb_outer_ow * self.area_ow)
+
+            # zones without outer walls and windows keep the values of the
+            # outer walls, there is no area to weight the properties with
+            area = self.area_ow + self.area_win
+            if area > 0:
+                self.ir_emissivity_inner_ow = (
+                    (self.ir_emissivity_inner_ow * self.area_ow
+                     + self.ir_emissivity_inner_win * self.area_win)
+                    / area)
+
+                self.ir_emissivity_outer_ow = (
+                    (self.ir_emissivity_outer_ow * self.area_ow
+                     + self.ir_emissivity_win * self.area_win)
+                    / area)
+
+                self.solar_absorp_ow = (
+                    (self.solar_absorp_ow * self.area_ow
+                     + self.solar_absorp_win * self.area_win)
+                    / area)
+
+    def _calc_wf(self):
+        """Weightfactors for outer elements(walls, roof, ground floor, windows)
+
+        Calculates the weightfactors of the elements of all walls with an
+        ambient side and of the windows. If merge_windows is True, windows
+        and outer walls share their weightfactors.
+        """
+
+        if self.merge_windows is True:
+            ua_value_ow = self.ua_value_ow + self.ua_value_win
+            ua_value_win = ua_value_ow
+        elif self.merge_windows is False:
+            ua_value_ow = self.ua_value_ow
+            ua_value_win = self.ua_value_win
+        else:
+            raise ValueError("specify merge window method correctly")
+
+        self.weightfactor_ground = 0.0
+
+        for index, (suffix, description, groups, ambient_groups) in \
+                enumerate(self.outer_partitions):
+            if not ambient_groups:
+                continue
+            if index == 0:
+                ua_value = ua_value_ow
+            else:
+                ua_value = getattr(self, "ua_value_" + suffix)
+            for wall in self.element_store.elements(*groups):
+                wall.wf_out = wall.ua_value / ua_value
+            if "ground_floors" in groups:
+                self.weightfactor_ground = sum(
+                    gf.wf_out for gf in self.thermal_zone.ground_floors)
+
+        for win in self.thermal_zone.windows:
+            win.wf_out = win.ua_value / ua_value_win
+
+    def _calc_mean_values(self):
+        """Calculates mean values for inner and outer elements
+
+        This function calculates mean values inside the thermal zone (e.g.
+        the mean value for coefficient of radiative heat transfer between
+        inner and outer walls
+        """
+
+        suffixes = [partition[0] for partition in self.outer_partitions]
+        inner = suffixes[:1] + ["win"] + suffixes[1:]
+        if self.inner_groups:
+            inner.append("iw")
+        outer = [partition[0] for partition in self.outer_partitions
+                 if partition[3]] + ["win"]
+
+        self.alpha_rad_inner_mean = sum(
+            getattr(self, "area_" + suffix) *
+            getattr(self, "alpha_rad_inner_" + suffix)
+            for suffix in inner) / sum(
+            getattr(self, "area_" + suffix) for suffix in inner)
+        self.alpha_rad_outer_mean = sum(
+            getattr(self, "area_" + suffix) *
+            getattr(self, "alpha_rad_outer_" + suffix)
+            for suffix in outer) / sum(
+            getattr(self, "area_" + suffix) for suffix in outer)
+
+    def _facade_elements(self):
+        """Returns the outer elements that form the facades"""
+        zone = self.thermal_zone
+        elements = []
+        for group in self.facade_groups + ("windows",):
+            elements.extend(getattr(zone, group))
+        if self.facade_ground_floors is True:
+            elements.extend(zone.ground_floors)
+        return elements
+
+    def _find(self, groups, orientation, tilt):
+        """Returns the elements of the lists with orientation and tilt"""
+        elements = []
+        for group in groups:
+            elements.extend(getattr(self.thermal_zone, self.find_methods[
+                group])(orientation, tilt))
+        return elements
+
+    def _calc_number_of_elements(self):
+        """Calculates the number of facade elements with different tilt/orient
+
+        This function calculates the number of outer elements with a
+        different combination of orientation and tilt.
+        """
+
+        self.n_outer = len(set((element.orientation, element.tilt)
+                               for element in self._facade_elements()))
+
+        if self.rooftop_facades is True:
+            self.n_rt = len(set((roof.orientation, roof.tilt)
+                                for roof in self.thermal_zone.rooftops))
+
+    def _fill_zone_lists(self):
+        """Fills lists like weightfactors and tilt, orientation
+
+        Fills the lists of a zone  according to orientation and tilt of the
+        zone. Therefore it compares orientation and tilt of all outer
+        elements and then creates lists for zone weightfactors, orientation,
+        tilt, ares and sunblinds."""
+
+        tilt_orient = []
+        for element in self._facade_elements():
+            tilt_orient.append((element.orientation, element.tilt))
+        tilt_orient = list(set(tilt_orient))
+
+        for i in tilt_orient:
+            walls = self._find(self.facade_groups, i[0], i[1])
+            wins = self._find(("windows",), i[0], i[1])
+            gf = []
+            if self.facade_ground_floors is True:
+                gf = self._find(("ground_floors",), i[0], i[1])
+
+            if self.merge_windows is True:
+                self.facade_areas.append(sum([element.area for element in (
+                    walls + wins + gf)]))
+            else:
+                self.facade_areas.append(sum([element.area for element in (
+                    walls + gf)]))
+
+            self.orientation_facade.append(i[0])
+            self.tilt_facade.append(i[1])
+
+            if not walls:
+                self.weightfactor_ow.append(0.0)
+                if not gf:
+                    self.outer_wall_areas.append(0.0)
+                else:
+                    self.outer_wall_areas.append(sum([element.area for element
+                                                      in gf]))
+            else:
+                self.weightfactor_ow.append(
+                    sum([wall.wf_out for wall in walls]))
+                self.outer_wall_areas.append(sum([wall.area for wall in
+                                                  walls]))
+
+            if not wins:
+                self.weightfactor_win.append(0.0)
+                self.g_sunblind.append(0.0)
+                self.window_areas.append(0.0)
+                self.transparent_areas.append(0.0)
+            else:
+                self.weightfactor_win.append(
+                    sum([win.wf_out for win in wins]))
+                self.g_sunblind.append(
+                    sum([win.shading_g_total for win in wins]))
+
+                if self.merge_windows is False:
+                    self.window_areas.append(
+                        sum([win.area for win in wins]))
+                    self.transparent_areas.append(
+                        sum([win.area for win in wins]))
+
+                else:
+                    self.window_areas.append(0)
+                    self.transparent_areas.append(
+                        sum([win.area for win in wins]))
+
+        if self.rooftop_facades is not True:
+            return
+
+        tilt_orient_rt = []
+        for roof in self.thermal_zone.rooftops:
+            tilt_orient_rt.append((roof.orientation, roof.tilt))
+        tilt_orient_rt = list(set(tilt_orient_rt))
+
+        for i in tilt_orient_rt:
+            rts = self.thermal_zone.find_rts(i[0], i[1])
+
+            self.orientation_rt.append(i[0])
+            self.tilt_rt.append(i[1])
+            self.weightfactor_win_rt.append(0)
+            if not rts:
+                self.weightfactor_rt.append(0.0)
+                self.rooftop_areas.append(0.0)
+            else:
+                self.weightfactor_rt.append(
+                    sum([rt.wf_out for rt in rts]))
+                self.rooftop_areas.append(sum([rt.area for rt in rts]))
+
+    def _calc_heat_load(self):
+        """Static heat load calculation
+
+        This function calculates the static heat load of the thermal zone by
+        multiplying the UA-Value of the elements with the given Temperature
+        difference of t_inside and t_outside. And takes heat losses through
+        infiltration into account.
+
+        Attributes
+        ----------
+        ua_value_ow_temp : float [W/(m2*K)]
+            UA Value without GroundFloors
+        ua_value_gf_temp : float [W/(m2*K)]
+            UA Value of all GroundFloors
+        """
+        self.heat_load = 0.0
+        ua_value_gf_temp = self.element_store.total(
+            "ua_value", "ground_floors")
+        ua_value_ow_temp = self.element_store.total(
+            "ua_value", "outer_walls", "rooftops")
+        self.heat_load = \
+            ((((ua_value_ow_temp + self.ua_value_win) +
+               self.thermal_zone.volume *
+               self.thermal_zone.infiltration_rate * 1 / 3600 *
+               self.thermal_zone.heat_capac_air *
+               self.thermal_zone.density_air) * (self.thermal_zone.t_inside -
+                                                 self.thermal_zone.t_outside))
+             + (ua_value_gf_temp * (self.thermal_zone.t_inside -
+                                    self.thermal_zone.t_ground)))
+
+    def set_calc_default(self):
+        """sets default calculation parameters
+
+        Resets the attributes of all lumped walls of the model, the windows
+        and the zone lists.
+        """
+
+        quantities = ["area", "ua_value", "r_total", "r1", "c1",
+                      "ir_emissivity_inner"]
+        outer_coefficients = []
+        for kind in ("conv", "rad", "comb"):
+            quantities.extend(("alpha_" + kind + "_inner",
+                               "r_" + kind + "_inner"))
+            outer_coefficients.extend(("alpha_" + kind + "_outer",
+                                       "r_" + kind + "_outer"))
+
+        for suffix, description, groups, ambient_groups in \
+                self.outer_partitions:
+            names = quantities + ["r_rest"]
+            if ambient_groups:
+                names += outer_coefficients + ["ir_emissivity_outer",
+                                               "solar_absorp"]
+            for name in names:
+                setattr(self, name + "_" + suffix, 0.0)
+
+        # TODO: check this value
+        self.r_rad_ow_iw = 0.0
+        self.weightfactor_ow = []
+        self.weightfactor_ground = 0.0
+        self.outer_wall_areas = []
+
+        if self.inner_groups:
+            # adjacent thermal zones are not supported, values facing the
+            # adjacent zone stay 0.0
+            for name in quantities + outer_coefficients:
+                setattr(self, name + "_iw", 0.0)
+
+        if self.rooftop_facades is True:
+            self.r_rad_rt_iw = 0.0
+            self.weightfactor_rt = []
+            self.weightfactor_win_rt = []
+            self.rooftop_areas = []
+            self.tilt_rt = []
+            self.orientation_rt = []
+            self.n_rt = 0
+
+        # Attributes for windows
+        for name in quantities + outer_coefficients:
+            setattr(self, name + "_win", 0.0)
+        self.ir_emissivity_win = 0.0
+        self.solar_absorp_win = 0.0
+        self.ratio_conv_rad_inner_win = 0.0
+        self.u_value_win = 0.0
+        self.weightfactor_win = []
+        self.window_areas = []
+        self.transparent_areas = []
+        self.g_sunblind = []
+        self.weighted_g_value = 0.0
+
+        # Misc values
+
+        self.alpha_rad_inner_mean = 0.0
+        self.alpha_rad_outer_mean = 0.0
+        self.n_outer = 0
+        self.facade_areas = []
+        self.tilt_facade = []
+        self.orientation_facade = []
+        self.heat_load = 0.0
+        self.cool_load = 0.0
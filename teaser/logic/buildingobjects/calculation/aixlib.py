@@ -3,7 +3,6 @@
 
 """This module includes AixLib calculation class"""
 
-import scipy.io
 import teaser.logic.utilities as utilities
 import numpy as np
 import os
@@ -224,6 +223,8 @@ class AixLib(object):
                     else:
                         pass
 
+        import scipy.io
+
         scipy.io.savemat(
             path,
             mdict={'Tset': time_line},
@@ -310,6 +311,8 @@ class AixLib(object):
 
         ahu_boundary = np.array(time_line)
 
+        import scipy.io
+
         scipy.io.savemat(
             path,
             mdict={'AHU': ahu_boundary},
@@ -389,6 +392,8 @@ class AixLib(object):
 
         internal_boundary = np.array(time_line)
 
+        import scipy.io
+
         scipy.io.savemat(
             path,
             mdict={'Internals': internal_boundary},
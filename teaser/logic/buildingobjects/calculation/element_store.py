@@ -0,0 +1,191 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""This module includes the ElementStore class
+"""
+
+from __future__ import division
+import numpy as np
+
+
+class ElementStore(object):
+    """Columnar store of the building elements of one thermal zone.
+
+    The store gathers the attributes of all building elements of a thermal
+    zone into one NumPy array per element list and attribute. The
+    aggregation of the 1/2/3/4-element models sums over these arrays
+    instead of iterating the element objects for every single value.
+
+    The store is a snapshot, it is created by the models after the
+    equivalent resistances and UA-Values of the elements have been
+    calculated. The element objects stay the owners of their data, the
+    store is not updated if elements change afterwards.
+
+    Sums over several element lists are done list by list in the given
+    order, thus results are identical to sums over the element objects.
+
+    Parameters
+    ----------
+    thermal_zone: ThermalZone()
+        TEASER instance of ThermalZone
+
+    Attributes
+    ----------
+    groups : tuple
+        Names of the element lists of ThermalZone held by the store
+        ("outer_walls", "ground_floors", ...).
+    columns : tuple
+        Names of the attributes held for all element lists. Additionally
+        ir_emissivity_inner (first layer), ir_emissivity_outer and
+        solar_absorp_outer (last layer) are taken from the materials.
+    window_columns : tuple
+        Names of the attributes only held for windows.
+    """
+
+    groups = ("outer_walls", "ground_floors", "rooftops", "windows",
+              "inner_walls", "floors", "ceilings")
+
+    columns = ("area", "orientation", "tilt", "ua_value", "u_value", "r1",
+               "r2", "r3", "c1", "c2", "c1_korr", "r_conduc", "r_inner_conv",
+               "r_inner_rad", "r_inner_comb", "r_outer_conv", "r_outer_rad",
+               "r_outer_comb")
+
+    window_columns = ("g_value", "a_conv", "shading_g_total")
+
+    def __init__(self, thermal_zone):
+        """Constructor for ElementStore"""
+
+        self.thermal_zone = thermal_zone
+        self._elements = {}
+        self._data = {}
+
+        for group in self.groups:
+            self._gather(group, getattr(thermal_zone, group))
+
+    def _gather(self, group, elements):
+        """Collects the attribute values of one element list into arrays"""
+
+        names = self.columns
+        if group == "windows":
+            names = names + self.window_columns
+
+        rows = []
+        for element in elements:
+            row = [getattr(element, name, None) for name in names]
+            if element.layer:
+                inner = element.layer[0].material
+                outer = element.layer[-1].material
+                row.extend((inner.ir_emissivity, outer.ir_emissivity,
+                            outer.solar_absorp))
+            else:
+                row.extend((None, None, None))
+            rows.append([np.nan if value is None else value for value in row])
+
+        names = names + ("ir_emissivity_inner", "ir_emissivity_outer",
+                         "solar_absorp_outer")
+        self._elements[group] = list(elements)
+        self._data[group] = {}
+        for index, name in enumerate(names):
+            self._data[group][name] = np.array(
+                [row[index] for row in rows], dtype=float)
+
+    def elements(self, *groups):
+        """Returns the element objects of the given lists, in store order
+
+        Parameters
+        ----------
+        groups : str
+            Names of the element lists, e.g. "outer_walls", "rooftops"
+
+        Returns
+        -------
+        elements : list
+            Element objects, aligned with the rows of column()
+        """
+        elements = []
+        for group in groups:
+            elements.extend(self._elements[group])
+        return elements
+
+    def column(self, name, *groups):
+        """Returns the values of one attribute for the given element lists
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute, e.g. "area" or "r_inner_conv"
+        groups : str
+            Names of the element lists, e.g. "outer_walls", "rooftops"
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Values of all elements of the given lists, None is stored as NaN
+        """
+        if len(groups) == 1:
+            return self._data[groups[0]][name]
+        return np.concatenate([self._data[group][name] for group in groups])
+
+    def total(self, name, *groups):
+        """Sum of one attribute over the given element lists
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute, e.g. "area" or "ua_value"
+        groups : str
+            Names of the element lists, e.g. "outer_walls", "rooftops"
+
+        Returns
+        -------
+        total : float
+            Sum of the attribute
+        """
+        total = 0.0
+        for group in groups:
+            total += float(np.sum(self._data[group][name]))
+        return total
+
+    def total_reciprocal(self, name, *groups):
+        """Sum of the reciprocal of one attribute over the given element lists
+
+        Used for the parallel connection of resistances.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute, e.g. "r_inner_conv"
+        groups : str
+            Names of the element lists, e.g. "outer_walls", "rooftops"
+
+        Returns
+        -------
+        total : float
+            Sum of the reciprocal values of the attribute
+        """
+        total = 0.0
+        for group in groups:
+            total += float(np.sum(1 / self._data[group][name]))
+        return total
+
+    def total_weighted(self, name, *groups):
+        """Area-weighted sum of one attribute over the given element lists
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute, e.g. "ir_emissivity_inner"
+        groups : str
+            Names of the element lists, e.g. "outer_walls", "rooftops"
+
+        Returns
+        -------
+        total : float
+            Sum of the attribute times the element area, not divided by
+            the total area
+        """
+        total = 0.0
+        for group in groups:
+            data = self._data[group]
+            total += float(np.sum(data[name] * data["area"]))
+        return total
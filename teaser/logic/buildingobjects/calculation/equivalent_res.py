@@ -0,0 +1,265 @@
+# created October 2026
+# by TEASER4 Development Team
+
+"""This module includes the equivalent resistances and capacities of walls
+according to VDI 6007, calculated for many walls at once
+"""
+
+from __future__ import division
+import collections
+import numpy as np
+
+
+#: Values of constructions normalised to an area of 1 m2, by
+#: (BuildingElement.gather_layer_fingerprint(), t_bt). Windows use t_bt=None.
+#: Ordered from the least to the most recently used construction.
+_construction_cache = collections.OrderedDict()
+
+#: The least recently used constructions are removed from the cache when it
+#: exceeds this number of constructions
+max_cache_size = 10000
+
+
+def clear_cache():
+    """Clears the cached values of all constructions
+    """
+    _construction_cache.clear()
+
+
+def cached_per_area(fingerprint, t_bt=7):
+    """Returns the cached values of a construction for 1 m2
+
+    Parameters
+    ----------
+    fingerprint : tuple
+        Layer properties of the construction, see
+        BuildingElement.gather_layer_fingerprint()
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7), None for
+        the values of windows (see calc_window_res_per_area())
+
+    Returns
+    ----------
+    per_area : tuple or None
+        Values as calculated by calc_equivalent_res_per_area() or
+        calc_window_res_per_area(), None if the construction has not been
+        calculated yet
+    """
+    key = (fingerprint, t_bt)
+    per_area = _construction_cache.pop(key, None)
+    if per_area is not None:
+        # reinsert to mark the construction as most recently used
+        _construction_cache[key] = per_area
+    return per_area
+
+
+def _cache_result(key, per_area):
+    """Stores the values of one construction in the cache"""
+    _construction_cache[key] = per_area
+    while len(_construction_cache) > max_cache_size:
+        _construction_cache.popitem(last=False)
+
+
+def calc_equivalent_res(walls, t_bt=7):
+    """Equivalent resistance according to VDI 6007 for a list of walls.
+
+    Sets r1, r2, r3, c1, c2 and c1_korr of all given walls, like
+    Wall.calc_equivalent_res() does for one wall. The values for an area
+    of 1 m2 are cached by the layer fingerprint of the wall (see
+    BuildingElement.gather_layer_fingerprint()) and t_bt, walls with a
+    known construction are only scaled by their area. Changing a layer or
+    material changes the fingerprint, so modified walls never use stale
+    values. The values of all unknown constructions are calculated
+    together by calc_equivalent_res_per_area().
+
+    Parameters
+    ----------
+    walls : list
+        List of Wall instances (OuterWall, Rooftop, GroundFloor, InnerWall,
+        Floor, Ceiling, Door)
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+    """
+
+    fingerprints = []
+    values = {}
+    pending = {}
+    for wall in walls:
+        fingerprint = wall.gather_layer_fingerprint()
+        fingerprints.append(fingerprint)
+        if fingerprint in values or fingerprint in pending:
+            continue
+        per_area = cached_per_area(fingerprint, t_bt)
+        if per_area is None:
+            pending[fingerprint] = wall
+        else:
+            values[fingerprint] = per_area
+
+    results = calc_equivalent_res_per_area(list(pending.values()), t_bt=t_bt)
+    for fingerprint, per_area in zip(pending, results):
+        _cache_result((fingerprint, t_bt), per_area)
+        values[fingerprint] = per_area
+
+    for wall, fingerprint in zip(walls, fingerprints):
+        wall.scale_equivalent_res(values[fingerprint])
+
+
+def calc_window_res_per_area(window):
+    """Resistance and capacity of the layers of a window for 1 m2.
+
+    The values are cached by the layer fingerprint of the window like the
+    values of walls in calc_equivalent_res().
+
+    Parameters
+    ----------
+    window : Window
+        Window instance
+
+    Returns
+    ----------
+    per_area : tuple
+        Sum of the resistances in m2*K/W and sum of the capacities of all
+        layers (r_conduc, c_conduc)
+    """
+
+    key = (window.gather_layer_fingerprint(), None)
+    per_area = cached_per_area(*key)
+    if per_area is None:
+        r_conduc = 0.0
+        c_conduc = 0.0
+        for thickness, density, thermal_conduc, heat_capac in key[0]:
+            r_conduc += thickness / thermal_conduc
+            c_conduc += heat_capac * density * thickness
+        per_area = (r_conduc, c_conduc)
+        _cache_result(key, per_area)
+    return per_area
+
+
+def calc_equivalent_res_per_area(walls, t_bt=7):
+    """Equivalent resistance according to VDI 6007 for 1 m2 of each wall.
+
+    The layers of all walls are stacked into arrays of the shape (walls,
+    layers), walls with less layers are filled up with identity matrices.
+    Each layer is described by a complex 2x2 chain matrix, the matrices of
+    all walls are multiplied layer by layer with one batched matrix
+    multiplication.
+
+    Parameters
+    ----------
+    walls : list
+        List of Wall instances
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    per_area : list
+        Tuples of the equivalent resistances and capacities (r1, r2, r3,
+        c1, c2, c1_korr) in m2*K/W and J/(m2*K), one per wall
+    """
+
+    if not walls:
+        return []
+
+    nr_of_layer = max(len(wall.layer) for wall in walls)
+    r_layer = np.ones((len(walls), nr_of_layer))
+    c_layer = np.ones((len(walls), nr_of_layer))
+    mask = np.zeros((len(walls), nr_of_layer), dtype=bool)
+
+    for i, wall in enumerate(walls):
+        for j, layer in enumerate(wall.layer):
+            material = layer.material
+            r_layer[i, j] = layer.thickness / material.thermal_conduc
+            c_layer[i, j] = material.heat_capac * material.density * \
+                layer.thickness * 1000
+            mask[i, j] = True
+
+    omega = 2 * np.pi / (86400 * t_bt)
+
+    root = np.sqrt(0.5 * omega * r_layer * c_layer)
+    cosh = np.cosh(root)
+    sinh = np.sinh(root)
+    cos = np.cos(root)
+    sin = np.sin(root)
+
+    a_11 = cosh * cos + 1j * (sinh * sin)
+    a_12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
+        ((cosh * sin + sinh * cos) + 1j * (cosh * sin - sinh * cos))
+    a_21 = (1 / r_layer) * root * \
+        (-(cosh * sin - sinh * cos) + 1j * (cosh * sin + sinh * cos))
+
+    # -----chain matrix of each layer, identity for missing layers
+    a_layer = np.zeros((len(walls), nr_of_layer, 2, 2), dtype=complex)
+    a_layer[..., 0, 0] = np.where(mask, a_11, 1)
+    a_layer[..., 0, 1] = np.where(mask, a_12, 0)
+    a_layer[..., 1, 0] = np.where(mask, a_21, 0)
+    a_layer[..., 1, 1] = np.where(mask, a_11, 1)
+
+    # -----multiplication of the matrices of all walls
+    new_mat = np.zeros((len(walls), 2, 2), dtype=complex)
+    new_mat[:, 0, 0] = 1
+    new_mat[:, 1, 1] = 1
+    for j in range(nr_of_layer):
+        new_mat = np.matmul(new_mat, a_layer[:, j])
+
+    re_11 = new_mat[:, 0, 0].real
+    im_11 = new_mat[:, 0, 0].imag
+    re_12 = new_mat[:, 0, 1].real
+    im_12 = new_mat[:, 0, 1].imag
+    re_22 = new_mat[:, 1, 1].real
+    im_22 = new_mat[:, 1, 1].imag
+
+    # calculation of equivalent Resistance and capacities per area
+    r1 = ((re_22 - 1) * re_12 + im_22 * im_12) / \
+        ((re_22 - 1) ** 2 + im_22 ** 2)
+    r2 = ((re_11 - 1) * re_12 + im_11 * im_12) / \
+        ((re_11 - 1) ** 2 + im_11 ** 2)
+    c1 = ((re_22 - 1) ** 2 + im_22 ** 2) / \
+        (omega * (re_12 * im_22 - (re_22 - 1) * im_12))
+    c2 = ((re_11 - 1) ** 2 + im_11 ** 2) / \
+        (omega * (re_12 * im_11 - (re_11 - 1) * im_12))
+    r3 = np.sum(np.where(mask, r_layer, 0), axis=1) - r1 - r2
+
+    r_wall = r1 + r2 + r3
+
+    c1_korr = (1 / (omega * r1)) * \
+        ((r_wall - re_12 * re_22 - im_12 * im_22) /
+         (re_22 * im_12 - re_12 * im_22))
+
+    return [tuple(float(value[i]) for value in (r1, r2, r3, c1, c2, c1_korr))
+            for i in range(len(walls))]
+
+
+def calc_parallel_connection(r1, c1, omega):
+    """Parallel connection of walls according to VDI 6007
+
+    Calculates the parallel connection of wall elements according to VDI
+    6007, resulting in R1 and C1 (equation 23, 24). Instead of folding the
+    walls pairwise, the complex admittances i*omega*C1 / (1 + i*omega*R1*C1)
+    of all walls are summed and the resulting impedance is split into R1
+    and C1, which gives the same values.
+
+    Parameters
+    ----------
+    r1 : np.array
+        Equivalent resistances R1 of the walls in K/W
+    c1 : np.array
+        Equivalent capacities C1 of the walls in J/K
+    omega : float
+        VDI 6007 frequency
+
+    Returns
+    ----------
+    r1 : float [K/W]
+        VDI 6007 resistance for all walls
+    c1 : float [J/K]
+        VDI 6007 capacity for all walls
+    """
+
+    r1 = np.asarray(r1, dtype=float)
+    c1 = np.asarray(c1, dtype=float)
+
+    admittance = np.sum(1j * omega * c1 / (1 + 1j * omega * r1 * c1))
+    impedance = 1 / admittance
+
+    return float(impedance.real), float(-1 / (omega * impedance.imag))
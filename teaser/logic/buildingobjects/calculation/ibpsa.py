@@ -7,7 +7,6 @@
 import os
 
 import numpy as np
-import scipy.io
 
 import teaser.logic.utilities as utilities
 
@@ -166,6 +165,8 @@ class IBPSA(object):
 
         internal_boundary = np.array(time_line)
 
+        import scipy.io
+
         scipy.io.savemat(
             path,
             mdict={'Internals': internal_boundary},
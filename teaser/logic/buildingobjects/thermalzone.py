@@ -7,6 +7,7 @@ from __future__ import division
 import random
 import re
 import warnings
+from teaser.logic.utilities import TrackedList
 from teaser.logic.buildingobjects.calculation.one_element import OneElement
 from teaser.logic.buildingobjects.calculation.two_element import TwoElement
 from teaser.logic.buildingobjects.calculation.three_element import ThreeElement
@@ -87,6 +88,10 @@ class ThermalZone(object):
         average heat capacity of the air in the thermal zone
     """
 
+    _indexed_groups = {
+        "OuterWall": "outer_walls", "Door": "doors", "Rooftop": "rooftops",
+        "GroundFloor": "ground_floors", "Window": "windows"}
+
     def __init__(self, parent=None):
         """Constructor for ThermalZone
         """
@@ -98,14 +103,16 @@ class ThermalZone(object):
         self._area = None
         self._volume = None
         self._infiltration_rate = 0.4
-        self._outer_walls = []
-        self._doors = []
-        self._rooftops = []
-        self._ground_floors = []
-        self._windows = []
+        self._outer_walls = TrackedList()
+        self._doors = TrackedList()
+        self._rooftops = TrackedList()
+        self._ground_floors = TrackedList()
+        self._windows = TrackedList()
         self._inner_walls = []
         self._floors = []
         self._ceilings = []
+        self._element_index = None
+        self._element_index_order = {}
         self._use_conditions = None
         self.model_attr = None
         self.typical_length = None
@@ -152,6 +159,9 @@ class ThermalZone(object):
             Time constant according to VDI 6007 (default t_bt = 5)
         """
 
+        if self.parent is not None:
+            self.parent.resolve_bulk_edit()
+
         if number_of_elements == 1:
             self.model_attr = OneElement(
                 thermal_zone=self,
@@ -195,13 +205,7 @@ class ThermalZone(object):
         elements : list
             List of OuterWalls instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.outer_walls:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("outer_walls", orientation, tilt)
 
     def find_doors(self, orientation, tilt):
         """Returns all outer walls with given orientation and tilt
@@ -221,13 +225,7 @@ class ThermalZone(object):
         elements : list
             List of Doors instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.doors:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("doors", orientation, tilt)
 
     def find_rts(self, orientation, tilt):
         """Returns all rooftops with given orientation and tilt
@@ -247,13 +245,7 @@ class ThermalZone(object):
         elements : list
             List of Rooftop instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.rooftops:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("rooftops", orientation, tilt)
 
     def find_gfs(self, orientation, tilt):
         """Returns all ground floors with given orientation and tilt
@@ -273,13 +265,7 @@ class ThermalZone(object):
         elements : list
             List of GroundFloor instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.ground_floors:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("ground_floors", orientation, tilt)
 
     def find_wins(self, orientation, tilt):
         """Returns all windows with given orientation and tilt
@@ -299,13 +285,106 @@ class ThermalZone(object):
         elements : list
             List of Window instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.windows:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("windows", orientation, tilt)
+
+    def _find_elements(self, group, orientation, tilt):
+        """Returns the elements of one list with given orientation and tilt
+
+        Looks the elements up in the orientation/tilt index of the zone,
+        the elements are returned in the order of the element list.
+
+        Parameters
+        ----------
+        group : str
+            Name of the element list, e.g. "outer_walls"
+        orientation : float [degree]
+            Azimuth of the desired elements.
+        tilt : float [degree]
+            Tilt against the horizontal of the desired elements.
+
+        Returns
+        -------
+        elements : list
+            List of elements with desired orientation and tilt.
+        """
+        if not self._element_index_valid(group):
+            self._build_element_index()
+        return list(self._element_index[group].get((orientation, tilt), []))
+
+    def _element_index_valid(self, group):
+        """Checks whether the index still matches the element list
+
+        Elements are appended to the lists by their parent setters and the
+        lists can be changed directly. The lists are TrackedLists, every
+        change not made by add_element() marks the index as outdated.
+        """
+        return self._element_index is not None and \
+            not getattr(self, group).changed
+
+    def _build_element_index(self):
+        """Groups the outer elements by orientation and tilt
+
+        Builds the index used by find_walls(), find_doors(), find_rts(),
+        find_gfs() and find_wins() with one pass over the element lists.
+        """
+        self._element_index = {}
+        self._element_index_order = {}
+        for group in self._indexed_groups.values():
+            index = {}
+            elements = getattr(self, group)
+            for element in elements:
+                index.setdefault(
+                    (element.orientation, element.tilt), []).append(element)
+                self._element_index_order[id(element)] = \
+                    len(self._element_index_order)
+            self._element_index[group] = index
+            elements.changed = False
+
+    def _index_element(self, element, group):
+        """Adds a new element at the end of its list to the index"""
+        if not self._element_index_valid(group):
+            self._element_index = None
+            return
+        self._element_index[group].setdefault(
+            (element.orientation, element.tilt), []).append(element)
+        self._element_index_order[id(element)] = \
+            len(self._element_index_order)
+
+    def update_element_index(self, element, orientation, tilt):
+        """Moves an element in the index after orientation or tilt changed
+
+        Called by the building elements if orientation or tilt change. If
+        the element is newer than all elements of its new group it is
+        appended, otherwise the index is rebuilt on the next lookup to keep
+        the order of the element lists.
+
+        Parameters
+        ----------
+        element : BuildingElement()
+            The element whose orientation or tilt changed
+        orientation : float
+            Orientation of the element before the change
+        tilt : float
+            Tilt of the element before the change
+        """
+        group = self._indexed_groups.get(type(element).__name__)
+        if group is None or not self._element_index_valid(group):
+            return
+        order = self._element_index_order
+        index = self._element_index[group]
+        try:
+            elements = index[(orientation, tilt)]
+            elements.remove(element)
+        except (KeyError, ValueError):
+            self._element_index = None
+            return
+        if not elements:
+            del index[(orientation, tilt)]
+        elements = index.setdefault((element.orientation, element.tilt), [])
+        if elements and order[id(elements[-1])] > order[id(element)]:
+            self._element_index = None
+        else:
+            elements.append(element)
 
     def set_inner_wall_area(self):
         """Sets the inner wall area according to zone area
@@ -427,9 +506,54 @@ class ThermalZone(object):
             if tz.internal_id == self.internal_id:
                 self.parent.net_leased_area -= self.area
                 self.parent.thermal_zones.pop(index)
+                self.parent.invalidate_area_dicts()
 
                 break
 
+    def copy(self, parent=None):
+        """Returns a copy of the thermal zone
+
+        Copies the zone with its use conditions and all building elements
+        (see BuildingElement.copy()). Calculation results (model_attr) are
+        not copied, the copy needs to be calculated again.
+
+        Parameters
+        ----------
+        parent : Building()
+            Building the copy belongs to, if not None this adds the copy to
+            Building.thermal_zones. Area and volume of the copy are not added
+            to the building, as the building is expected to be a copy as
+            well. Default is None
+
+        Returns
+        ----------
+        zone : ThermalZone()
+            New thermal zone with the values and elements of this zone
+        """
+
+        zone = ThermalZone.__new__(ThermalZone)
+        zone.__dict__.update(self.__dict__)
+        zone.__dict__["_ThermalZone__parent"] = None
+        zone.internal_id = random.random()
+        zone.model_attr = None
+        zone._element_index = None
+        zone._element_index_order = {}
+        for group in ("_outer_walls", "_doors", "_rooftops",
+                      "_ground_floors", "_windows"):
+            zone.__dict__[group] = TrackedList()
+        for group in ("_inner_walls", "_floors", "_ceilings"):
+            zone.__dict__[group] = []
+        if self._use_conditions is not None:
+            zone._use_conditions = self._use_conditions.copy(parent=zone)
+        zone.parent = parent
+
+        for elements in (self._outer_walls, self._doors, self._rooftops,
+                         self._ground_floors, self._windows,
+                         self._inner_walls, self._floors, self._ceilings):
+            for element in elements:
+                element.copy(parent=zone)
+        return zone
+
     def add_element(self, building_element):
         """Adds a building element to the corresponding list
 
@@ -453,11 +577,14 @@ class ThermalZone(object):
             "Window"), ass_error_1
 
         if type(building_element).__name__ == "OuterWall":
-            self._outer_walls.append(building_element)
+            list.append(self._outer_walls, building_element)
+            self._index_element(building_element, "outer_walls")
         elif type(building_element).__name__ == "GroundFloor":
-            self._ground_floors.append(building_element)
+            list.append(self._ground_floors, building_element)
+            self._index_element(building_element, "ground_floors")
         elif type(building_element).__name__ == "Rooftop":
-            self._rooftops.append(building_element)
+            list.append(self._rooftops, building_element)
+            self._index_element(building_element, "rooftops")
         elif type(building_element).__name__ == "InnerWall":
             self._inner_walls.append(building_element)
         elif type(building_element).__name__ == "Ceiling":
@@ -465,7 +592,11 @@ class ThermalZone(object):
         elif type(building_element).__name__ == "Floor":
             self._floors.append(building_element)
         elif type(building_element).__name__ == "Window":
-            self._windows.append(building_element)
+            list.append(self._windows, building_element)
+            self._index_element(building_element, "windows")
+
+        if self.parent is not None:
+            self.parent.invalidate_area_dicts()
 
     @property
     def parent(self):
@@ -479,6 +610,7 @@ class ThermalZone(object):
             if inspect.isclass(Building):
                 self.__parent = value
                 self.__parent.thermal_zones.append(self)
+                self.__parent.invalidate_area_dicts()
 
     @property
     def name(self):
@@ -505,7 +637,7 @@ class ThermalZone(object):
     @outer_walls.setter
     def outer_walls(self, value):
         if value is None:
-            self._outer_walls = []
+            self._outer_walls = TrackedList()
 
     @property
     def doors(self):
@@ -514,7 +646,7 @@ class ThermalZone(object):
     @doors.setter
     def doors(self, value):
         if value is None:
-            self._doors = []
+            self._doors = TrackedList()
 
     @property
     def rooftops(self):
@@ -523,7 +655,7 @@ class ThermalZone(object):
     @rooftops.setter
     def rooftops(self, value):
         if value is None:
-            self._rooftops = []
+            self._rooftops = TrackedList()
 
     @property
     def ground_floors(self):
@@ -532,7 +664,7 @@ class ThermalZone(object):
     @ground_floors.setter
     def ground_floors(self, value):
         if value is None:
-            self._ground_floors = []
+            self._ground_floors = TrackedList()
 
     @property
     def ceilings(self):
@@ -570,7 +702,7 @@ class ThermalZone(object):
     def windows(self, value):
 
         if value is None:
-            self._windows = []
+            self._windows = TrackedList()
 
     @property
     def use_conditions(self):
@@ -606,7 +738,10 @@ class ThermalZone(object):
             except:
                 raise ValueError("Can't convert zone area to float")
 
-        if self.parent is not None:
+        if self.parent is not None and \
+                self.parent.defer_area_change(self._area, value):
+            self._area = value
+        elif self.parent is not None:
             if self._area is None:
                 if self.parent.net_leased_area is None:
                     self.parent.net_leased_area = 0.0
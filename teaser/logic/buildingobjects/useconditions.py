@@ -55,3 +55,29 @@ class UseConditions(object):
         else:
 
             self._parent = None
+
+    def copy(self, parent=None):
+        """Returns a copy of the use conditions
+
+        Lists (e.g. the profiles) are copied, all other values are shared
+        with the original.
+
+        Parameters
+        ----------
+        parent : ThermalZone()
+            Thermal zone the copy belongs to. Default is None
+
+        Returns
+        ----------
+        use_conditions : UseConditions()
+            New instance of the same class with the values of this instance
+        """
+
+        use_conditions = type(self).__new__(type(self))
+        for key, value in self.__dict__.items():
+            if isinstance(value, list):
+                value = list(value)
+            use_conditions.__dict__[key] = value
+        use_conditions.internal_id = random.random()
+        use_conditions.parent = parent
+        return use_conditions
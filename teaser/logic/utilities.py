@@ -8,6 +8,58 @@ classes
 import os
 import shutil
 
+OUTPUT_PATH_VARIABLE = "TEASER_OUTPUT_PATH"
+"""Environment variable holding the default output path of TEASER"""
+
+
+class TrackedList(list):
+    """List that marks itself as changed on every modification
+
+    Used for lists that can be changed directly by the user while their
+    owner keeps a registry or an index of the items, e.g. Project.buildings
+    or the outer element lists of ThermalZone. The owner rebuilds the
+    registry if changed is True and resets the flag. Items the owner
+    registers itself are added with list.append(), which leaves the flag
+    untouched.
+
+    Attributes
+    ----------
+    changed : bool
+        True if the list has been modified since the owner reset the flag
+    """
+
+    def __init__(self, *args):
+        super(TrackedList, self).__init__(*args)
+        self.changed = False
+
+    def _changing(method):
+        def changing(self, *args, **kwargs):
+            self.changed = True
+            return method(self, *args, **kwargs)
+        changing.__name__ = method.__name__
+        changing.__doc__ = method.__doc__
+        return changing
+
+    __setitem__ = _changing(list.__setitem__)
+    __delitem__ = _changing(list.__delitem__)
+    __iadd__ = _changing(list.__iadd__)
+    __imul__ = _changing(list.__imul__)
+    append = _changing(list.append)
+    extend = _changing(list.extend)
+    insert = _changing(list.insert)
+    pop = _changing(list.pop)
+    remove = _changing(list.remove)
+    sort = _changing(list.sort)
+    reverse = _changing(list.reverse)
+    if hasattr(list, "clear"):
+        clear = _changing(list.clear)
+    if hasattr(list, "__setslice__"):
+        # Python 2 handles simple slices without __setitem__/__delitem__
+        __setslice__ = _changing(list.__setslice__)
+        __delslice__ = _changing(list.__delslice__)
+
+    del _changing
+
 
 def celsius_to_kelvin(value):
     try:
@@ -20,23 +72,30 @@ def celsius_to_kelvin(value):
 def create_path(path):
     """Create a folder.
 
-    Creates a new folder.
+    Creates a new folder and all missing parent folders. The working
+    directory of the process is not changed, so several threads can export
+    at the same time. Folders created concurrently by another thread or
+    process are accepted.
 
     Parameters
     ----------
     path : str
+        Path of the folder, relative paths are resolved against the current
+        working directory
+
+    Returns
+    ----------
+    path : str
+        Absolute and normalized path of the folder
 
     """
-    path = os.path.normpath(path)
-    # if directory exists change into that directory
-    if(os.path.isdir(path)):
-        os.chdir(path)
-        return path
-    else:
-        if not os.path.exists(path):
+    path = os.path.abspath(path)
+    if not os.path.isdir(path):
+        try:
             os.makedirs(path)
-
-        os.chdir(path)
+        except OSError:
+            if not os.path.isdir(path):
+                raise
     return path
 
 
@@ -44,19 +103,25 @@ def get_default_path():
     """Function to construct default path to OutputData folder
     This function constructs the default path to the OutputData folder
 
-    """
+    The path is taken from the environment variable TEASER_OUTPUT_PATH if it
+    is set, otherwise it is the folder TEASEROutput in the home directory of
+    the user. The folder is not created here but by the functions writing
+    into it.
 
-    home_path = os.path.expanduser('~')
+    Returns
+    ----------
+    teaser_default_path : str
+
+    """
 
-    teaser_default_path = os.path.join(home_path, 'TEASEROutput')
+    teaser_default_path = os.environ.get(OUTPUT_PATH_VARIABLE)
 
-    # directory = os.path.dirname(__file__)
-    # src = "teaser"
-    # last_index = directory.rfind(src)
-    # teaser_default_path = os.path.join(directory[:last_index], "teaser",
-    # "OutputData")
+    if not teaser_default_path:
+        teaser_default_path = os.path.join(
+            os.path.expanduser('~'),
+            'TEASEROutput')
 
-    return teaser_default_path
+    return os.path.expanduser(teaser_default_path)
 
 
 def get_full_path(rel_path):
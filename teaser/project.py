@@ -4,44 +4,13 @@
 """This module includes the Project class, which is the API for TEASER.
 """
 
+import contextlib
 import warnings
 import os
 import re
 import teaser.logic.utilities as utilities
-import teaser.data.input.teaserxml_input as txml_in
-import teaser.data.output.teaserxml_output as txml_out
-import teaser.data.output.aixlib_output as aixlib_output
-import teaser.data.output.ibpsa_output as ibpsa_output
-import teaser.data.output.text_output as text_out
 from teaser.data.dataclass import DataClass
-from teaser.logic.archetypebuildings.bmvbs.office import Office
-from teaser.logic.archetypebuildings.bmvbs.custom.institute import Institute
-from teaser.logic.archetypebuildings.bmvbs.custom.institute4 import Institute4
-from teaser.logic.archetypebuildings.bmvbs.custom.institute8 import Institute8
-from teaser.logic.archetypebuildings.urbanrenet.est1a import EST1a
-from teaser.logic.archetypebuildings.urbanrenet.est1b import EST1b
-from teaser.logic.archetypebuildings.urbanrenet.est2 import EST2
-from teaser.logic.archetypebuildings.urbanrenet.est3 import EST3
-from teaser.logic.archetypebuildings.urbanrenet.est4a import EST4a
-from teaser.logic.archetypebuildings.urbanrenet.est4b import EST4b
-from teaser.logic.archetypebuildings.urbanrenet.est5 import EST5
-from teaser.logic.archetypebuildings.urbanrenet.est6 import EST6
-from teaser.logic.archetypebuildings.urbanrenet.est7 import EST7
-from teaser.logic.archetypebuildings.urbanrenet.est8a import EST8a
-from teaser.logic.archetypebuildings.urbanrenet.est8b import EST8b
-from teaser.logic.archetypebuildings.tabula.de.singlefamilyhouse import \
-    SingleFamilyHouse
-from teaser.logic.archetypebuildings.tabula.de.terracedhouse import \
-    TerracedHouse
-from teaser.logic.archetypebuildings.tabula.de.multifamilyhouse import \
-    MultiFamilyHouse
-from teaser.logic.archetypebuildings.tabula.de.apartmentblock import \
-    ApartmentBlock
-from teaser.logic.archetypebuildings.bmvbs.singlefamilydwelling import \
-    SingleFamilyDwelling
 from teaser.logic.simulation.modelicainfo import ModelicaInfo
-import teaser.data.output.citygml_output as citygml_out
-import teaser.data.input.citygml_input as citygml_in
 
 
 class Project(object):
@@ -60,17 +29,30 @@ class Project(object):
         should be loaded. default = False but will be automatically loaded
         once you add a archetype building. For building generation from
         scratch, set to True
+    output_path : str
+        Folder the outputs of the project are written to if no path is
+        given to the save and export functions. Default is None, which uses
+        the default output path of TEASER (see
+        utilities.get_default_path()). The folder is created on the first
+        write.
 
     Attributes
     ----------
 
     name : str
         Name of the Project (default is 'Project')
+    output_path : str
+        Folder the outputs of the project are written to if no path is
+        given to the save and export functions
     modelica_info : instance of ModelicaInfo
         TEASER instance of ModelicaInfo to store Modelica related
         information, like used compiler, runtime, etc.
     buildings : list
-        List of all buildings in one project, instances of Building()
+        List of all buildings in one project, instances of Building().
+        Buildings are added by setting their parent, the project registers
+        them by internal_id and name (see get_building_by_id() and
+        get_buildings_by_name()). Setting buildings stores a copy of the
+        given list, direct changes of buildings update the registry.
     data : instance of DataClass
         TEASER instance of DataClass containing XML binding classes
     weather_file_path : str
@@ -87,10 +69,11 @@ class Project(object):
         used library (AixLib and IBPSA are supported)
     """
 
-    def __init__(self, load_data=False):
+    def __init__(self, load_data=False, output_path=None):
         """Constructor of Project Class.
         """
         self._name = "Project"
+        self.output_path = output_path
         self.modelica_info = ModelicaInfo()
 
         self.weather_file_path = utilities.get_full_path(
@@ -101,7 +84,9 @@ class Project(object):
                 "weatherdata",
                 "DEU_BW_Mannheim_107290_TRY2010_12_Jahr_BBSR.mos"))
 
+        self._next_building_id = 0
         self.buildings = []
+        self._bulk_edit_level = 0
 
         self.load_data = load_data
 
@@ -126,6 +111,163 @@ class Project(object):
         """
         return DataClass()
 
+    def replicate(
+            self,
+            building,
+            names,
+            net_leased_areas=None,
+            rotations=None):
+        """Adds copies of one building to the project
+
+        Uses Building.clone() to copy a generated (archetype) building for
+        each name, which is much faster than generating every building
+        again. Buildings that differ only in name, area or orientation can
+        be added this way.
+
+        Parameters
+        ----------
+        building : Building()
+            Building (or archetype) instance of TEASER to copy
+        names : list
+            Names of the copies, one copy is added per name
+        net_leased_areas : list
+            Net leased areas of the copies in the order of names, default is
+            None (area of building)
+        rotations : list
+            Rotations of the copies in degree in the order of names, default
+            is None (no rotation)
+
+        Returns
+        ----------
+        buildings : list
+            The copies added to the project
+        """
+
+        buildings = []
+        with self.bulk_edit():
+            for index, name in enumerate(names):
+                buildings.append(building.clone(
+                    name=name,
+                    net_leased_area=(
+                        None if net_leased_areas is None
+                        else net_leased_areas[index]),
+                    rotation=None if rotations is None else rotations[index],
+                    parent=self))
+        return buildings
+
+    def register_building(self, building):
+        """Adds a building to the project and its registry
+
+        Called by Building.parent. The building is appended to buildings
+        and gets the next free internal_id of the project, buildings
+        already registered are skipped. Ids are given in order, projects
+        built the same way get the same ids.
+
+        Parameters
+        ----------
+        building : Building()
+            Building (or archetype) instance of TEASER
+        """
+        self._check_building_registry()
+        if building.internal_id is not None and \
+                self._building_ids.get(building.internal_id) is building:
+            return
+        list.append(self._buildings, building)
+        self._index_building(building)
+
+    def rename_building(self, building, name):
+        """Updates the registry after the name of a building changed
+
+        Parameters
+        ----------
+        building : Building()
+            Building of the project with the new name
+        name : str
+            Name of the building before the change
+        """
+        buildings = self._building_names.get(name)
+        if buildings is None or building not in buildings:
+            return
+        buildings.remove(building)
+        if not buildings:
+            del self._building_names[name]
+        self._building_names.setdefault(building.name, []).append(building)
+
+    def get_building_by_id(self, internal_id):
+        """Returns the building with the given internal_id
+
+        Parameters
+        ----------
+        internal_id : int
+            internal_id of the building
+
+        Returns
+        ----------
+        building : Building()
+            Building with the given id, None if there is none
+        """
+        self._check_building_registry()
+        return self._building_ids.get(internal_id)
+
+    def get_buildings_by_name(self, name):
+        """Returns all buildings with the given name
+
+        Parameters
+        ----------
+        name : str
+            Name of the buildings
+
+        Returns
+        ----------
+        buildings : list
+            Buildings with the given name, in order of the project
+        """
+        self._check_building_registry()
+        return list(self._building_names.get(name, []))
+
+    def _index_building(self, building):
+        """Adds a building of buildings to the id and name dictionaries"""
+        if building.internal_id is None or \
+                building.internal_id in self._building_ids:
+            while self._next_building_id in self._building_ids:
+                self._next_building_id += 1
+            building.internal_id = self._next_building_id
+            self._next_building_id += 1
+        self._building_ids[building.internal_id] = building
+        self._building_names.setdefault(building.name, []).append(building)
+
+    def _check_building_registry(self):
+        """Rebuilds the registry if buildings has been changed directly"""
+        if self._buildings.changed:
+            self._building_ids = {}
+            self._building_names = {}
+            for bldg in self._buildings:
+                self._index_building(bldg)
+            self._buildings.changed = False
+
+    @contextlib.contextmanager
+    def bulk_edit(self):
+        """Context manager for many changes of the project at once
+
+        Activates Building.bulk_edit() for all buildings of the project,
+        including buildings added inside the context. The queued cascades
+        of each building are resolved on exit of the outermost context.
+        """
+        self._bulk_edit_level += 1
+        try:
+            yield self
+        finally:
+            self._bulk_edit_level -= 1
+            if self._bulk_edit_level == 0:
+                for bldg in self.buildings:
+                    if not bldg.in_bulk_edit:
+                        bldg.resolve_bulk_edit()
+
+    @property
+    def in_bulk_edit(self):
+        """True inside Project.bulk_edit()"""
+        return self._bulk_edit_level > 0
+
     def calc_all_buildings(self, raise_errors=False):
         """Calculates values for all project buildings
 
@@ -217,39 +359,27 @@ class Project(object):
         ass_error_type = "only 'retrofit' and 'adv_retrofit' are valid "
         assert type_of_retrofit in [None, 'adv_retrofit', 'retrofit'], \
             ass_error_type
-        tabula_buildings = []
-        iwu_buildings = []
+        from teaser.logic.archetypebuildings.tabula.de.singlefamilyhouse \
+            import SingleFamilyHouse
 
         for bldg in self.buildings:
             if isinstance(bldg, SingleFamilyHouse):
                 if type_of_retrofit is None:
                     raise ValueError("you need to set type_of_retrofit for "
                                      "TABULA retrofit")
-                tabula_buildings.append(bldg)
             else:
                 if year_of_retrofit is None:
                     raise ValueError("you need to set year_of_retrofit for "
                                      "retrofit")
-                iwu_buildings.append(bldg)
-
-        if self.data.used_statistic == 'iwu':
-            for bld_iwu in iwu_buildings:
-                bld_iwu.retrofit_building(
-                    year_of_retrofit=year_of_retrofit,
-                    window_type=window_type,
-                    material=material)
-            self.data = DataClass(used_statistic='tabula_de')
-            for bld_tabula in tabula_buildings:
-                bld_tabula.retrofit_building(
-                    type_of_retrofit=type_of_retrofit)
 
-        else:
-            for bld_tabula in tabula_buildings:
-                bld_tabula.retrofit_building(
+        # each building loads its type elements from the catalog of its own
+        # statistic (Building.used_statistic)
+        for bldg in self.buildings:
+            if isinstance(bldg, SingleFamilyHouse):
+                bldg.retrofit_building(
                     type_of_retrofit=type_of_retrofit)
-            self.data = DataClass(used_statistic='iwu')
-            for bld_iwu in iwu_buildings:
-                bld_iwu.retrofit_building(
+            else:
+                bldg.retrofit_building(
                     year_of_retrofit=year_of_retrofit,
                     window_type=window_type,
                     material=material)
@@ -342,11 +472,11 @@ class Project(object):
 
         if self.data is None:
             self.data = DataClass(used_statistic='iwu')
-        elif self.data.used_statistic != 'iwu':
-            self.data = DataClass(used_statistic='iwu')
 
         if usage == 'office':
 
+            from teaser.logic.archetypebuildings.bmvbs.office import Office
+
             type_bldg = Office(
                 self,
                 name,
@@ -361,6 +491,9 @@ class Project(object):
 
         elif usage == 'institute':
 
+            from teaser.logic.archetypebuildings.bmvbs.custom.institute \
+                import Institute
+
             type_bldg = Institute(
                 self,
                 name,
@@ -375,6 +508,9 @@ class Project(object):
 
         elif usage == 'institute4':
 
+            from teaser.logic.archetypebuildings.bmvbs.custom.institute4 \
+                import Institute4
+
             type_bldg = Institute4(
                 self,
                 name,
@@ -389,6 +525,9 @@ class Project(object):
 
         elif usage == 'institute8':
 
+            from teaser.logic.archetypebuildings.bmvbs.custom.institute8 \
+                import Institute8
+
             type_bldg = Institute8(
                 self,
                 name,
@@ -530,10 +669,17 @@ class Project(object):
 
         if method == 'tabula_de':
 
+            from teaser.logic.archetypebuildings.tabula.de.singlefamilyhouse \
+                import SingleFamilyHouse
+            from teaser.logic.archetypebuildings.tabula.de.terracedhouse \
+                import TerracedHouse
+            from teaser.logic.archetypebuildings.tabula.de.multifamilyhouse \
+                import MultiFamilyHouse
+            from teaser.logic.archetypebuildings.tabula.de.apartmentblock \
+                import ApartmentBlock
+
             if self.data is None:
                 self.data = DataClass(used_statistic=method)
-            elif self.data.used_statistic != 'tabula_de':
-                self.data = DataClass(used_statistic=method)
 
             ass_error_usage_tabula = "only 'single_family_house',"
             "'terraced_house', 'multi_family_house', 'apartment_block' are"
@@ -601,10 +747,11 @@ class Project(object):
 
         elif method == 'iwu':
 
+            from teaser.logic.archetypebuildings.bmvbs.singlefamilydwelling \
+                import SingleFamilyDwelling
+
             if self.data is None:
                 self.data = DataClass(used_statistic=method)
-            elif self.data.used_statistic != 'iwu':
-                self.data = DataClass(used_statistic=method)
 
             ass_error_usage_iwu = "only 'single_family_dwelling' is a valid " \
                                   "usage for iwu archetype method"
@@ -629,10 +776,20 @@ class Project(object):
 
         elif method == 'urbanrenet':
 
+            from teaser.logic.archetypebuildings.urbanrenet.est1a import EST1a
+            from teaser.logic.archetypebuildings.urbanrenet.est1b import EST1b
+            from teaser.logic.archetypebuildings.urbanrenet.est2 import EST2
+            from teaser.logic.archetypebuildings.urbanrenet.est3 import EST3
+            from teaser.logic.archetypebuildings.urbanrenet.est4a import EST4a
+            from teaser.logic.archetypebuildings.urbanrenet.est4b import EST4b
+            from teaser.logic.archetypebuildings.urbanrenet.est5 import EST5
+            from teaser.logic.archetypebuildings.urbanrenet.est6 import EST6
+            from teaser.logic.archetypebuildings.urbanrenet.est7 import EST7
+            from teaser.logic.archetypebuildings.urbanrenet.est8a import EST8a
+            from teaser.logic.archetypebuildings.urbanrenet.est8b import EST8b
+
             if self.data is None:
                 self.data = DataClass(used_statistic='iwu')
-            elif self.data.used_statistic != 'iwu':
-                self.data = DataClass(used_statistic='iwu')
 
             ass_error_usage_urn = "only 'est1a', 'est1b', 'est2', 'est3', " \
                                   "'est4a', 'est4b', 'est5' 'est6', 'est7', " \
@@ -824,6 +981,8 @@ class Project(object):
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
 
+        from teaser.logic.archetypebuildings.bmvbs.office import Office
+
         type_bldg = Office(
             self,
             name,
@@ -865,6 +1024,10 @@ class Project(object):
                       "generation, consider rewriting you code to use "
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
+
+        from teaser.logic.archetypebuildings.bmvbs.custom.institute \
+            import Institute
+
         type_bldg = Institute(
             self,
             name,
@@ -907,6 +1070,9 @@ class Project(object):
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
 
+        from teaser.logic.archetypebuildings.bmvbs.custom.institute4 \
+            import Institute4
+
         type_bldg = Institute4(
             self,
             name,
@@ -948,6 +1114,9 @@ class Project(object):
                       "generation, consider rewriting you code to use "
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
+        from teaser.logic.archetypebuildings.bmvbs.custom.institute8 \
+            import Institute8
+
         type_bldg = Institute8(
             self,
             name,
@@ -989,6 +1158,8 @@ class Project(object):
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
 
+        from teaser.logic.archetypebuildings.urbanrenet.est1a import EST1a
+
         type_bldg = EST1a(
             self,
             name,
@@ -1030,6 +1201,8 @@ class Project(object):
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
 
+        from teaser.logic.archetypebuildings.urbanrenet.est1b import EST1b
+
         type_bldg = EST1b(
             self,
             name,
@@ -1072,6 +1245,8 @@ class Project(object):
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
 
+        from teaser.logic.archetypebuildings.urbanrenet.est4b import EST4b
+
         type_bldg = EST4b(
             self,
             name,
@@ -1114,6 +1289,8 @@ class Project(object):
                       "Project.add_non_residential(). This function will be "
                       "eliminated within the next versions")
 
+        from teaser.logic.archetypebuildings.urbanrenet.est7 import EST7
+
         type_bldg = EST7(
             self,
             name,
@@ -1159,6 +1336,9 @@ class Project(object):
                       "Project.add_residential(). This function will be "
                       "eliminated within the next versions")
 
+        from teaser.logic.archetypebuildings.bmvbs.singlefamilydwelling \
+            import SingleFamilyDwelling
+
         type_bldg = SingleFamilyDwelling(
             self,
             name,
@@ -1201,10 +1381,13 @@ class Project(object):
             name = file_name
 
         if path is None:
-            new_path = os.path.join(utilities.get_default_path(), name)
+            utilities.create_path(self.output_path)
+            new_path = os.path.join(self.output_path, name)
         else:
             new_path = os.path.join(path, name)
 
+        import teaser.data.output.teaserxml_output as txml_out
+
         txml_out.save_teaser_xml(new_path, self)
 
     def load_project(self, path):
@@ -1219,6 +1402,8 @@ class Project(object):
 
         """
 
+        import teaser.data.input.teaserxml_input as txml_in
+
         txml_in.load_teaser_xml(path, self)
 
     def save_citygml(self, file_name=None, path=None):
@@ -1244,10 +1429,13 @@ class Project(object):
             name = file_name
 
         if path is None:
-            new_path = os.path.join(utilities.get_default_path(), name)
+            utilities.create_path(self.output_path)
+            new_path = os.path.join(self.output_path, name)
         else:
             new_path = os.path.join(path, name)
-            utilities.create_path(utilities.get_full_path(path))
+            utilities.create_path(path)
+
+        import teaser.data.output.citygml_output as citygml_out
 
         citygml_out.save_gml(self, new_path)
 
@@ -1273,6 +1461,8 @@ class Project(object):
 
         """
 
+        import teaser.data.input.citygml_input as citygml_in
+
         citygml_in.load_gml(path, self)
 
     def export_aixlib(
@@ -1296,14 +1486,16 @@ class Project(object):
         Parameters
         ----------
 
-        internal_id : float
+        internal_id : int
             setter of a specific building which will be exported, if None then
             all buildings will be exported
         path : string
-            if the Files should not be stored in default output path of TEASER,
-            an alternative path can be specified as a full path
+            if the Files should not be stored in the output path of the
+            project, an alternative path can be specified as a full path
         """
 
+        import teaser.data.output.aixlib_output as aixlib_output
+
         if building_model is not None or zone_model is not None or corG is \
                 not None:
 
@@ -1314,14 +1506,14 @@ class Project(object):
 
         if path is None:
             path = os.path.join(
-                utilities.get_default_path(),
+                self.output_path,
                 self.name)
         else:
             path = os.path.join(
                 path,
                 self.name)
 
-        utilities.create_path(path)
+        path = utilities.create_path(path)
 
         if internal_id is None:
             aixlib_output.export_multizone(
@@ -1329,12 +1521,12 @@ class Project(object):
                 prj=self,
                 path=path)
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    aixlib_output.export_multizone(
-                        buildings=[bldg],
-                        prj=self,
-                        path=path)
+            bldg = self.get_building_by_id(internal_id)
+            if bldg is not None:
+                aixlib_output.export_multizone(
+                    buildings=[bldg],
+                    prj=self,
+                    path=path)
         return path
 
     def export_ibpsa(
@@ -1355,14 +1547,16 @@ class Project(object):
             just a core set of models and should not be used standalone.
             Valid values are 'AixLib' (default), 'Buildings',
             'BuildingSystems' and 'IDEAS'.
-        internal_id : float
+        internal_id : int
             setter of a specific building which will be exported, if None then
             all buildings will be exported
         path : string
-            if the Files should not be stored in default output path of TEASER,
-            an alternative path can be specified as a full path
+            if the Files should not be stored in the output path of the
+            project, an alternative path can be specified as a full path
         """
 
+        import teaser.data.output.ibpsa_output as ibpsa_output
+
         ass_error_1 = "library for IBPSA export has to be 'AixLib', " \
                       "'Buildings', 'BuildingSystems' or 'IDEAS'"
 
@@ -1371,14 +1565,14 @@ class Project(object):
 
         if path is None:
             path = os.path.join(
-                utilities.get_default_path(),
+                self.output_path,
                 self.name)
         else:
             path = os.path.join(
                 path,
                 self.name)
 
-        utilities.create_path(path)
+        path = utilities.create_path(path)
 
         if internal_id is None:
             ibpsa_output.export_ibpsa(
@@ -1387,12 +1581,12 @@ class Project(object):
                 path=path,
                 library=library)
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    ibpsa_output.export_ibpsa(
-                        buildings=[bldg],
-                        prj=self,
-                        path=path)
+            bldg = self.get_building_by_id(internal_id)
+            if bldg is not None:
+                ibpsa_output.export_ibpsa(
+                    buildings=[bldg],
+                    prj=self,
+                    path=path)
         return path
 
     def export_parameters_txt(self, path=None):
@@ -1408,13 +1602,15 @@ class Project(object):
 
         if path is None:
             path = os.path.join(
-                utilities.get_default_path(),
+                self.output_path,
                 self.name)
         else:
             path = os.path.join(
                 path,
                 self.name)
 
+        import teaser.data.output.text_output as text_out
+
         text_out.export_parameters_txt(
             prj=self,
             path=path)
@@ -1444,6 +1640,7 @@ class Project(object):
                 "weatherdata",
                 "DEU_BW_Mannheim_107290_TRY2010_12_Jahr_BBSR.mos"))
 
+        self._next_building_id = 0
         self.buildings = []
 
         self.load_data = load_data
@@ -1469,6 +1666,20 @@ class Project(object):
         self._merge_windows_calc = False
         self._used_library_calc = "AixLib"
 
+    @property
+    def buildings(self):
+        return self._buildings
+
+    @buildings.setter
+    def buildings(self, value):
+        if value is None:
+            value = []
+        self._buildings = utilities.TrackedList(value)
+        self._building_ids = {}
+        self._building_names = {}
+        for bldg in self._buildings:
+            self._index_building(bldg)
+
     @property
     def number_of_elements_calc(self):
         return self._number_of_elements_calc
@@ -1517,6 +1728,19 @@ class Project(object):
         for bldg in self.buildings:
             bldg.used_library_calc = value
 
+    @property
+    def output_path(self):
+        if self._output_path is None:
+            return utilities.get_default_path()
+        return self._output_path
+
+    @output_path.setter
+    def output_path(self, value):
+        if value is None:
+            self._output_path = None
+        else:
+            self._output_path = os.path.expanduser(value)
+
     @property
     def name(self):
         return self._name
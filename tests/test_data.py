@@ -1341,6 +1341,81 @@ class Test_teaser(object):
         assert round(r1_ow, 14) == 0.00100751548411
         assert round(c1_ow, 5) == 3648580.59312
 
+    def test_element_store(self):
+        """test of the columnar element store of a thermal zone"""
+        prj.set_default()
+        helptest.building_test2(prj)
+
+        from teaser.logic.buildingobjects.calculation.element_store import\
+            ElementStore
+
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        for element in therm_zone.outer_walls + therm_zone.windows:
+            element.calc_equivalent_res()
+            element.calc_ua_value()
+
+        store = ElementStore(therm_zone)
+
+        assert store.elements("outer_walls", "windows") == \
+            therm_zone.outer_walls + therm_zone.windows
+        assert len(store.column("area", "outer_walls", "rooftops")) == \
+            len(therm_zone.outer_walls + therm_zone.rooftops)
+        assert store.total("area", "outer_walls") == sum(
+            wall.area for wall in therm_zone.outer_walls)
+        assert store.total_reciprocal("r_inner_conv", "windows") == sum(
+            1 / win.r_inner_conv for win in therm_zone.windows)
+        assert store.total_weighted("ir_emissivity_outer", "outer_walls") == \
+            sum(wall.layer[-1].material.ir_emissivity * wall.area
+                for wall in therm_zone.outer_walls)
+        assert store.total_weighted("g_value", "windows") == sum(
+            win.g_value * win.area for win in therm_zone.windows)
+        assert store.total("area", "outer_walls", "windows") == sum(
+            wall.area for wall in therm_zone.outer_walls) + sum(
+            win.area for win in therm_zone.windows)
+
+    def test_aggregation_engine(self):
+        """test of the aggregation engine shared by the element models"""
+        prj.set_default()
+        helptest.building_test2(prj)
+
+        from teaser.logic.buildingobjects.calculation.aggregation import\
+            AggregationEngine
+        from teaser.logic.buildingobjects.calculation.four_element import\
+            FourElement
+
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+
+        calc_attr = FourElement(therm_zone, merge_windows=False, t_bt=5)
+        assert isinstance(calc_attr, AggregationEngine)
+        calc_attr.calc_attributes()
+        for suffix, walls in (("ow", therm_zone.outer_walls),
+                              ("gf", therm_zone.ground_floors),
+                              ("iw", therm_zone.inner_walls +
+                               therm_zone.floors + therm_zone.ceilings)):
+            emissivity = sum(
+                wall.layer[0].material.ir_emissivity * wall.area
+                for wall in walls) / sum(wall.area for wall in walls)
+            assert abs(getattr(calc_attr, "ir_emissivity_inner_" + suffix) -
+                       emissivity) < 1e-12
+
+        class GroundFloorModel(AggregationEngine):
+            outer_partitions = (
+                ("ow", "outer walls", ("outer_walls", "rooftops"),
+                 ("outer_walls", "rooftops")),
+                ("gf", "ground floors", ("ground_floors",), ()),
+            )
+            facade_groups = ("outer_walls", "rooftops")
+
+        calc_attr = GroundFloorModel(therm_zone, merge_windows=False, t_bt=5)
+        calc_attr.calc_attributes()
+        assert calc_attr.area_gf == sum(
+            gf.area for gf in therm_zone.ground_floors)
+        assert calc_attr.area_ow == sum(
+            wall.area for wall in therm_zone.outer_walls +
+            therm_zone.rooftops)
+        assert calc_attr.r_rest_gf > 0
+        assert round(sum(calc_attr.weightfactor_ow), 12) == 1.0
+
     def test_sum_building_elements_two(self):
         """test of combine_building_elements"""
         prj.set_default()
@@ -2212,6 +2287,30 @@ class Test_teaser(object):
         use_cond.load_use_conditions("Living",
                                      data_class=prj.data)
 
+    def test_use_conditions_index(self):
+        """test of UseConditionsIndex and loading from resolved records"""
+        from teaser.data.dataclass import DataClass
+        from teaser.logic.buildingobjects.boundaryconditions.\
+            boundaryconditions import BoundaryConditions
+
+        data = DataClass(used_statistic=None)
+        record = data.conditions_index.find("Living")
+        assert record is data.conditions_index.find("Living")
+        assert data.conditions_index.find("not a usage") is None
+
+        use_cond = BoundaryConditions()
+        use_cond.load_use_conditions("Living", data_class=data)
+        for attr, value in record:
+            assert getattr(use_cond, attr) == value
+
+        use_cond.profile_persons[0] = 0.123
+        other = BoundaryConditions()
+        other.load_use_conditions("Living", data_class=data)
+        assert other.profile_persons[0] != 0.123
+
+        data.conditions_bind = None
+        assert data.conditions_index.find("Living") is None
+
     def test_save_use_conditions(self):
         """test of save_use_conditions, no parameter checking"""
         import os
@@ -2286,8 +2385,627 @@ class Test_teaser(object):
         therm_zone.inner_walls[0].delete_type_element(data_class=prj.data)
         therm_zone.windows[0].delete_type_element(data_class=prj.data)
 
+    def test_catalog_registry(self):
+        """test of sharing parsed catalogs between DataClass instances"""
+        from teaser.data.dataclass import DataClass, catalog_registry
+
+        data_1 = DataClass(used_statistic='iwu')
+        data_2 = DataClass(used_statistic='iwu')
+        assert data_1.element_bind is data_2.element_bind
+        assert data_1.material_bind is data_2.material_bind
+        assert data_1.conditions_bind is data_2.conditions_bind
+        assert catalog_registry.is_shared(data_1.element_bind)
+
+        data_3 = DataClass(used_statistic='tabula_de')
+        assert data_1.element_bind is not data_3.element_bind
+        assert data_1.material_bind is data_3.material_bind
+
+        own = data_2.own_binding("material_bind")
+        assert own is data_2.material_bind
+        assert own is not data_1.material_bind
+        assert not catalog_registry.is_shared(own)
+        assert data_2.own_binding("material_bind") is own
+        assert len(own.Material) == len(data_1.material_bind.Material)
+
+        data_1.load_tb_binding(shared=False)
+        assert not catalog_registry.is_shared(data_1.element_bind)
+
+    def test_catalog_registry_save(self):
+        """test of saving from DataClass instances sharing a catalog"""
+        import shutil
+        import tempfile
+        from teaser.data.dataclass import DataClass
+        from teaser.logic.buildingobjects.buildingphysics.material import \
+            Material
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, "MaterialTemplates.xml")
+            shutil.copy(prj.data.path_mat, path)
+
+            data_1 = DataClass()
+            data_1.path_mat = path
+            data_1.load_mat_binding()
+            data_2 = DataClass()
+            data_2.path_mat = path
+            data_2.load_mat_binding()
+            assert data_1.material_bind is data_2.material_bind
+
+            mat_1 = Material(parent=None)
+            mat_1.name = "RegistryTest1"
+            mat_1.save_material_template(data_class=data_1)
+            mat_2 = Material(parent=None)
+            mat_2.name = "RegistryTest2"
+            mat_2.save_material_template(data_class=data_2)
+
+            data_3 = DataClass()
+            data_3.path_mat = path
+            data_3.load_mat_binding()
+            assert data_3.material_index.find_name("RegistryTest1") \
+                is not None
+            assert data_3.material_index.find_name("RegistryTest2") \
+                is not None
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_data_class_statistics(self):
+        """test of iwu and TABULA type element catalogs side by side"""
+        from teaser.project import Project
+
+        prj_mixed = Project(load_data=True)
+        data = prj_mixed.data
+        iwu_bind = data.element_bind
+        iwu_index = data.element_index
+        iwu_path = data.path_tb
+
+        tabula_bldg = prj_mixed.add_residential(
+            method='tabula_de',
+            usage='single_family_house',
+            name="TabulaHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3,
+            net_leased_area=150)
+        assert prj_mixed.data is data
+        assert data.used_statistic == 'iwu'
+        assert data.element_bind is iwu_bind
+        assert tabula_bldg.used_statistic == 'tabula_de'
+        tabula_index = data._element_catalog('tabula_de')[0]
+        assert tabula_index is not iwu_index
+
+        iwu_bldg = prj_mixed.add_residential(
+            method='iwu',
+            usage='single_family_dwelling',
+            name="IwuHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3,
+            net_leased_area=150)
+        assert prj_mixed.data is data
+        assert data.element_bind is iwu_bind
+        assert data.element_index is iwu_index
+        assert data.path_tb == iwu_path
+        assert iwu_bldg.used_statistic == 'iwu'
+
+        # buildings retrofit from their own catalog in any order
+        tabula_bldg.retrofit_building(type_of_retrofit='retrofit')
+        assert "retrofit" in tabula_bldg.thermal_zones[0].outer_walls[
+            0].construction_type
+        prj_mixed.retrofit_all_buildings(
+            year_of_retrofit=2015,
+            type_of_retrofit='adv_retrofit')
+        assert "adv_retrofit" in tabula_bldg.thermal_zones[0].outer_walls[
+            0].construction_type
+        assert prj_mixed.data is data
+        assert data.used_statistic == 'iwu'
+        assert data.element_bind is iwu_bind
+        assert data._element_catalog('tabula_de')[0] is tabula_index
+
+    def test_catalog_snapshot(self):
+        """test of on-disk snapshots of the XML catalogs"""
+        import os
+        import shutil
+        import tempfile
+        import teaser.data.catalog as catalog
+        from teaser.data.dataclass import DataClass, CatalogRegistry
+
+        data = DataClass(used_statistic=None)
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "MaterialTemplates.xml")
+            shutil.copy(data.path_mat, path)
+            data.path_mat = path
+            registry = CatalogRegistry()
+            registry.snapshot_dir = os.path.join(temp_dir, "catalogs")
+
+            def parse():
+                raise AssertionError("v0.6 catalogs are read without PyXB")
+
+            records = registry.get(path=path, statistic=None, parse=parse)
+            snapshot = catalog.snapshot_path(registry.snapshot_dir, path)
+            assert catalog.load_snapshot(
+                snapshot, catalog.file_digest(path)) is not None
+
+            binding = data._parse_mat_binding()
+            assert len(records.Material) == len(binding.Material)
+            for record, entry in zip(records.Material, binding.Material):
+                assert record.material_id == entry.material_id
+                assert record.name == entry.name
+                assert record.thermal_conduc == entry.thermal_conduc
+                assert record.thickness_list == entry.thickness_list
+
+            registry.clear()
+            assert registry.get(path=path, statistic=None, parse=parse).\
+                Material[0].name == records.Material[0].name
+
+            with open(path, "a") as xml_file:
+                xml_file.write("\n")
+            assert catalog.load_snapshot(
+                snapshot, catalog.file_digest(path)) is None
+            registry.clear()
+            registry.get(path=path, statistic=None, parse=parse)
+            assert catalog.load_snapshot(
+                snapshot, catalog.file_digest(path)) is not None
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_catalog_xml_records(self):
+        """test of reading v0.6 catalogs without PyXB"""
+        import teaser.data.catalog as catalog
+        from teaser.data.dataclass import DataClass
+
+        def compare(record_xml, record_pyxb):
+            if isinstance(record_pyxb, catalog.Record):
+                assert set(vars(record_xml)) == set(vars(record_pyxb))
+                for name, value in vars(record_pyxb).items():
+                    compare(getattr(record_xml, name), value)
+            elif isinstance(record_pyxb, list):
+                assert len(record_xml) == len(record_pyxb)
+                for item_xml, item_pyxb in zip(record_xml, record_pyxb):
+                    compare(item_xml, item_pyxb)
+            else:
+                assert type(record_xml) == type(record_pyxb)
+                assert record_xml == record_pyxb
+
+        data = DataClass(used_statistic='iwu')
+        compare(catalog.record_from_xml(data.path_tb),
+                catalog.record_from_binding(data._parse_tb_binding()))
+        compare(catalog.record_from_xml(data.path_mat),
+                catalog.record_from_binding(data._parse_mat_binding()))
+        compare(catalog.record_from_xml(data.path_uc),
+                catalog.record_from_binding(data._parse_uc_binding()))
+
+    def test_type_element_index(self):
+        """test of TypeElementIndex against a linear scan"""
+        from teaser.data.dataclass import DataClass
+
+        data = DataClass(used_statistic='tabula_de')
+        index = data.element_index
+        for year in [1200, 1859, 1860, 1999, 2009, 2010, 2011, 2100, 2101]:
+            for construction in ["tabula_standard_1_SFH",
+                                 "tabula_retrofit_1_SFH",
+                                 "tabula_adv_retrofit_1_SFH"]:
+                for element_type in ["OuterWall", "Rooftop", "Window"]:
+                    scan = [
+                        entry for entry in getattr(
+                            data.element_bind, element_type)
+                        if entry.building_age_group[0] <= year <=
+                        entry.building_age_group[1] and
+                        entry.construction_type == construction]
+                    assert index.find(
+                        element_type, construction, year) == scan
+
+        # overlapping building age groups return all matching entries
+        assert len(index.find("OuterWall", "tabula_retrofit_1_SFH",
+                              2010)) == 2
+        assert index.find("OuterWall", "not_existing", 1990) == []
+
+        # entries added one by one give the same index as a rebuild
+        from teaser.data.dataclass import TypeElementIndex
+        import collections
+        import random
+
+        Entry = collections.namedtuple(
+            "Entry", ["construction_type", "building_age_group"])
+        rng = random.Random(3)
+        added = TypeElementIndex(None)
+        entries = []
+        for i in range(200):
+            begin = rng.randint(1900, 2020)
+            entry = Entry("heavy", [begin, begin + rng.randint(0, 30)])
+            entries.append(entry)
+            added.add("OuterWall", entry)
+        rebuilt = TypeElementIndex(collections.namedtuple(
+            "Binding", ["OuterWall"])(entries))
+        for year in range(1895, 2055):
+            assert added.find("OuterWall", "heavy", year) == \
+                rebuilt.find("OuterWall", "heavy", year)
+
+        data.element_bind = None
+        assert data.element_index.find("OuterWall", "heavy", 1990) == []
+
     # methods in Wall
 
+    def test_type_element_prototype(self):
+        """test of loading walls from shared type element prototypes"""
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+        from teaser.logic.buildingobjects.buildingphysics.layer import Layer
+        from teaser.logic.buildingobjects.buildingphysics.material import \
+            Material
+        from teaser.data.dataclass import DataClass
+
+        data = DataClass(used_statistic='iwu')
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = ThermalZone(parent=prj.buildings[-1])
+        wall_1 = OuterWall(parent=therm_zone)
+        wall_1.load_type_element(year=1988, construction="heavy",
+                                 data_class=data)
+        wall_1.area = 10.0
+        wall_2 = OuterWall(parent=therm_zone)
+        wall_2.load_type_element(year=1989, construction="heavy",
+                                 data_class=data)
+        wall_2.area = 25.0
+
+        assert wall_1.prototype is not None
+        assert wall_1.prototype is wall_2.prototype
+        assert wall_1.layer[0] is not wall_2.layer[0]
+        assert wall_1.prototype.fingerprint == \
+            wall_2.gather_layer_fingerprint()
+
+        wall_1.calc_equivalent_res()
+        wall_2.calc_equivalent_res()
+        assert abs(wall_1.prototype.equivalent_res(t_bt=7)[0] -
+                   wall_1.r1 * 10.0) < 1e-12
+        assert abs(wall_1.r1 * 10.0 - wall_2.r1 * 25.0) < 1e-12
+        assert abs(wall_1.c1 / 10.0 - wall_2.c1 / 25.0) < 1e-6
+        assert abs(wall_2.ua_value -
+                   25.0 / (wall_2.r_inner_comb * 25.0 +
+                           sum(layer.thickness /
+                               layer.material.thermal_conduc
+                               for layer in wall_2.layer) +
+                           wall_2.r_outer_comb * 25.0)) < 1e-9
+
+        insulation = Layer(parent=wall_2)
+        insulation.material = Material(parent=insulation)
+        insulation.material.density = 30.0
+        insulation.material.heat_capac = 1.5
+        insulation.material.thermal_conduc = 0.04
+        insulation.thickness = 0.1
+        assert wall_2.prototype.fingerprint != \
+            wall_2.gather_layer_fingerprint()
+        wall_2.calc_equivalent_res()
+        assert abs((wall_2.r1 + wall_2.r2 + wall_2.r3) * 25.0 -
+                   (wall_1.r1 + wall_1.r2 + wall_1.r3) * 10.0 - 2.5) < 1e-9
+
+    def test_shared_materials(self):
+        """test of layers referencing shared immutable materials"""
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+        from teaser.data.dataclass import DataClass
+        import copy
+
+        data = DataClass(used_statistic='iwu')
+        data.shared_materials = True
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = ThermalZone(parent=prj.buildings[-1])
+        wall_1 = OuterWall(parent=therm_zone)
+        wall_1.area = 10.0
+        wall_1.load_type_element(year=1988, construction="heavy",
+                                 data_class=data)
+        wall_2 = OuterWall(parent=therm_zone)
+        wall_2.area = 10.0
+        wall_2.load_type_element(year=1988, construction="heavy",
+                                 data_class=data)
+        wall_3 = OuterWall(parent=therm_zone)
+        wall_3.area = 10.0
+        wall_3.load_type_element(year=1988, construction="heavy",
+                                 data_class=DataClass(used_statistic='iwu'))
+
+        assert wall_1.layer[0]._material.shared is True
+        assert wall_1.layer[0]._material is wall_2.layer[0]._material
+        assert wall_1.layer[0].material.parent is wall_1.layer[0]
+        assert wall_1.gather_layer_fingerprint() == \
+            wall_3.gather_layer_fingerprint()
+        assert abs(wall_1.ua_value - wall_3.ua_value) < 1e-12
+        assert copy.deepcopy(wall_1.layer[0])._material is \
+            wall_1.layer[0]._material
+        try:
+            wall_1.layer[0]._material.density = 1.0
+            assert False, "Shared materials must be read-only"
+        except AttributeError:
+            pass
+
+        wall_1.layer[0].material.thermal_conduc = 0.1
+        assert wall_1.layer[0]._material.shared is False
+        assert wall_1.layer[0].material.thermal_conduc == 0.1
+        assert wall_1.layer[0].material.name == \
+            wall_2.layer[0].material.name
+        assert wall_2.layer[0]._material.shared is True
+        assert wall_2.layer[0].material.thermal_conduc == \
+            wall_3.layer[0].material.thermal_conduc
+        assert wall_1.ua_value < wall_2.ua_value
+
+    def test_slotted_elements(self):
+        """test of building elements, layers and materials without __dict__"""
+        from teaser.logic.buildingobjects.buildingphysics.window import Window
+        from teaser.data.dataclass import DataClass
+        import copy
+        import pickle
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        for element in (therm_zone.outer_walls + therm_zone.inner_walls +
+                        therm_zone.windows + therm_zone.rooftops +
+                        therm_zone.ground_floors):
+            assert not hasattr(element, "__dict__")
+            assert element.parent is therm_zone
+            for layer in element.layer:
+                assert not hasattr(layer, "__dict__")
+                assert not hasattr(layer._material, "__dict__")
+        try:
+            therm_zone.outer_walls[0].unknown_attribute = 1.0
+            assert False, "Building elements must not accept new attributes"
+        except AttributeError:
+            pass
+
+        data = DataClass(used_statistic='iwu')
+        data.shared_materials = True
+        window = Window()
+        window.load_type_element(year=1970,
+                                 construction="Holzfenster, zweifach",
+                                 data_class=data)
+        window_copy = copy.deepcopy(window)
+        assert window_copy.g_value == window.g_value
+        assert window_copy.layer[0]._material is window.layer[0]._material
+        window_pickle = pickle.loads(pickle.dumps(window))
+        assert window_pickle.layer[0]._material.shared is True
+        assert window_pickle.layer[0].material.thermal_conduc == \
+            window.layer[0].material.thermal_conduc
+
+    def test_area_dicts(self):
+        """test of lazy and incremental outer_area and window_area"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        bldg = prj.buildings[-1]
+        therm_zone = bldg.thermal_zones[-1]
+
+        for key, value in bldg.outer_area.items():
+            assert round(value, 6) == round(bldg.get_outer_wall_area(key), 6)
+        for key, value in bldg.window_area.items():
+            assert round(value, 6) == round(bldg.get_window_area(key), 6)
+
+        bldg.outer_area[0.0] = 1234.0
+        bldg.window_area[0.0] = 123.0
+        assert bldg.outer_area[0.0] == 1234.0
+        assert bldg.window_area[0.0] == 123.0
+
+        wall = therm_zone.outer_walls[0]
+        wall.area = wall.area + 10.0
+        wall.orientation = 45.0
+        window = therm_zone.windows[0]
+        window.area = window.area + 1.0
+        window.orientation = 45.0
+        for key, value in bldg.outer_area.items():
+            assert round(value, 6) == round(bldg.get_outer_wall_area(key), 6)
+        for key, value in bldg.window_area.items():
+            assert round(value, 6) == round(bldg.get_window_area(key), 6)
+        assert 45.0 in bldg.outer_area
+        assert 45.0 in bldg.window_area
+
+        therm_zone.outer_walls.remove(wall)
+        bldg.invalidate_area_dicts()
+        therm_zone.windows[0].area = therm_zone.windows[0].area
+        therm_zone.outer_walls[0].area = therm_zone.outer_walls[0].area
+        assert 45.0 not in bldg.outer_area
+        assert round(bldg.window_area[45.0], 6) == \
+            round(bldg.get_window_area(45.0), 6)
+
+        # elements removed from a zone list directly are not summed up
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+        for wall in list(therm_zone.outer_walls):
+            therm_zone.outer_walls.remove(wall)
+        bldg.invalidate_area_dicts()
+        walls = []
+        for area in (10.0, 20.0, 30.0):
+            wall = OuterWall(parent=therm_zone)
+            wall.tilt = 90.0
+            wall.orientation = 0.0
+            wall.area = area
+            walls.append(wall)
+        assert bldg.outer_area[0.0] == 60.0
+        therm_zone.outer_walls.remove(walls[0])
+        walls[1].area = 25.0
+        assert bldg.outer_area[0.0] == 55.0
+
+    def test_bulk_edit(self):
+        """test of bulk_edit for buildings and projects"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        bldg = prj.buildings[-1]
+        therm_zone = bldg.thermal_zones[-1]
+        wall = therm_zone.outer_walls[0]
+        ua_value = wall.ua_value
+        net_leased_area = bldg.net_leased_area
+
+        with bldg.bulk_edit():
+            wall.area = wall.area * 2
+            wall.inner_convection = wall.inner_convection
+            assert wall.ua_value == ua_value
+            with bldg.bulk_edit():
+                therm_zone.area = therm_zone.area + 10.0
+            assert wall.ua_value == ua_value
+            assert bldg.net_leased_area == net_leased_area + 10.0
+        assert round(wall.ua_value, 6) == round(2 * ua_value, 6)
+
+        with prj.bulk_edit():
+            wall.layer[0].thickness = wall.layer[0].thickness
+            wall.area = wall.area / 2
+            assert round(wall.ua_value, 6) == round(2 * ua_value, 6)
+            therm_zone.area = therm_zone.area - 10.0
+        assert round(wall.ua_value, 6) == round(ua_value, 6)
+        assert bldg.net_leased_area == net_leased_area
+
+    def test_element_index(self):
+        """test of the orientation/tilt index of thermal zones"""
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+
+        def scan(elements, orientation, tilt):
+            return [element for element in elements
+                    if element.orientation == orientation and
+                    element.tilt == tilt]
+
+        def check():
+            for element in therm_zone.outer_walls + therm_zone.windows:
+                orientation = element.orientation
+                tilt = element.tilt
+                assert therm_zone.find_walls(orientation, tilt) == \
+                    scan(therm_zone.outer_walls, orientation, tilt)
+                assert therm_zone.find_wins(orientation, tilt) == \
+                    scan(therm_zone.windows, orientation, tilt)
+            for element in therm_zone.rooftops + therm_zone.ground_floors:
+                orientation = element.orientation
+                tilt = element.tilt
+                assert therm_zone.find_rts(orientation, tilt) == \
+                    scan(therm_zone.rooftops, orientation, tilt)
+                assert therm_zone.find_gfs(orientation, tilt) == \
+                    scan(therm_zone.ground_floors, orientation, tilt)
+
+        check()
+        therm_zone.outer_walls[0].orientation = 45.0
+        therm_zone.windows[-1].tilt = 45.0
+        check()
+        therm_zone.outer_walls[-1].orientation = 45.0
+        check()
+        assert therm_zone.find_walls(45.0, 90.0) == \
+            [therm_zone.outer_walls[0], therm_zone.outer_walls[-1]]
+
+        wall = OuterWall(therm_zone)
+        wall.orientation = 45.0
+        check()
+        therm_zone.outer_walls.remove(wall)
+        check()
+        therm_zone.add_element(wall)
+        check()
+        assert therm_zone.find_walls(45.0, 90.0)[-1] is wall
+
+        # direct changes that keep the length of the list
+        removed = therm_zone.outer_walls[0]
+        other = OuterWall()
+        other.tilt = 90.0
+        other.orientation = 180.0
+        therm_zone.outer_walls.remove(removed)
+        therm_zone.outer_walls.append(other)
+        check()
+        assert removed not in therm_zone.find_walls(
+            removed.orientation, removed.tilt)
+        assert other in therm_zone.find_walls(180.0, 90.0)
+        replaced = therm_zone.outer_walls[0]
+        therm_zone.outer_walls[0] = removed
+        check()
+        assert replaced not in therm_zone.find_walls(
+            replaced.orientation, replaced.tilt)
+        assert removed in therm_zone.find_walls(
+            removed.orientation, removed.tilt)
+
+    def test_building_registry(self):
+        """test of the building registry of projects"""
+        from teaser.logic.buildingobjects.building import Building
+
+        prj_reg = Project()
+        bldg_1 = Building(parent=prj_reg, name="Bldg1")
+        bldg_2 = Building(parent=prj_reg, name="Bldg2")
+        bldg_3 = Building(name="Bldg1")
+        assert bldg_3.internal_id is None
+        bldg_3.parent = prj_reg
+        bldg_3.parent = prj_reg
+        assert [bldg.internal_id for bldg in prj_reg.buildings] == [0, 1, 2]
+        assert prj_reg.get_building_by_id(1) is bldg_2
+        assert prj_reg.get_buildings_by_name("Bldg1") == [bldg_1, bldg_3]
+
+        bldg_1.name = "Bldg3"
+        assert prj_reg.get_buildings_by_name("Bldg1") == [bldg_3]
+        assert prj_reg.get_buildings_by_name("Bldg3") == [bldg_1]
+
+        prj_reg.buildings.remove(bldg_2)
+        assert prj_reg.get_building_by_id(1) is None
+        bldg_4 = Building(parent=prj_reg)
+        assert bldg_4.internal_id == 3
+        assert prj_reg.get_building_by_id(3) is bldg_4
+
+        bldg_5 = Building(name="Bldg5")
+        prj_reg.buildings[0] = bldg_5
+        assert prj_reg.get_buildings_by_name("Bldg3") == []
+        assert prj_reg.get_buildings_by_name("Bldg5") == [bldg_5]
+        assert prj_reg.get_building_by_id(bldg_5.internal_id) is bldg_5
+        assert prj_reg.get_building_by_id(0) is None
+        assert len(set(bldg.internal_id for bldg in prj_reg.buildings)) == 3
+
+        prj_reg.set_default()
+        assert Building(parent=prj_reg).internal_id == 0
+
+    def test_clone_building(self):
+        """test of Building.clone and Project.replicate"""
+        prj.set_default(load_data=True)
+        prj.add_residential(
+            method='iwu',
+            usage='single_family_dwelling',
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200.0)
+        bldg = prj.buildings[-1]
+
+        clone = bldg.clone()
+        assert clone.parent is prj
+        assert clone.name == bldg.name
+        assert clone.internal_id != bldg.internal_id
+        clone.calc_building_parameter(
+            number_of_elements=2,
+            merge_windows=False,
+            used_library='AixLib')
+        assert round(clone.sum_heat_load, 4) == round(bldg.sum_heat_load, 4)
+        zone = bldg.thermal_zones[0]
+        zone_clone = clone.thermal_zones[0]
+        assert zone_clone is not zone
+        assert zone_clone.use_conditions is not zone.use_conditions
+        assert zone_clone.use_conditions.persons == zone.use_conditions.persons
+        assert zone_clone.outer_walls[0] is not zone.outer_walls[0]
+        assert zone_clone.outer_walls[0].layer[0] is not \
+            zone.outer_walls[0].layer[0]
+        assert zone_clone.outer_walls[0].layer[0].material is not \
+            zone.outer_walls[0].layer[0].material
+        assert zone_clone.outer_walls[0].layer[0].material.thermal_conduc == \
+            zone.outer_walls[0].layer[0].material.thermal_conduc
+        assert zone_clone.model_attr.ua_value_ow == \
+            zone.model_attr.ua_value_ow
+
+        clones = prj.replicate(
+            bldg, ["Copy1", "Copy2"], net_leased_areas=[400.0, 200.0],
+            rotations=[None, 90.0])
+        assert prj.buildings[-2:] == clones
+        assert [bldg_copy.name for bldg_copy in clones] == ["Copy1", "Copy2"]
+        assert clones[0].net_leased_area == 400.0
+        assert clones[0].volume == 2 * bldg.volume
+        assert clones[0].thermal_zones[0].area == 2 * zone.area
+        assert clones[0].outer_area[0.0] == 2 * bldg.outer_area[0.0]
+        assert clones[0].window_area[90.0] == 2 * bldg.window_area[90.0]
+        assert clones[1].outer_area[90.0] == bldg.outer_area[0.0]
+        assert clones[1].outer_area[-1] == bldg.outer_area[-1]
+        assert clones[1].thermal_zones[0].rooftops[0].orientation == -1
+
     def test_calc_equivalent_res_wall(self):
         """test of calc_equivalent_res, wall"""
         prj.set_default()
@@ -2305,6 +3023,114 @@ class Test_teaser(object):
         assert round(therm_zone.outer_walls[0].r3, 12) == 0.137027879186
         assert round(therm_zone.outer_walls[0].c1_korr, 6) == 111237.213205
 
+    def test_calc_equivalent_res_batch(self):
+        """test of the batched calc_equivalent_res for many walls"""
+        from teaser.logic.buildingobjects.calculation import equivalent_res
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        therm_zone.inner_walls[0].load_type_element(
+            year=1950, construction="light")
+        walls = (therm_zone.outer_walls + therm_zone.rooftops +
+                 therm_zone.ground_floors + therm_zone.inner_walls)
+        assert len(set(len(wall.layer) for wall in walls)) > 1
+
+        single = []
+        for wall in walls:
+            wall.calc_equivalent_res()
+            single.append((wall.r1, wall.r2, wall.r3, wall.c1, wall.c2,
+                           wall.c1_korr))
+
+        equivalent_res.calc_equivalent_res(walls)
+        for wall, values in zip(walls, single):
+            batched = (wall.r1, wall.r2, wall.r3, wall.c1, wall.c2,
+                       wall.c1_korr)
+            for value_single, value_batched in zip(values, batched):
+                assert abs(value_single - value_batched) <= \
+                    1e-12 * abs(value_single)
+
+        assert equivalent_res.calc_equivalent_res_per_area([]) == []
+        assert round(therm_zone.outer_walls[0].r1, 13) == 0.0330465078788
+        assert round(therm_zone.outer_walls[0].c1, 6) == 111237.213205
+
+    def test_equivalent_res_cache(self):
+        """test of the construction cache of calc_equivalent_res"""
+        from teaser.logic.buildingobjects.calculation import equivalent_res
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        wall = therm_zone.outer_walls[0]
+        clone = wall.copy(parent=therm_zone)
+        clone.area = 2 * wall.area
+
+        equivalent_res.clear_cache()
+        equivalent_res.calc_equivalent_res([wall, clone])
+        assert len(equivalent_res._construction_cache) == 1
+        assert abs(clone.r1 * 2 - wall.r1) < 1e-15
+        assert abs(clone.c1 - wall.c1 * 2) < 1e-8
+        assert round(wall.r1, 13) == 0.0330465078788
+        assert round(wall.c1, 6) == 111237.213205
+
+        clone.layer[0].material.thermal_conduc *= 2
+        clone.calc_equivalent_res()
+        assert len(equivalent_res._construction_cache) == 2
+        assert clone.r1 * 2 < wall.r1
+
+        window = therm_zone.windows[0]
+        window.calc_equivalent_res()
+        assert len(equivalent_res._construction_cache) == 3
+        window.calc_equivalent_res()
+        assert len(equivalent_res._construction_cache) == 3
+        assert round(window.r1, 3) == 0.072
+
+        # the least recently used construction is removed from a full cache
+        max_cache_size = equivalent_res.max_cache_size
+        equivalent_res.max_cache_size = 3
+        try:
+            wall.calc_equivalent_res()
+            clone.calc_equivalent_res()
+            clone.layer[0].material.thermal_conduc *= 2
+            equivalent_res.calc_equivalent_res([wall, clone])
+            assert len(equivalent_res._construction_cache) == 3
+            assert equivalent_res.cached_per_area(
+                window.gather_layer_fingerprint(), None) is None
+            assert equivalent_res.cached_per_area(
+                wall.gather_layer_fingerprint(), 7) is not None
+            assert round(wall.r1, 13) == 0.0330465078788
+        finally:
+            equivalent_res.max_cache_size = max_cache_size
+
+        equivalent_res.clear_cache()
+        assert len(equivalent_res._construction_cache) == 0
+
+    def test_calc_parallel_connection(self):
+        """test of the parallel connection of walls (VDI 6007 eq. 23, 24)"""
+        from teaser.logic.buildingobjects.calculation import equivalent_res
+
+        omega = 2 * math.pi / 86400 / 5
+        r1_list = [0.0012, 0.035, 0.0007, 0.21]
+        c1_list = [4.1e6, 2.3e5, 9.8e6, 1.2e4]
+
+        r1 = r1_list[0]
+        c1 = c1_list[0]
+        for r1_wall, c1_wall in zip(r1_list[1:], c1_list[1:]):
+            r1, c1 = (
+                (r1 * c1 ** 2 + r1_wall * c1_wall ** 2 + omega ** 2 * r1 *
+                 r1_wall * (r1 + r1_wall) * c1 ** 2 * c1_wall ** 2) /
+                ((c1 + c1_wall) ** 2 + omega ** 2 * (r1 + r1_wall) ** 2 *
+                 c1 ** 2 * c1_wall ** 2),
+                ((c1 + c1_wall) ** 2 + omega ** 2 * (r1 + r1_wall) ** 2 *
+                 c1 ** 2 * c1_wall ** 2) /
+                (c1 + c1_wall + omega ** 2 * (r1 ** 2 * c1 + r1_wall ** 2 *
+                                              c1_wall) * c1 * c1_wall))
+
+        r1_par, c1_par = equivalent_res.calc_parallel_connection(
+            r1_list, c1_list, omega)
+        assert abs(r1_par - r1) <= 1e-12 * r1
+        assert abs(c1_par - c1) <= 1e-12 * c1
+
     def test_insulate_wall(self):
         """test of insulate_wall"""
         therm_zone = prj.buildings[-1].thermal_zones[-1]
@@ -2388,6 +3214,285 @@ class Test_teaser(object):
 
         mat.save_material_template(data_class=dat)
 
+    def test_material_index(self):
+        """test of MaterialIndex lookups by material_id and name"""
+        from teaser.logic.buildingobjects.buildingphysics.material import \
+            Material
+        from teaser.data.dataclass import DataClass
+
+        dat = DataClass()
+        for entry in dat.material_bind.Material[:20]:
+            assert dat.material_index.find_id(
+                entry.material_id).material_id == entry.material_id
+            assert dat.material_index.find_name(entry.name).name == \
+                entry.name
+        assert dat.material_index.find_id("not_existing") is None
+        assert dat.material_index.find_name("not_existing") is None
+
+        mat = Material(parent=None)
+        mat.load_material_template(mat_name='EPS_040_15',
+                                   data_class=dat)
+        assert mat.name == 'EPS_040_15'
+        assert mat.thermal_conduc == 0.04
+
+        import teaser.data.input.material_input as material_input
+        mat_id = Material(parent=None)
+        material_input.load_material_id(mat_id, mat.material_id, dat)
+        assert mat_id.name == 'EPS_040_15'
+        assert mat_id.thermal_conduc == mat.thermal_conduc
+
+    def test_catalog_database(self):
+        """test of reading and saving catalogs with a CatalogDatabase"""
+        from teaser.logic.buildingobjects.boundaryconditions.\
+            boundaryconditions import BoundaryConditions
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+        from teaser.logic.buildingobjects.buildingphysics.material import \
+            Material
+        from teaser.data.catalogdb import CatalogDatabase
+        from teaser.data.dataclass import DataClass
+
+        path = os.path.join(utilities.get_default_path(), "CatalogUT.db")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        xml_data = DataClass()
+        catalog_db = CatalogDatabase(path)
+        catalog_db.import_data_class(xml_data)
+        dat = DataClass(catalog_db=path)
+
+        assert dat.element_bind.version == xml_data.element_bind.version
+        for year in (1900, 1960, 1995, 2020):
+            assert [entry.building_age_group for entry in
+                    dat.element_index.find("OuterWall", "heavy", year)] == \
+                [entry.building_age_group for entry in
+                 xml_data.element_index.find("OuterWall", "heavy", year)]
+        mat = Material(parent=None)
+        mat.load_material_template(mat_name='EPS_040_15', data_class=dat)
+        assert mat.thermal_conduc == 0.04
+        use_cond = BoundaryConditions()
+        use_cond.load_use_conditions("Living", data_class=dat)
+        use_cond_xml = BoundaryConditions()
+        use_cond_xml.load_use_conditions("Living", data_class=xml_data)
+        assert use_cond.persons == use_cond_xml.persons
+
+        wall = OuterWall()
+        wall.load_type_element(year=1960, construction="heavy",
+                               data_class=dat)
+        wall.construction_type = "database_test"
+        wall.save_type_element(data_class=dat)
+        assert len(dat.element_index.find(
+            "OuterWall", "database_test", 1960)) == 1
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            wall.save_type_element(data_class=dat)
+        assert len(caught) == 1
+        assert len(CatalogDatabase(path).find_type_elements(
+            "iwu", "OuterWall", "database_test", 1960)) == 1
+        wall.delete_type_element(data_class=dat)
+        assert dat.element_index.find(
+            "OuterWall", "database_test", 1960) == []
+
+        mat.name = "DatabaseTest"
+        mat.save_material_template(data_class=dat)
+        mat.density = 42.0
+        mat.modify_material_template(data_class=dat)
+        assert dat.material_index.find_name("DatabaseTest").density == 42.0
+        assert xml_data.material_index.find_name("DatabaseTest") is None
+
+        use_cond.usage = "DatabaseTest"
+        use_cond.save_use_conditions(data_class=dat)
+        use_cond_db = BoundaryConditions()
+        use_cond_db.load_use_conditions("DatabaseTest", data_class=dat)
+        assert use_cond_db.persons == use_cond.persons
+        catalog_db.close()
+
+    def test_catalog_batch(self):
+        """test of saving many type elements in one batch"""
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+        from teaser.data.dataclass import DataClass
+
+        path = os.path.join(utilities.get_default_path(), "BatchUT.xml")
+        if os.path.exists(path):
+            os.remove(path)
+        dat = DataClass()
+        dat.path_tb = path
+        dat.load_tb_binding()
+
+        wall = OuterWall()
+        wall.load_type_element(year=1960, construction="heavy",
+                               data_class=DataClass())
+        with dat.batch():
+            for number in range(20):
+                wall.construction_type = "batch_" + str(number)
+                wall.save_type_element(data_class=dat)
+                with dat.batch():
+                    wall.save_type_element(data_class=dat)
+            assert dat._batch is not None
+            assert os.path.getsize(path) == 0
+            assert len(dat.element_index.find(
+                "OuterWall", "batch_7", 1960)) == 1
+        assert dat._batch is None
+        assert len(dat.element_bind.OuterWall) == 20
+
+        dat_file = DataClass()
+        dat_file.path_tb = path
+        dat_file.load_tb_binding()
+        assert len(dat_file.element_bind.OuterWall) == 20
+
+        try:
+            with dat.batch():
+                wall.delete_type_element(data_class=dat)
+                wall.construction_type = "batch_rollback"
+                wall.save_type_element(data_class=dat)
+                raise RuntimeError("roll back")
+        except RuntimeError:
+            pass
+        assert len(dat.element_bind.OuterWall) == 20
+        assert dat.element_index.find(
+            "OuterWall", "batch_rollback", 1960) == []
+        assert len(dat.element_index.find(
+            "OuterWall", "batch_19", 1960)) == 1
+
+    def test_lazy_imports(self):
+        """test that importing Project loads no exporters or bindings"""
+        import subprocess
+        import sys
+
+        script = (
+            "import sys\n"
+            "import teaser.project\n"
+            "for name in sorted(sys.modules):\n"
+            "    print(name)\n")
+        output = subprocess.check_output(
+            [sys.executable, "-c", script],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        modules = set(output.decode("utf-8").split())
+
+        assert "teaser.project" in modules
+        for name in (
+                "teaser.data.bindings.opengis",
+                "teaser.data.bindings.v_0_6.project_bind",
+                "teaser.data.input.teaserxml_input",
+                "teaser.data.output.teaserxml_output",
+                "teaser.data.output.citygml_output",
+                "teaser.data.output.aixlib_output",
+                "teaser.logic.archetypebuildings.bmvbs.office",
+                "teaser.logic.archetypebuildings.tabula.de.singlefamilyhouse",
+                "scipy.io",
+                "mako"):
+            assert name not in modules, name
+
+    def test_output_path(self):
+        """test of the configurable output path"""
+        import shutil
+        import subprocess
+        import sys
+        import tempfile
+
+        cwd = os.getcwd()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            home = os.path.join(temp_dir, "home")
+            env = dict(os.environ, HOME=home, USERPROFILE=home)
+            env.pop(utilities.OUTPUT_PATH_VARIABLE, None)
+            subprocess.check_call(
+                [sys.executable, "-c", "import teaser.project"],
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(
+                    __file__))),
+                env=env)
+            assert not os.path.exists(home)
+
+            env_path = os.path.join(temp_dir, "env")
+            old_value = os.environ.get(utilities.OUTPUT_PATH_VARIABLE)
+            os.environ[utilities.OUTPUT_PATH_VARIABLE] = env_path
+            try:
+                assert utilities.get_default_path() == env_path
+                prj_env = Project()
+                assert prj_env.output_path == env_path
+            finally:
+                if old_value is None:
+                    del os.environ[utilities.OUTPUT_PATH_VARIABLE]
+                else:
+                    os.environ[utilities.OUTPUT_PATH_VARIABLE] = old_value
+            assert prj_env.output_path == utilities.get_default_path()
+
+            out_path = os.path.join(temp_dir, "scratch", "teaser")
+            prj_out = Project(load_data=True, output_path=out_path)
+            assert prj_out.output_path == out_path
+            assert not os.path.exists(out_path)
+            prj_out.name = "OutputPath"
+            prj_out.save_project()
+            assert os.path.isfile(
+                os.path.join(out_path, "OutputPath.teaserXML"))
+            assert not os.path.exists(env_path)
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(temp_dir)
+
+    def test_parallel_export(self):
+        """test of exports running in several threads at once"""
+        import shutil
+        import tempfile
+        import threading
+
+        cwd = os.getcwd()
+        temp_dir = tempfile.mkdtemp()
+        try:
+            projects = []
+            for number, library in enumerate(
+                    ["AixLib", "IBPSA", "AixLib", "IBPSA"]):
+                prj_thread = Project(
+                    load_data=True,
+                    output_path=os.path.join(temp_dir, str(number)))
+                prj_thread.name = "Parallel" + str(number)
+                prj_thread.used_library_calc = library
+                prj_thread.add_residential(
+                    method='iwu',
+                    usage='single_family_dwelling',
+                    name="ParallelBuilding",
+                    year_of_construction=1988,
+                    number_of_floors=2,
+                    height_of_floors=3.2,
+                    net_leased_area=219)
+                projects.append(prj_thread)
+
+            errors = []
+
+            def export(prj_thread):
+                try:
+                    if prj_thread.used_library_calc == "AixLib":
+                        prj_thread.export_aixlib()
+                    else:
+                        prj_thread.export_ibpsa()
+                    prj_thread.export_parameters_txt()
+                except Exception as error:
+                    errors.append(error)
+
+            threads = [threading.Thread(target=export, args=(prj_thread,))
+                       for prj_thread in projects]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert errors == []
+            assert os.getcwd() == cwd
+            for prj_thread in projects:
+                prj_path = os.path.join(
+                    prj_thread.output_path, prj_thread.name)
+                assert os.path.isfile(os.path.join(prj_path, "package.mo"))
+                assert os.path.isfile(os.path.join(
+                    prj_path, "ParallelBuilding", "package.mo"))
+                assert os.path.isfile(os.path.join(
+                    prj_path,
+                    "ParallelBuilding_txtOutput",
+                    "ParallelBuilding.txt"))
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(temp_dir)
+
     def test_properties_project(self):
         """Tests properties of project class"""
         prj.number_of_elements_calc